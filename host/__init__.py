@@ -0,0 +1 @@
+"""Host (CPython) simulation of the HeartWave Pico hardware, see host/README.md."""
@@ -0,0 +1,39 @@
+"""
+Frame cost of every screen scenario in host/screens.py: how many frames were shown, pixels and bytes changed,
+bytes sent over I2C with the modelled transfer time at 400 kHz, and host time of a forced view.refresh().
+
+    python host/bench_frames.py [screen names...]
+
+The I2C time is the real bottleneck on the device: the SSD1306 driver always sends the whole 1 KB buffer.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import screens
+
+
+def main(argv):
+    names = argv or list(screens.SCREENS)
+    print("{:<26}{:>7}{:>10}{:>10}{:>10}{:>9}{:>9}".format(
+        "screen", "frames", "px/frame", "B/frame", "I2C B", "I2C ms", "host us"))
+    for name in names:
+        sim = screens.render(name)
+        frames = sim.display.frames
+        count = len(frames)
+        if count == 0:
+            print("{:<26}{:>7}".format(name, 0))
+            continue
+        pixels = sum(f.changed_pixels for f in frames) / count
+        changed = sum(f.changed_bytes for f in frames) / count
+        transferred = sum(f.transferred_bytes for f in frames)
+        i2c_ms = sum(f.i2c_us for f in frames) / 1000
+        refresh_us = sim.time_refresh() if name != "power_on" else 0
+        print("{:<26}{:>7}{:>10.1f}{:>10.1f}{:>10}{:>9.1f}{:>9}".format(
+            name, count, pixels, changed, transferred, i2c_ms, refresh_us))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""
+RAM saved by loading states on demand, and the first entry cost of each state, on the simulated board.
+
+    python3 host/bench_states.py
+
+Boots once as the device does (only the main menu state loaded), then loads the rest as preload_states() did,
+and prints the import and creation time and the RAM kept by each state, from StateMachine.get_load_stats().
+The RAM is what tracemalloc sees in CPython, much more than MicroPython needs: compare states with each other.
+"""
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import env
+
+HOST_HEAP = 256 * 1024 * 1024
+
+
+def main():
+    flash_dir = tempfile.mkdtemp(prefix="hwp_flash_")
+    try:
+        env.install(fake_clock=False, flash_dir=flash_dir)
+        env.HEAP_TOTAL = HOST_HEAP
+        tracemalloc.start()
+        from src.boot import boot
+        state_machine = boot(power_on_animation=False)
+        gc.collect()
+        lazy = tracemalloc.get_traced_memory()[0]
+        state_machine.max_states = None  # keep all, as preload_states() at boot did
+        state_machine.preload_states()
+        gc.collect()
+        preloaded = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print("{:<22}{:>10}{:>10}".format("state", "first ms", "RAM KB"))
+        for name, us, used in state_machine.get_load_stats():
+            print("{:<22}{:>10.2f}{:>10.1f}".format(name, us / 1000, used / 1024))
+        print("after boot: {:.1f} KB, all states loaded: {:.1f} KB, saved: {:.1f} KB".format(
+            lazy / 1024, preloaded / 1024, (preloaded - lazy) / 1024))
+    finally:
+        os.chdir(env.REPO_ROOT)
+        shutil.rmtree(flash_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
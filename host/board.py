@@ -0,0 +1,101 @@
+"""
+The simulated board: clock, pins, ADC, RTC, Wi-Fi/MQTT availability and the displays.
+
+The shims in host/lib (machine, piotimer, ssd1306, network, umqtt) read and write this object,
+scripts drive the device through it, e.g. board.press(), board.rotate(1), board.advance_ms(4).
+"""
+import math
+
+
+class Board:
+    ENCODER_CLK_PIN = 10
+    ENCODER_DT_PIN = 11
+    ENCODER_BTN_PIN = 12
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.pin_values = {}  # pin id: value, unset pins read 1 (pulled up)
+        self.pin_handlers = {}  # pin id: irq handler
+        self.adc_source = None  # callable(t_us) -> 16-bit value, None reads as no finger
+        self.rtc_datetime = (2024, 5, 1, 2, 10, 0, 0, 0)  # (year, month, day, weekday, hour, minute, second, subsec)
+        self.wifi_available = False
+        self.wifi_connect_delay_ms = 1500
+        self.mqtt_available = False
+        self.mqtt_messages = []  # (topic, message) published while mqtt is available
+        self.http_handler = None  # callable(method, url, kwargs) -> (status, json), None means no network
+        self.displays = []
+        self.keep_frames = False  # displays created from now on keep a copy of every shown frame
+
+    # time
+
+    def advance_ms(self, ms):
+        self.clock.advance_us(int(ms * 1000))
+
+    # encoder
+
+    def press(self):
+        """Press the encoder button. Time is moved past the debounce window first in fake mode."""
+        if self.clock.fake:
+            self.advance_ms(60)
+        self._fire(self.ENCODER_BTN_PIN)
+
+    def rotate(self, steps):
+        """Rotate the encoder by 'steps' detents, positive is clockwise."""
+        self.pin_values[self.ENCODER_CLK_PIN] = 1 if steps > 0 else 0
+        for _ in range(abs(steps)):
+            self._fire(self.ENCODER_DT_PIN)
+
+    def _fire(self, pin_id):
+        handler = self.pin_handlers.get(pin_id)
+        if handler is not None:
+            handler(pin_id)
+
+    # sensor
+
+    def adc_read(self, pin_id):
+        if self.adc_source is None:
+            return 65535  # no finger on the sensor reads high
+        return int(self.adc_source(self.clock.now_us())) & 0xFFFF
+
+    @staticmethod
+    def ppg_wave(bpm=72, baseline=30000, amplitude=12000):
+        """Synthetic PPG: a sharp systolic peak and a small dicrotic notch per beat."""
+        period_us = 60000000 / bpm
+
+        def source(t_us):
+            phase = (t_us % period_us) / period_us
+            value = math.exp(-((phase - 0.15) / 0.05) ** 2) + 0.3 * math.exp(-((phase - 0.45) / 0.08) ** 2)
+            return baseline + amplitude * value
+
+        return source
+
+    def finger_on(self, bpm=72):
+        self.adc_source = self.ppg_wave(bpm)
+
+    def finger_off(self):
+        self.adc_source = None
+
+    def play_recording(self, samples, sampling_rate):
+        """Feed the samples of a PPG recording (src/ppg_recorder.py, 14-bit) to the sensor from now on,
+        the last sample is held at the end."""
+        start_us = self.clock.now_us()
+        period_us = 1000000 / sampling_rate
+
+        def source(t_us):
+            index = min(int((t_us - start_us) / period_us), len(samples) - 1)
+            return samples[index] << 2
+
+        self.adc_source = source
+
+    # rtc
+
+    def get_rtc_datetime(self):
+        """RTC runs from rtc_datetime along the clock."""
+        year, month, day, weekday, hour, minute, second, subsec = self.rtc_datetime
+        total = second + minute * 60 + hour * 3600 + self.clock.now_us() // 1000000
+        day += total // 86400
+        total %= 86400
+        return year, month, day, weekday, total // 3600, total // 60 % 60, total % 60, subsec
+
+
+board = None  # the active board, set by host.env.install()
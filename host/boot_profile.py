@@ -0,0 +1,44 @@
+"""
+Boot profile on the host: runs the staged boot of src/boot.py on the simulated board and prints the report
+it writes to flash, the same phases Settings -> Debug Info shows on the device.
+
+    python3 host/boot_profile.py           # real clock: host time of imports and initialisation
+    python3 host/boot_profile.py --fake    # fake clock: animation frames take the modelled I2C time
+
+Free RAM is the simulated heap minus what tracemalloc sees allocated. CPython objects are much bigger
+than MicroPython ones, so the heap is made big enough here, and the RAM in use after each phase is printed
+next to it: compare the phases with each other, not with the device.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import env
+
+HOST_HEAP = 256 * 1024 * 1024
+
+
+def main(argv):
+    flash_dir = tempfile.mkdtemp(prefix="hwp_flash_")
+    try:
+        env.install(fake_clock="--fake" in argv, flash_dir=flash_dir)
+        env.HEAP_TOTAL = HOST_HEAP
+        tracemalloc.start()
+        from src.boot import boot, load_report
+        boot()
+        tracemalloc.stop()
+        print("{:<24}{:>10}{:>12}{:>12}".format("phase", "ms", "free KB", "used KB"))
+        for name, us, free in load_report():
+            print("{:<24}{:>10.1f}{:>12.1f}{:>12.1f}".format(name, us / 1000, free / 1024, (HOST_HEAP - free) / 1024))
+    finally:
+        os.chdir(env.REPO_ROOT)
+        shutil.rmtree(flash_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""
+Microsecond clock behind time.ticks_* on host, with periodic timers standing in for hardware timer interrupts.
+
+- real mode follows time.perf_counter().
+- fake mode only moves by advance_us() and sleep, i.e. per simulated step, so what a screen shows doesn't depend on
+  how many times the firmware reads the clock. Only a busy-wait loop like "while ticks_diff(ticks_ms(), start) < 1000"
+  reads it SPIN_READS times in a row without an advance, then it moves by SPIN_STEP_US per read, so it terminates.
+Due timers fire whenever the clock is read or advanced, like an interrupt between two statements.
+"""
+import time
+
+
+class _Timer:
+    def __init__(self, period_us, callback, next_us):
+        self.period_us = period_us
+        self.callback = callback
+        self.next_us = next_us
+
+
+SPIN_READS = 10000
+SPIN_STEP_US = 100
+
+
+class Clock:
+    def __init__(self, fake=False):
+        self.fake = fake
+        self._start = time.perf_counter()
+        self._fake_us = 0
+        self._reads = 0  # reads since the last advance, see SPIN_READS
+        self._timers = []
+        self._firing = False
+
+    def now_us(self):
+        if self.fake:
+            self._reads += 1
+            if self._reads > SPIN_READS:
+                self._fake_us += SPIN_STEP_US  # busy-waiting
+            now = self._fake_us
+        else:
+            now = int((time.perf_counter() - self._start) * 1000000)
+        self._fire_due(now)
+        return now
+
+    def advance_us(self, us):
+        """Move time forward, firing due timers in order. In real mode, this sleeps."""
+        if not self.fake:
+            time.sleep(us / 1000000)
+            self.now_us()
+            return
+        self._reads = 0
+        end = self._fake_us + us
+        while self._timers:
+            next_timer = min(self._timers, key=lambda t: t.next_us)
+            if next_timer.next_us > end:
+                break
+            self._fake_us = next_timer.next_us
+            self._fire_due(self._fake_us)
+        self._fake_us = end
+        self._fire_due(end)
+
+    def add_timer(self, period_us, callback):
+        timer = _Timer(period_us, callback, self._peek_us() + period_us)
+        self._timers.append(timer)
+        return timer
+
+    def remove_timer(self, timer):
+        if timer in self._timers:
+            self._timers.remove(timer)
+
+    def next_timer_us(self):
+        """Time of the next due timer, None if there is no timer."""
+        if not self._timers:
+            return None
+        return min(t.next_us for t in self._timers)
+
+    def _peek_us(self):
+        if self.fake:
+            return self._fake_us
+        return int((time.perf_counter() - self._start) * 1000000)
+
+    def _fire_due(self, now):
+        if self._firing:
+            return  # a callback reading the clock must not re-enter
+        self._firing = True
+        try:
+            for timer in list(self._timers):
+                while timer in self._timers and timer.next_us <= now:
+                    timer.next_us += timer.period_us
+                    timer.callback(timer)
+        finally:
+            self._firing = False
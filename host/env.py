@@ -0,0 +1,78 @@
+"""
+Set up CPython to run the firmware in src/ against the simulated board.
+
+    from host import env
+    board = env.install(fake_clock=True)
+    from src.state_machine import StateMachine  # import firmware modules only after install()
+
+install() puts host/lib (framebuf, machine, ssd1306, ...) on sys.path, adds the MicroPython extensions of the
+time and gc modules, and makes 'flash_dir' the working directory, which is the flash root of the device,
+with src/ linked and config.json copied into it like install.sh does.
+"""
+import gc
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST_LIB = os.path.join(REPO_ROOT, "host", "lib")
+
+HEAP_TOTAL = 192 * 1024  # roughly the free heap of MicroPython on Pico W after boot
+HEAP_ALLOC = 48 * 1024  # reported as allocated when tracemalloc is not tracing, keeps screens deterministic
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from host import board as board_module
+from host.board import Board
+from host.clock import Clock
+
+
+def install(fake_clock=True, flash_dir=None):
+    """Create a new board and clock and make them the active ones. Can be called again to start over."""
+    if HOST_LIB not in sys.path:
+        sys.path.insert(0, HOST_LIB)
+    clock = Clock(fake=fake_clock)
+    board = Board(clock)
+    board_module.board = board
+    _patch_time(clock)
+    _patch_gc()
+    if flash_dir is not None:
+        _setup_flash(flash_dir)
+    return board
+
+
+def _setup_flash(flash_dir):
+    """Lay out the flash as install.sh does: src/ and config.json in the root, which is the working directory."""
+    os.makedirs(flash_dir, exist_ok=True)
+    src_link = os.path.join(flash_dir, "src")
+    if not os.path.exists(src_link):
+        os.symlink(os.path.join(REPO_ROOT, "src"), src_link)
+    config = os.path.join(flash_dir, "config.json")
+    if not os.path.exists(config):
+        with open(os.path.join(REPO_ROOT, "config.json")) as src, open(config, "w") as dst:
+            dst.write(src.read())
+    os.chdir(flash_dir)
+
+
+def _patch_time(clock):
+    time.ticks_us = lambda: clock.now_us()
+    time.ticks_ms = lambda: clock.now_us() // 1000
+    time.ticks_cpu = time.ticks_us
+    time.ticks_diff = lambda new, old: new - old
+    time.ticks_add = lambda ticks, delta: ticks + delta
+    time.sleep_ms = lambda ms: clock.advance_us(int(ms * 1000))
+    time.sleep_us = lambda us: clock.advance_us(int(us))
+
+
+def _mem_alloc():
+    import tracemalloc
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return HEAP_ALLOC
+
+
+def _patch_gc():
+    gc.mem_alloc = _mem_alloc
+    gc.mem_free = lambda: max(0, HEAP_TOTAL - _mem_alloc())
+    gc.threshold = lambda *args: None
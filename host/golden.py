@@ -0,0 +1,58 @@
+"""
+Golden-image check of every screen in host/screens.py.
+
+    python host/golden.py            # render all screens and compare with host/golden/*.pbm
+    python host/golden.py --update   # accept the current rendering as golden
+    python host/golden.py menu_hr    # only the given screens
+
+Mismatching screens are written to host/out/<name>.png (current) and <name>.golden.png, the exit code is 1.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import screens
+from host.env import REPO_ROOT
+from host.image import write_pbm, read_pbm, write_png, to_rows, from_rows, diff_count
+
+GOLDEN_DIR = os.path.join(REPO_ROOT, "host", "golden")
+OUT_DIR = os.path.join(REPO_ROOT, "host", "out")
+
+
+def main(argv):
+    update = "--update" in argv
+    names = [a for a in argv if not a.startswith("--")] or list(screens.SCREENS)
+    failed = []
+    for name in names:
+        sim = screens.render(name)
+        frame = sim.frame()
+        width, height = sim.display.width, sim.display.height
+        golden_path = os.path.join(GOLDEN_DIR, name + ".pbm")
+        if update:
+            write_pbm(golden_path, frame, width, height)
+            print("updated", name)
+            continue
+        if not os.path.exists(golden_path):
+            print("MISSING", name)
+            failed.append(name)
+            continue
+        golden_width, golden_height, golden_rows = read_pbm(golden_path)
+        diff = diff_count(to_rows(frame, width, height), golden_rows)
+        if diff == 0:
+            print("ok", name)
+            continue
+        print("DIFF", name, "size differs" if diff < 0 else "{} pixels".format(diff))
+        failed.append(name)
+        os.makedirs(OUT_DIR, exist_ok=True)
+        write_png(os.path.join(OUT_DIR, name + ".png"), frame, width, height)
+        golden = from_rows(golden_rows, golden_width, golden_height)
+        write_png(os.path.join(OUT_DIR, name + ".golden.png"), golden, golden_width, golden_height)
+    if failed:
+        print("{} of {} screens failed: {}".format(len(failed), len(names), ", ".join(failed)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,145 @@
+"""
+Check that the asyncio runtime (src/runtime.py) idles: on the fake clock, the event loop's waits move the clock
+forward instead of sleeping, so the share of time spent waiting and the number of loop wake-ups are exact.
+
+- menu: a few seconds on the main menu with no input, the loop should wake up only a few times per second.
+- input: rotate and press on the menu, the ui task must run within WAKE_LIMIT_US of the encoder interrupt.
+- measure: HR measurement, the sensor task runs every 20 ms and the graph is redrawn, the loop still waits
+  between two of them.
+Exits with 1 if a check fails.
+
+    python3 host/idle_check.py
+"""
+import asyncio
+import os
+import selectors
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import env
+
+WAKE_LIMIT_US = 2000
+MENU_IDLE_MIN = 0.95  # share of time waiting on the menu
+MENU_WAKEUPS_MAX = 20  # loop wake-ups per second on the menu
+MEASURE_IDLE_MIN = 0.4  # the graph frames block on the I2C transfer, the simulated ssd1306 counts it as busy
+
+
+class _FakeSelector(selectors.DefaultSelector):
+    """Waits by moving the fake clock, which also fires the board's timers (sensor sampling) on the way."""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+        self.idle_us = 0
+        self.wakeups = 0
+
+    def select(self, timeout=None):
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            raise RuntimeError("event loop waits forever, no task has a deadline")
+        us = max(1, int(timeout * 1000000))
+        self.clock.advance_us(us)
+        self.idle_us += us
+        self.wakeups += 1
+        return []
+
+
+class _FakeClockLoop(asyncio.SelectorEventLoop):
+    def __init__(self, clock):
+        self.selector = _FakeSelector(clock)
+        super().__init__(self.selector)
+        self._clock = clock
+
+    def time(self):
+        return self._clock._peek_us() / 1000000
+
+
+class _Phase:
+    def __init__(self, selector, clock):
+        self._selector = selector
+        self._clock = clock
+        self._start = (selector.idle_us, selector.wakeups, clock._peek_us())
+
+    def result(self):
+        idle_us, wakeups, start_us = self._start
+        elapsed = self._clock._peek_us() - start_us
+        return (self._selector.idle_us - idle_us) / elapsed, (self._selector.wakeups - wakeups) * 1000000 / elapsed
+
+
+async def script(board, sm, runtime, selector, results):
+    from src.runtime import sleep_ms
+    await sleep_ms(500)  # boot screen settles
+    phase = _Phase(selector, board.clock)
+    await sleep_ms(5000)
+    results["menu"] = phase.result()
+
+    wake_stats = runtime._stats[4]
+    wake_stats.count = wake_stats.max_us = wake_stats.total_us = 0
+    for steps in (1, 1, -1, -1):
+        board.rotate(steps)
+        await sleep_ms(300)
+    results["wake"] = (wake_stats.count, wake_stats.max_us)
+
+    board.rotate(-5)  # HR measure
+    await sleep_ms(300)
+    board.press()
+    await sleep_ms(300)
+    board.finger_on(bpm=72)
+    board.press()  # start without waiting for the finger threshold
+    await sleep_ms(1000)
+    phase = _Phase(selector, board.clock)
+    await sleep_ms(5000)
+    results["measure"] = phase.result()
+    board.finger_off()
+    board.press()
+    await sleep_ms(300)
+    runtime.stop()
+
+
+def main():
+    flash_dir = tempfile.mkdtemp(prefix="hwp_flash_")
+    results = {}
+    try:
+        board = env.install(fake_clock=True, flash_dir=flash_dir)
+        from src.boot import boot
+        from src.runtime import Runtime
+        sm = boot(power_on_animation=False)
+        runtime = Runtime(sm)
+        loop = _FakeClockLoop(board.clock)
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(runtime._main(None, [script(board, sm, runtime, loop.selector, results)]))
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+    finally:
+        os.chdir(env.REPO_ROOT)
+        shutil.rmtree(flash_dir, ignore_errors=True)
+
+    failed = []
+    idle, wakeups = results["menu"]
+    print("menu:    {:5.1f} % waiting, {:5.1f} wake-ups/s".format(idle * 100, wakeups))
+    if idle < MENU_IDLE_MIN or wakeups > MENU_WAKEUPS_MAX:
+        failed.append("menu")
+    count, max_us = results["wake"]
+    print("input:   {} encoder wake-ups, max {} us".format(count, max_us))
+    if count == 0 or max_us > WAKE_LIMIT_US:
+        failed.append("input")
+    idle, wakeups = results["measure"]
+    print("measure: {:5.1f} % waiting, {:5.1f} wake-ups/s".format(idle * 100, wakeups))
+    if idle < MEASURE_IDLE_MIN:
+        failed.append("measure")
+    if failed:
+        print("FAILED:", ", ".join(failed))
+        return 1
+    print("ok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Write 1-bit MONO_VLSB frames as PBM or PNG, and compare them, without third-party packages."""
+import struct
+import zlib
+
+
+def to_rows(buffer, width, height):
+    """MONO_VLSB buffer to a list of rows of 0/1 pixels."""
+    return [[(buffer[(y >> 3) * width + x] >> (y & 7)) & 1 for x in range(width)] for y in range(height)]
+
+
+def from_rows(rows, width, height):
+    """List of rows of 0/1 pixels to a MONO_VLSB buffer."""
+    buffer = bytearray(width * ((height + 7) // 8))
+    for y in range(height):
+        for x in range(width):
+            if rows[y][x]:
+                buffer[(y >> 3) * width + x] |= 1 << (y & 7)
+    return buffer
+
+
+def write_pbm(path, buffer, width, height):
+    """Binary PBM (P4), 1 is a lit pixel, rows packed MSB first."""
+    data = bytearray()
+    for row in to_rows(buffer, width, height):
+        for x in range(0, width, 8):
+            byte = 0
+            for bit, p in enumerate(row[x:x + 8]):
+                byte |= p << (7 - bit)
+            data.append(byte)
+    with open(path, "wb") as file:
+        file.write("P4\n{} {}\n".format(width, height).encode() + bytes(data))
+
+
+def read_pbm(path):
+    """Return (width, height, rows) of a binary PBM (P4) written by write_pbm."""
+    with open(path, "rb") as file:
+        content = file.read()
+    magic, size, data = content.split(b"\n", 2)
+    if magic != b"P4":
+        raise ValueError("only binary PBM (P4) is supported")
+    width, height = [int(v) for v in size.split()]
+    row_bytes = (width + 7) // 8
+    rows = []
+    for y in range(height):
+        line = data[y * row_bytes:(y + 1) * row_bytes]
+        rows.append([(line[x >> 3] >> (7 - (x & 7))) & 1 for x in range(width)])
+    return width, height, rows
+
+
+def write_png(path, buffer, width, height, scale=4):
+    """Grayscale PNG, lit pixels white as on the OLED, scaled up for viewing."""
+    rows = to_rows(buffer, width, height)
+    raw = bytearray()
+    for row in rows:
+        line = bytearray()
+        for p in row:
+            line.extend((b"\xff" if p else b"\x00") * scale)
+        for _ in range(scale):
+            raw.append(0)  # filter type: none
+            raw.extend(line)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width * scale, height * scale, 8, 0, 0, 0, 0)
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(bytes(raw))) +
+                   chunk(b"IEND", b""))
+
+
+def diff_count(rows_a, rows_b):
+    """Number of differing pixels, or -1 if sizes differ."""
+    if len(rows_a) != len(rows_b) or any(len(a) != len(b) for a, b in zip(rows_a, rows_b)):
+        return -1
+    return sum(pa != pb for a, b in zip(rows_a, rows_b) for pa, pb in zip(a, b))
@@ -0,0 +1,188 @@
+"""
+Host implementation of MicroPython's framebuf module, in pure Python.
+
+Only the MONO_VLSB format is supported, which is the format of SSD1306 and all bitmaps in src/res.
+The built-in 8x8 font is a transcription of the firmware font, text should look the same as on the device,
+but golden images are only compared against images rendered by this module, never against device photos.
+"""
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+# 8x8 font for chars 32-127, 8 column bytes per char, LSB is the top pixel
+_FONT = bytes.fromhex(
+    "0000000000000000" "0000004f4f000000" "0007070000070700" "147f7f14147f7f14"
+    "00242e6b6b3a1200" "006333180c666300" "00327f4d4d777250" "0000000406030100"
+    "00001c3e63410000" "000041633e1c0000" "082a3e1c1c3e2a08" "0008083e3e080800"
+    "000080e060000000" "0008080808080800" "0000006060000000" "00406030180c0602"
+    "003e7f49457f3e00" "0040447f7f404000" "00627351494f4600" "00226349497f3600"
+    "00181814167f7f10" "00276745457d3900" "003e7f49497b3200" "000303797d070300"
+    "00367f49497f3600" "00266f49497f3e00" "0000002424000000" "000080e464000000"
+    "00081c3663414100" "0014141414141400" "00414163361c0800" "00020351590f0600"
+    "003e7f414d4f2e00" "007c7e0b0b7e7c00" "007f7f49497f3600" "003e7f4141632200"
+    "007f7f41633e1c00" "007f7f4949414100" "007f7f0909010100" "003e7f41497b3a00"
+    "007f7f08087f7f00" "0000417f7f410000" "002060417f3f0100" "007f7f1c36634100"
+    "007f7f4040404000" "007f7f060c067f7f" "007f7f0e1c7f7f00" "003e7f41417f3e00"
+    "007f7f09090f0600" "001e3f21617f5e00" "007f7f19396f4600" "00266f49497b3200"
+    "0001017f7f010100" "003f7f40407f3f00" "001f3f60603f1f00" "007f7f3018307f7f"
+    "0063771c1c776300" "00070f78780f0700" "006171594d474300" "00007f7f41410000"
+    "0002060c18306040" "000041417f7f0000" "00080c06060c0800" "c0c0c0c0c0c0c0c0"
+    "0000010306040000" "00207454547c7800" "007f7f44447c3800" "00387c44446c2800"
+    "00387c44447f7f00" "00387c54545c5800" "00087e7f09030200" "0098bca4a4fc7c00"
+    "007f7f04047c7800" "0000007d7d000000" "0040c08080fd7d00" "007f7f30386c4400"
+    "0000417f7f400000" "007c7c18381c7c78" "007c7c04047c7800" "00387c44447c3800"
+    "00fcfc24243c1800" "00183c2424fcfc00" "007c7c04040c0800" "00485c5454742400"
+    "0004043e7e444400" "003c7c40407c7c00" "001c3c60603c1c00" "001c7c7038707c1c"
+    "00446c38386c4400" "009cbca0e07c3c00" "004464745c4c4400" "0008083e77414100"
+    "000000ffff000000" "004141773e080800" "0002030103020301" "ff818181818181ff"
+)
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format=MONO_VLSB, stride=None):
+        if format != MONO_VLSB:
+            raise ValueError("only MONO_VLSB is supported on host")
+        if len(buffer) < width * ((height + 7) // 8):
+            raise ValueError("buffer too small")
+        self.buffer = buffer
+        self._w = width
+        self._h = height
+        self._stride = width if stride is None else stride
+
+    # pixel access
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return None
+        index = (y >> 3) * self._stride + x
+        bit = 1 << (y & 7)
+        if c is None:
+            return 1 if self.buffer[index] & bit else 0
+        if c:
+            self.buffer[index] |= bit
+        else:
+            self.buffer[index] &= ~bit & 0xFF
+
+    def _set(self, x, y, c):
+        # no bounds check, callers clip first
+        index = (y >> 3) * self._stride + x
+        if c:
+            self.buffer[index] |= 1 << (y & 7)
+        else:
+            self.buffer[index] &= ~(1 << (y & 7)) & 0xFF
+
+    # shapes
+
+    def fill(self, c):
+        value = 0xFF if c else 0x00
+        for i in range(self._stride * ((self._h + 7) // 8)):
+            self.buffer[i] = value
+
+    def fill_rect(self, x, y, w, h, c):
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self._w), min(y + h, self._h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        # Bresenham, same as the firmware
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def poly(self, x, y, coords, c, f=False):
+        points = [(x + coords[i], y + coords[i + 1]) for i in range(0, len(coords), 2)]
+        if not points:
+            return
+        if f:
+            # scanline fill between edge crossings
+            y_min = min(p[1] for p in points)
+            y_max = max(p[1] for p in points)
+            for row in range(y_min, y_max + 1):
+                nodes = []
+                for i in range(len(points)):
+                    (px1, py1), (px2, py2) = points[i - 1], points[i]
+                    if (py1 <= row < py2) or (py2 <= row < py1):
+                        nodes.append(px1 + (row - py1) * (px2 - px1) // (py2 - py1))
+                nodes.sort()
+                for i in range(0, len(nodes) - 1, 2):
+                    self.hline(nodes[i], row, nodes[i + 1] - nodes[i] + 1, c)
+        for i in range(len(points)):
+            (px1, py1), (px2, py2) = points[i - 1], points[i]
+            self.line(px1, py1, px2, py2, c)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0xF):
+        # quadrant mask m is ignored, the whole ellipse is drawn
+        def inside(dx, dy):
+            return dx * dx * yr * yr + dy * dy * xr * xr <= xr * xr * yr * yr
+
+        for dy in range(-yr, yr + 1):
+            for dx in range(-xr, xr + 1):
+                if not inside(dx, dy):
+                    continue
+                if f or not (inside(dx - 1, dy) and inside(dx + 1, dy) and
+                             inside(dx, dy - 1) and inside(dx, dy + 1)):
+                    self.pixel(x + dx, y + dy, c)
+
+    # text and blit
+
+    def text(self, s, x, y, c=1):
+        for char in str(s):
+            code = ord(char)
+            if code < 32 or code > 127:
+                code = 127
+            glyph = _FONT[(code - 32) * 8:(code - 32) * 8 + 8]
+            for col in range(8):
+                bits = glyph[col]
+                for row in range(8):
+                    if bits & (1 << row):
+                        self.pixel(x + col, y + row, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for yy in range(fbuf._h):
+            ty = y + yy
+            if not 0 <= ty < self._h:
+                continue
+            for xx in range(fbuf._w):
+                tx = x + xx
+                if not 0 <= tx < self._w:
+                    continue
+                c = fbuf.pixel(xx, yy)
+                if c != key:
+                    self._set(tx, ty, c)
+
+    def scroll(self, xstep, ystep):
+        old = bytes(self.buffer)
+        src = FrameBuffer(bytearray(old), self._w, self._h, MONO_VLSB, self._stride)
+        self.blit(src, xstep, ystep)
@@ -0,0 +1,75 @@
+"""Host stand-in of the machine module, backed by host.board."""
+from host import board as _board_module
+
+
+def _board():
+    return _board_module.board
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=IN, pull=None, value=None):
+        self.id = id
+        if value is not None:
+            _board().pin_values[id] = value
+
+    def value(self, value=None):
+        if value is None:
+            return _board().pin_values.get(self.id, 1)
+        _board().pin_values[self.id] = value
+
+    def irq(self, handler=None, trigger=IRQ_RISING, hard=False):
+        if handler is None:
+            _board().pin_handlers.pop(self.id, None)
+        else:
+            _board().pin_handlers[self.id] = lambda pin_id: handler(self)
+
+
+class ADC:
+    def __init__(self, pin):
+        self._pin_id = pin.id if isinstance(pin, Pin) else pin
+
+    def read_u16(self):
+        return _board().adc_read(self._pin_id)
+
+
+class I2C:
+    def __init__(self, id, scl=None, sda=None, freq=400000):
+        self.freq = freq
+
+    def writeto(self, addr, buf, stop=True):
+        return len(buf)
+
+    def writevto(self, addr, vector, stop=True):
+        pass
+
+
+class RTC:
+    def datetime(self, value=None):
+        if value is not None:
+            _board().rtc_datetime = tuple(value)
+            return None
+        return _board().get_rtc_datetime()
+
+
+def freq(hz=None):
+    return 125000000
+
+
+def lightsleep(ms=None):
+    if ms is not None:
+        _board().clock.advance_us(ms * 1000)
+
+
+def idle():
+    pass
+
+
+def reset():
+    raise SystemExit("machine.reset()")
@@ -0,0 +1,34 @@
+"""Host stand-in of the network module, Wi-Fi connects after a delay if board.wifi_available."""
+from host import board as _board_module
+
+STA_IF = 0
+AP_IF = 1
+
+
+class WLAN:
+    def __init__(self, interface=STA_IF):
+        self._active = False
+        self._connect_time_us = None
+
+    def active(self, value=None):
+        if value is None:
+            return self._active
+        self._active = value
+
+    def connect(self, ssid=None, password=None):
+        board = _board_module.board
+        if board.wifi_available:
+            self._connect_time_us = board.clock.now_us() + board.wifi_connect_delay_ms * 1000
+
+    def disconnect(self):
+        self._connect_time_us = None
+
+    def isconnected(self):
+        if self._connect_time_us is None:
+            return False
+        return _board_module.board.clock.now_us() >= self._connect_time_us
+
+    def ifconfig(self):
+        if self.isconnected():
+            return "192.168.1.50", "255.255.255.0", "192.168.1.1", "192.168.1.1"
+        return "0.0.0.0", "0.0.0.0", "0.0.0.0", "0.0.0.0"
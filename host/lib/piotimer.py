@@ -0,0 +1,19 @@
+"""Host stand-in of pico-lib piotimer, the callback runs from the host clock."""
+from host import board as _board_module
+
+
+class Piotimer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=0, mode=PERIODIC, period=-1, freq=-1, callback=None):
+        period_us = int(period * 1000) if period > 0 else 1000000 // freq
+        self._clock = _board_module.board.clock
+        self._callback = callback
+        self._timer = self._clock.add_timer(period_us, self._fire)
+
+    def _fire(self, timer):
+        self._callback(self)
+
+    def deinit(self):
+        self._clock.remove_timer(self._timer)
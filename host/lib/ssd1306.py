@@ -0,0 +1,77 @@
+"""
+Host stand-in of the SSD1306 driver: a framebuf.FrameBuffer whose show() records the frame instead of sending it.
+
+With the fake clock, show() takes the modelled I2C time, as the real driver blocks for the whole transfer.
+For every show() it keeps FrameStats: pixels and bytes changed since the last shown frame,
+bytes the real driver would transfer over I2C, the modelled I2C time, and the host time of the call.
+"""
+import time
+import framebuf
+from host import board as _board_module
+
+# the MicroPython driver sends 6 commands (2 bytes each) then the whole buffer after 1 control byte
+_COMMAND_BYTES = 6 * 2
+_I2C_BITS_PER_BYTE = 9  # 8 data bits plus ACK
+
+
+class FrameStats:
+    def __init__(self, index, changed_pixels, changed_bytes, transferred_bytes, i2c_us, host_us):
+        self.index = index
+        self.changed_pixels = changed_pixels
+        self.changed_bytes = changed_bytes  # what a dirty-page driver would need to send
+        self.transferred_bytes = transferred_bytes
+        self.i2c_us = i2c_us
+        self.host_us = host_us
+
+
+class SSD1306_I2C(framebuf.FrameBuffer):
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
+        self.width = width
+        self.height = height
+        self.buffer = bytearray(width * height // 8)
+        self._i2c_freq = getattr(i2c, "freq", 400000)
+        super().__init__(self.buffer, width, height, framebuf.MONO_VLSB)
+        self.shown = bytes(len(self.buffer))  # the frame on the "glass"
+        self.frames = []  # FrameStats of every show()
+        self.keep_frames = _board_module.board.keep_frames  # also keep a copy of every shown buffer in shown_frames
+        self.shown_frames = []
+        _board_module.board.displays.append(self)
+
+    def show(self):
+        start = time.perf_counter()
+        current = bytes(self.buffer)
+        changed_bytes = 0
+        changed_pixels = 0
+        for old, new in zip(self.shown, current):
+            if old != new:
+                changed_bytes += 1
+                changed_pixels += bin(old ^ new).count("1")
+        transferred = _COMMAND_BYTES + 1 + len(current)
+        i2c_us = transferred * _I2C_BITS_PER_BYTE * 1000000 // self._i2c_freq
+        self.shown = current
+        if self.keep_frames:
+            self.shown_frames.append(current)
+        host_us = int((time.perf_counter() - start) * 1000000)
+        clock = _board_module.board.clock
+        if clock.fake:
+            clock.advance_us(i2c_us)  # the transfer blocks the CPU on the device, timers keep firing
+        self.frames.append(FrameStats(len(self.frames), changed_pixels, changed_bytes, transferred, i2c_us, host_us))
+
+    def reset_stats(self):
+        self.frames = []
+        self.shown_frames = []
+
+    def poweron(self):
+        pass
+
+    def poweroff(self):
+        pass
+
+    def contrast(self, contrast):
+        pass
+
+    def invert(self, invert):
+        pass
+
+    def rotate(self, rotate):
+        pass
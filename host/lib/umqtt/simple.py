@@ -0,0 +1,22 @@
+"""Host stand-in of umqtt.simple, messages are recorded in board.mqtt_messages if board.mqtt_available."""
+from host import board as _board_module
+
+
+class MQTTClient:
+    def __init__(self, client_id, server, port=0, user=None, password=None, keepalive=0, ssl=False):
+        self.server = server
+        self._connected = False
+
+    def connect(self, clean_session=True):
+        if not _board_module.board.mqtt_available:
+            raise OSError("MQTT broker not reachable")
+        self._connected = True
+        return 0
+
+    def disconnect(self):
+        self._connected = False
+
+    def publish(self, topic, msg, retain=False, qos=0):
+        if not (self._connected and _board_module.board.mqtt_available):
+            raise OSError("MQTT not connected")
+        _board_module.board.mqtt_messages.append((topic, msg))
@@ -0,0 +1,32 @@
+"""Host stand-in of urequests, requests go to board.http_handler, or fail as if there is no network."""
+import json as _json
+from host import board as _board_module
+
+
+class Response:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self._data = data
+        self.text = _json.dumps(data)
+
+    def json(self):
+        return self._data
+
+    def close(self):
+        pass
+
+
+def request(method, url, **kwargs):
+    handler = _board_module.board.http_handler
+    if handler is None:
+        raise OSError("no network on host")
+    status, data = handler(method, url, kwargs)
+    return Response(status, data)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
@@ -0,0 +1,58 @@
+"""
+Analyse the saved sessions of a device again with the calculate_hrv() of this tree, from their IBI series.
+
+    mpremote cp -r :Saved_Values .                           # the history of the device
+    python3 host/reanalyse.py Saved_Values [sessions.csv]
+
+Works on a copy of the directory, the history given is not changed. Prints the saved and the new HR, RMSSD and SDNN
+of each session, newest first, and writes them with the IBIs to the CSV file if given.
+Sessions are streamed one at a time as on the device, see src/reanalysis.py.
+"""
+import csv
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import env
+
+
+def main(argv):
+    if not argv or not os.path.isdir(argv[0]):
+        print(__doc__)
+        return 2
+    flash_dir = tempfile.mkdtemp(prefix="hwp_flash_")
+    try:
+        shutil.copytree(argv[0], os.path.join(flash_dir, "Saved_Values"))
+        env.install(fake_clock=False, flash_dir=flash_dir)
+        from src.utils import load_settings, format_datetime
+        from src.record import format_hundredths
+        from src.save_system import check_home_dir, load_ibi
+        from src.reanalysis import reanalysis_steps
+        load_settings("config.json")
+        check_home_dir()
+        rows = []
+        print("{:<18}{:>8}{:>8}{:>9}{:>9}{:>9}{:>9}{:>6}".format(
+            "time", "HR", "new", "RMSSD", "new", "SDNN", "new", "IBIs"))
+        for record_id, saved, result in reanalysis_steps():
+            ibi = load_ibi(record_id)
+            row = [format_datetime(saved.timestamp)] + [format_hundredths(value) for value in (
+                saved.hr, result.hr, saved.rmssd, result.rmssd, saved.sdnn, result.sdnn)] + [len(ibi)]
+            print("{:<18}{:>8}{:>8}{:>9}{:>9}{:>9}{:>9}{:>6}".format(*row))
+            rows.append(row + [" ".join(str(value) for value in ibi)])
+        print("{} sessions".format(len(rows)))
+        if len(argv) > 1:
+            with open(argv[1], "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["time", "hr", "new_hr", "rmssd", "new_rmssd", "sdnn", "new_sdnn", "count", "ibi"])
+                writer.writerows(rows)
+    finally:
+        os.chdir(env.REPO_ROOT)
+        shutil.rmtree(flash_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
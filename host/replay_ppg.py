@@ -0,0 +1,77 @@
+"""
+Replay a raw PPG recording of the device (src/ppg_recorder.py) through the IBICalculator of this tree, to tune the peak
+detection on real waveforms.
+
+    mpremote cp :Recordings/00000001.ppg .                  # a recording of the device
+    python3 host/replay_ppg.py 00000001.ppg [samples.csv]
+
+Prints the blocks and drops of the recording, the IBIs found and the HR and HRV of calculate_hrv().
+The samples are fed to the sensor fifo 5 at a time, as the sensor task takes them every 20 ms on the device.
+Writes the samples with their time and the IBIs found to the CSV file if given.
+Board.play_recording() plays a recording to the simulated sensor instead, to run the firmware on it.
+"""
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import env
+
+CHUNK = 5
+
+
+def main(argv):
+    if not argv or not os.path.isfile(argv[0]):
+        print(__doc__)
+        return 2
+    env.install(fake_clock=False)
+    from src.ppg_recorder import read_header, read_blocks
+    from src.data_structure import Fifo
+    from src.data_processing import IBICalculator, calculate_hrv
+    from src.utils import format_datetime
+    with open(argv[0], "rb") as file:
+        rate, start_time, block_samples = read_header(file)
+        samples = []
+        blocks = dropped = 0
+        for sequence, block_dropped, block in read_blocks(file):
+            if sequence != blocks:
+                print("block {} missing".format(blocks))
+                break
+            if block_dropped:
+                print("block {}: {} samples dropped".format(sequence, block_dropped))
+            samples.extend(block)
+            blocks += 1
+            dropped += block_dropped
+    print("{}: {} Hz, {} blocks of {}, {} samples ({:.1f} s), {} dropped".format(
+        format_datetime(start_time), rate, blocks, block_samples, len(samples), len(samples) / rate, dropped))
+
+    sensor_fifo = Fifo(100, 'H')
+    calculator = IBICalculator(sensor_fifo, rate)
+    ibi_list = []
+    ibi_at = []  # index of the sample when each IBI came out
+    for start in range(0, len(samples), CHUNK):
+        for value in samples[start:start + CHUNK]:
+            sensor_fifo.put(value)
+        calculator.run()
+        while calculator.ibi_fifo.has_data():
+            ibi_list.append(calculator.ibi_fifo.get())
+            ibi_at.append(min(start + CHUNK, len(samples)) - 1)
+    print("{} IBIs: {}".format(len(ibi_list), " ".join(str(ibi) for ibi in ibi_list)))
+    if len(ibi_list) >= 2:
+        try:
+            print("HR {} BPM, IBI {} ms, RMSSD {} ms, SDNN {} ms".format(*calculate_hrv(ibi_list)))
+        except ZeroDivisionError:
+            print("too few IBIs left after the outlier filter")
+    if len(argv) > 1:
+        ibi_by_index = dict(zip(ibi_at, ibi_list))
+        with open(argv[1], "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["ms", "sample", "ibi"])
+            for index, value in enumerate(samples):
+                writer.writerow([index * 1000 // rate, value, ibi_by_index.get(index, "")])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Run the firmware on the asyncio runtime (src/runtime.py) under CPython asyncio, on the simulated board with the
+real clock: boot, measure HR for a few seconds, connect MQTT in settings (fails, no broker), back to the menu.
+Prints what each step showed and the scheduling latency of each task.
+
+    python3 host/run_async.py [seconds of HR measurement, default 8]
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host import env
+
+
+async def script(board, sm, runtime, measure_s):
+    from src.runtime import sleep_ms
+    await sleep_ms(200)
+    board.rotate(-5)  # HR measure
+    await sleep_ms(100)
+    board.press()
+    await sleep_ms(200)
+    board.finger_on(bpm=72)
+    board.press()  # start without waiting for the finger threshold
+    await sleep_ms(measure_s * 1000)
+    print("HR measure shows:", sm.view.select_by_id("number_hr")._shown.strip(), "BPM")
+    board.finger_off()
+    board.press()  # back to menu
+    await sleep_ms(200)
+    board.rotate(5)  # settings
+    await sleep_ms(100)
+    board.press()
+    await sleep_ms(200)
+    board.rotate(4)  # MQTT
+    await sleep_ms(100)
+    board.press()
+    await sleep_ms(500)
+    texts = [view._text for view in sm.view._active_views.values() if view.type == "text"]
+    print("MQTT screen shows:", ", ".join(texts))
+    runtime.stop()
+
+
+def main(argv):
+    measure_s = int(argv[0]) if argv else 8
+    flash_dir = tempfile.mkdtemp(prefix="hwp_flash_")
+    try:
+        board = env.install(fake_clock=False, flash_dir=flash_dir)
+        from src.boot import boot
+        from src.runtime import Runtime
+        sm = boot(power_on_animation=False)
+        runtime = Runtime(sm)
+        runtime.run(None, script(board, sm, runtime, measure_s))
+        print("frames shown: {}, merged: {}, dropped: {}".format(*sm.display.get_refresh_stats()[2:]))
+        print("{:<10}{:>10}{:>10}{:>10}".format("task", "wake-ups", "late us", "max us"))
+        for name, count, average_us, max_us in runtime.get_latency_stats():
+            print("{:<10}{:>10}{:>10}{:>10}".format(name, count, average_us, max_us))
+    finally:
+        os.chdir(env.REPO_ROOT)
+        shutil.rmtree(flash_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
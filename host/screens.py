@@ -0,0 +1,184 @@
+"""
+Scenarios that bring the device to each screen from a fresh boot, used by golden.py and bench_frames.py.
+
+Every scenario gets a new board with a fake clock and an empty flash directory, so the result is deterministic.
+"""
+import shutil
+import tempfile
+from host import env
+from host.sim import Simulator
+
+# IBI series of a calm 30 s measurement, used where a scenario needs an analysis result
+SAMPLE_IBI = [812, 798, 830, 845, 820, 790, 776, 801, 829, 850, 838, 812, 795, 780, 803, 826, 841, 833, 809, 792,
+              785, 806, 822, 839, 828, 807, 794, 788, 810, 831, 844, 826, 800, 786, 797]
+
+
+def new_simulator(flash_dir):
+    board = env.install(fake_clock=True, flash_dir=flash_dir)
+    from src.state_machine import StateMachine  # after install(), firmware imports need the host modules
+    from src.save_system import check_home_dir
+    state_machine = StateMachine()
+    check_home_dir()
+    return Simulator(board, state_machine)
+
+
+def boot(sim, selection=0):
+    """Go to main menu and select an item, the menu remembers the last selection, so rotate to the top first."""
+    sim.sm.set(state_code=sim.sm.STATE_MENU)
+    sim.run(50)
+    sim.rotate(-5)
+    if selection:
+        sim.rotate(selection)
+
+
+def menu(selection):
+    def scenario(sim):
+        boot(sim, selection)
+    return scenario
+
+
+def measure_wait(selection):
+    def scenario(sim):
+        boot(sim, selection)
+        sim.press()
+    return scenario
+
+
+def measure(selection, seconds):
+    def scenario(sim):
+        measure_wait(selection)(sim)
+        sim.board.finger_on(bpm=72)
+        sim.press()  # start without waiting for the finger threshold
+        sim.run(seconds * 1000, step_ms=4)
+    return scenario
+
+
+def result_check_fail(sim):
+    measure_wait(1)(sim)
+    sim.sm.view.remove_by_id("text_put_finger1")
+    sim.sm.view.remove_by_id("text_put_finger2")
+    sim.sm.set(state_code=sim.sm.STATE_MEASURE_RESULT_CHECK, args=[[800, 810]])
+    sim.run(50)
+
+
+def hrv_result(sim):
+    measure_wait(1)(sim)
+    sim.sm.view.remove_by_id("text_put_finger1")
+    sim.sm.view.remove_by_id("text_put_finger2")
+    sim.sm.set(state_code=sim.sm.STATE_HRV_ANALYSIS, args=[list(SAMPLE_IBI)])
+    sim.run(50)
+
+
+def kubios_failed(sim):
+    measure_wait(2)(sim)
+    sim.sm.view.remove_by_id("text_put_finger1")
+    sim.sm.view.remove_by_id("text_put_finger2")
+    sim.sm.set(state_code=sim.sm.STATE_KUBIOS_ANALYSIS, args=[list(SAMPLE_IBI)])
+    sim.run(50)
+
+
+def history(saved, open_first=False):
+    def scenario(sim):
+        for _ in range(saved):
+            hrv_result(sim)
+            sim.press()  # back to menu
+            sim.board.advance_ms(60000)  # one result per minute, unique file names
+        boot(sim, 3)
+        sim.press()
+        if open_first:
+            sim.rotate(3)  # after Back, Trends and Go to date
+            sim.press()
+    return scenario
+
+
+def record_ppg(sim):
+    boot(sim, 4)
+    sim.board.finger_on(bpm=72)
+    sim.press()
+    sim.run(6000, step_ms=4)
+
+
+def history_trends(sim):
+    history(3)(sim)
+    sim.rotate(1)
+    sim.press()
+
+
+def history_jump(sim):
+    history(3)(sim)
+    sim.rotate(2)
+    sim.press()
+    sim.press()  # year
+    sim.rotate(-1)  # month: April, before the results
+    sim.press()
+
+
+def settings(selection):
+    def scenario(sim):
+        boot(sim, 5)
+        sim.press()
+        if selection:
+            sim.rotate(selection)
+            sim.press()
+    return scenario
+
+
+def settings_wifi_connecting(sim):
+    settings(3)(sim)
+    sim.run(1500, step_ms=5)
+
+
+def settings_wifi_connected(sim):
+    sim.board.wifi_available = True
+    settings(3)(sim)
+    sim.run(3000, step_ms=5)
+
+
+def power_on(sim):
+    from src.res.animation_power_on import PowerOnAnimation
+    PowerOnAnimation().play()
+    sim.display = sim.board.displays[-1]  # the animation drives its own Display instance
+
+
+# name: scenario, Settings -> Debug Info is left out, it shows free storage of the host disk
+SCREENS = {
+    "power_on": power_on,
+    "menu_hr": menu(0),
+    "menu_hrv": menu(1),
+    "menu_kubios": menu(2),
+    "menu_history": menu(3),
+    "menu_record": menu(4),
+    "menu_settings": menu(5),
+    "measure_wait_hr": measure_wait(0),
+    "measure_wait_hrv": measure_wait(1),
+    "measure_wait_kubios": measure_wait(2),
+    "measure_hr": measure(0, 8),
+    "measure_hrv": measure(1, 8),
+    "result_check_fail": result_check_fail,
+    "hrv_result": hrv_result,
+    "kubios_failed": kubios_failed,
+    "history_empty": history(0),
+    "history_list": history(3),
+    "history_result": history(1, open_first=True),
+    "history_trends": history_trends,
+    "history_jump": history_jump,
+    "record_ppg": record_ppg,
+    "settings": settings(0),
+    "settings_about": settings(1),
+    "settings_wifi_connecting": settings_wifi_connecting,
+    "settings_wifi_connected": settings_wifi_connected,
+    "settings_mqtt_failed": settings(4),
+}
+
+
+def render(name, keep_frames=False):
+    """Run the scenario of a screen, return the simulator at the end of it. The flash directory is removed."""
+    flash_dir = tempfile.mkdtemp(prefix="hwp_flash_")
+    try:
+        sim = new_simulator(flash_dir)
+        sim.board.keep_frames = keep_frames
+        sim.display.keep_frames = keep_frames
+        SCREENS[name](sim)
+        return sim
+    finally:
+        shutil.rmtree(flash_dir, ignore_errors=True)
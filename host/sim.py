@@ -0,0 +1,39 @@
+"""Drive the state machine on the simulated board, the host equivalent of the main loop in main.py."""
+import time
+
+
+class Simulator:
+    def __init__(self, board, state_machine):
+        self.board = board
+        self.sm = state_machine
+        self.display = state_machine.display
+
+    def run(self, ms=0, step_ms=1):
+        """Run the main loop for 'ms' of simulated time, advancing the clock by 'step_ms' between iterations.
+        At least two iterations are run, so a pending state switch is entered and looped once."""
+        end_us = self.board.clock.now_us() + int(ms * 1000)
+        iterations = 0
+        while iterations < 2 or self.board.clock.now_us() < end_us:
+            self.sm.run()
+            self.board.advance_ms(step_ms)
+            iterations += 1
+        return iterations
+
+    def press(self, settle_ms=50):
+        self.board.press()
+        self.run(settle_ms)
+
+    def rotate(self, steps, settle_ms=50):
+        self.board.rotate(steps)
+        self.run(settle_ms)
+
+    def frame(self):
+        """The current frame buffer, what the next refresh would put on the screen."""
+        return bytes(self.display.buffer)
+
+    def time_refresh(self):
+        """Host time in us of one view.refresh() that shows a frame."""
+        self.sm.view.set_update(force=True)
+        start = time.perf_counter()
+        self.sm.view.refresh()
+        return int((time.perf_counter() - start) * 1000000)
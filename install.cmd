@@ -1,10 +1,20 @@
 @echo off
+@rem "install.cmd mpy" installs precompiled bytecode, see tools/build_mpy.py
+set package=http://localhost:8000/
+if "%1"=="mpy" (
+    python tools/build_mpy.py || exit /b 1
+    set package=http://localhost:8000/build/mpy/
+)
 start "mpremote.webserver" python -m http.server
 @rem Extract comport name where pico is connected
 for /f "tokens=1 delims= " %%a in ('python -m mpremote connect list ^| find "2e8a:0005"') do set comport=%%a
 echo Device: %comport%
 timeout /t 2 /nobreak
 @rem Run mpremote
-python -m mpremote connect %comport% mip install --target / http://localhost:8000/
+python -m mpremote connect %comport% mip install --target / %package%
+@rem Remove the .py or .mpy twins of the previous deployment, MicroPython would import the .py first, see src/loader.py
+set keep=.py
+if "%1"=="mpy" set keep=.mpy
+python -m mpremote connect %comport% exec "from src.loader import remove_twins; print(remove_twins('%keep%'), 'twins removed')"
 @rem The following line terminates all processes with mpremote.webserver as the window title.
 taskkill /fi "WINDOWTITLE eq mpremote.webserver"
@@ -28,10 +28,23 @@ case "$(uname)" in
      ;;
 esac
 echo Using: $python, `which python`
+# "./install.sh mpy" installs precompiled bytecode, see tools/build_mpy.py
+package=http://localhost:8000/
+if [ "$1" = "mpy" ] ; then
+   $python tools/build_mpy.py || exit 1
+   package=http://localhost:8000/build/mpy/
+fi
 $python -m http.server &
 comport=`$python -m mpremote connect list | grep 2e8a:0005 | cut -d' ' -f1`
 echo Device: $comport
 sleep 2
-$python -m mpremote connect $comport mip install --target / http://localhost:8000/
+$python -m mpremote connect $comport mip install --target / $package
+# remove the .py or .mpy twins of the previous deployment, MicroPython would import the .py first, see src/loader.py
+if [ "$1" = "mpy" ] ; then
+   keep=.mpy
+else
+   keep=.py
+fi
+$python -m mpremote connect $comport exec "from src.loader import remove_twins; print(remove_twins('$keep'), 'twins removed')"
 kill $!
 #pkill -f http.server
@@ -1,35 +1,18 @@
 """HeartWave Pico"""
 
-"""animation has to be the first, even before any imports, otherwise RAM will be full"""
-power_on_animation = True
-if power_on_animation:
-    import gc
+"""stale precompiled bytecode is removed before anything else is imported, see tools/build_mpy.py"""
+from src.loader import check_bytecode
 
-    from src.res.animation_power_on import PowerOnAnimation
+check_bytecode()
 
-    power_on_animation = PowerOnAnimation()
-    power_on_animation.play()
-    del power_on_animation
-    gc.collect()
-"""end of animation, resources of animation are freed inside the function"""
-
-from src.utils import GlobalSettings, load_settings
-from src.state_machine import StateMachine
-from src.save_system import check_home_dir
+"""animation goes first to show something as soon as possible,
+imports and initialisation run in stages between its frames, see src/boot.py"""
+from src.boot import boot
 
 if __name__ == "__main__":
-    # load settings:
-    load_settings("config.json")
-    GlobalSettings.print_log = False
-    # init state machine
-    state_machine = StateMachine()
-    state_machine.preload_states()
-    # connect wlan
-    if GlobalSettings.wifi_auto_connect:
-        state_machine.data_network.connect_wlan()
-    # start from main menu
-    state_machine.set(state_code=state_machine.STATE_MENU)
-    # check for save directory
-    check_home_dir()
-    while True:
-        state_machine.run()
+    # play power-on animation, load settings, connect wlan, create main menu and check for save directory
+    state_machine = boot(power_on_animation=True)
+    # start from main menu, sensor, ui, display and network run as separate tasks, see src/runtime.py
+    from src.runtime import Runtime
+
+    Runtime(state_machine).run()
@@ -0,0 +1,150 @@
+"""
+Staged boot: imports and initialisation run in small stages between the frames of the power-on animation,
+instead of after it. The Wi-Fi association is started as early as possible and goes on in the background
+while the rest of the firmware is imported.
+
+Only what the main menu needs is imported, the other states are imported and created on their first use,
+see StateMachine.get_state(). The imports are split per module, so no single stage stalls the animation for long,
+and gc.collect() runs after each stage, so the garbage of one stage (e.g. compiling a module) is freed before the next one.
+The display is created once and shared by the animation and the state machine.
+
+Profiling: time (ticks_us) and free RAM (gc.mem_free, after gc.collect) of each phase are recorded,
+logged, and written to REPORT_FILE in flash, one "name,us,free bytes" line per phase, shown in Settings -> Debug Info.
+The "animation" line is the time spent drawing animation frames, the "total" line is the boot time and
+the lowest free RAM seen after any phase. Run host/boot_profile.py for the same report on the host.
+"""
+import gc
+import time
+from src import log
+
+REPORT_FILE = "boot_profile.txt"
+
+
+class StagedBoot:
+    def __init__(self):
+        self._stages = []  # (name, function), run in order
+        self.profile = []  # (name, us, free RAM bytes) of each phase, see measure()
+        self._start = time.ticks_us()
+
+    def add(self, name, function):
+        """Add a stage at the end, also allowed from a running stage."""
+        self._stages.append((name, function))
+
+    def run(self, frames=None):
+        """Run all stages, one stage after each animation frame.
+        Args:
+            frames: iterator that shows the next animation frame on each next(), None to boot without animation.
+                    The rest of the animation is played after the last stage, and vice versa."""
+        animation_us = 0
+        index = 0
+        while frames is not None or index < len(self._stages):
+            if frames is not None:
+                start = time.ticks_us()
+                try:
+                    next(frames)
+                except StopIteration:
+                    frames = None
+                animation_us += time.ticks_diff(time.ticks_us(), start)
+            if index < len(self._stages):
+                name, function = self._stages[index]
+                self.measure(name, function)
+                index += 1
+        self.profile.append(("animation", animation_us, gc.mem_free()))
+        lowest_free = min(free for _, _, free in self.profile)
+        self.profile.append(("total", time.ticks_diff(time.ticks_us(), self._start), lowest_free))
+        log.info("Boot total: %d ms", self.profile[-1][1] // 1000)
+
+    def measure(self, name, function):
+        """Run a phase, record its time and the free RAM after it, return the result of the function."""
+        start = time.ticks_us()
+        result = function()
+        gc.collect()
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        self.profile.append((name, elapsed, gc.mem_free()))
+        log.info("Boot %s: %d us", name, elapsed)
+        return result
+
+
+def write_report(profile, path=REPORT_FILE):
+    try:
+        with open(path, "w") as file:
+            for name, us, free in profile:
+                file.write("{},{},{}\n".format(name, us, free))
+    except OSError as e:
+        log.warning("Boot report not written: %s", e)  # the boot goes on without it
+
+
+def load_report(path=REPORT_FILE):
+    """Return the profile of the last boot as a list of (name, us, free RAM bytes), empty if there's none."""
+    profile = []
+    try:
+        with open(path, "r") as file:
+            for line in file:
+                name, us, free = line.strip().split(",")
+                profile.append((name, int(us), int(free)))
+    except (OSError, ValueError):
+        return []
+    return profile
+
+
+def _import(name):
+    def stage():
+        __import__(name)
+    return stage
+
+
+def boot(power_on_animation=True, config="config.json"):
+    """Boot the device and return the state machine, set to the main menu."""
+    staged_boot = StagedBoot()
+
+    def create_display():
+        from src.hardware import Display
+        return Display()
+
+    def create_animation():
+        from src.res.animation_power_on import PowerOnAnimation
+        return PowerOnAnimation().frames(display)
+
+    display = staged_boot.measure("display", create_display)
+    frames = None
+    if power_on_animation:
+        frames = staged_boot.measure("anim load", create_animation)
+
+    # objects created by the stages, stages are run in order so each one can use what the previous ones made
+    created = {}
+
+    def settings():
+        from src.utils import load_settings
+        load_settings(config)
+        log.set_print(False)  # lines are still kept in ring buffer, see Settings -> Debug Info
+
+    def wifi():
+        from src.utils import GlobalSettings
+        from src.pico_network import PicoNetwork
+        created["network"] = PicoNetwork()
+        if GlobalSettings.wifi_auto_connect:
+            created["network"].connect_wlan()  # associates in the background, the boot goes on
+
+    def create_state_machine():
+        from src.state_machine import StateMachine
+        # rarely used states (settings, PPG recording) are dropped from RAM again when more than 9 of 14 are loaded
+        created["sm"] = StateMachine(display=display, data_network=created["network"], max_states=9)
+
+    def main_menu():
+        state_machine = created["sm"]
+        state_machine.set(state_code=state_machine.STATE_MENU)  # loads the main menu state
+
+    def home_dir():
+        from src.save_system import check_home_dir
+        check_home_dir()
+
+    staged_boot.add("settings", settings)
+    staged_boot.add("wifi", wifi)
+    for module in ("src.view", "src.state_machine"):
+        staged_boot.add(module, _import(module))
+    staged_boot.add("state machine", create_state_machine)
+    staged_boot.add("main menu", main_menu)
+    staged_boot.add("home dir", home_dir)
+    staged_boot.run(frames)
+    write_report(staged_boot.profile)
+    return created["sm"]
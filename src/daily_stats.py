@@ -0,0 +1,134 @@
+"""
+Daily aggregates of the history, so trends are shown without reading the results: Saved_Values/daily.agg
+
+A table of DAYS slots, one per day. The slot of a day is its day number (days since 2000) modulo DAYS, so it's found
+without searching, and the DAYS - 1 days before the newest one are always kept. Each slot is 36 bytes:
+    day number u16, result count u16, HR sum u32, HR min u16, HR max u16,
+    RMSSD sum u32, RMSSD min u32, RMSSD max u32, SDNN sum u32, SDNN min u32, SDNN max u32
+Values are hundredths as in record.Result, a slot with count 0 is empty. The file is a header, the slots, and a CRC32
+of both. header: magic b"HWDA", version u8, slot count u8, reserved u16, id of the next record to count u32.
+
+The table is updated by each save, see save_system(), and a re-analysed result recounts its day, see
+update_record(). It is rewritten as a whole to a .tmp file renamed over it,
+and rebuilt from the results of the last DAYS days if it's missing or damaged. The record id in the header lets the
+recovery of an interrupted save tell whether the record was counted. Baselines are the mean of the results of the
+last 7 or 30 days, from the table alone, so they cost the same whatever the size of the history.
+"""
+import os
+import struct
+from binascii import crc32
+from src.utils import GlobalSettings
+
+STATS_FILE = "daily.agg"
+STATS_MAGIC = b"HWDA"
+STATS_VERSION = 1
+DAYS = 32
+SECONDS_PER_DAY = 86400
+_HEADER_FORMAT = "<4sBBHI"
+_HEADER_SIZE = 12
+_SLOT_FORMAT = "<HHIHHIIIIII"
+_SLOT_SIZE = 36
+_FILE_SIZE = _HEADER_SIZE + DAYS * _SLOT_SIZE + 4
+
+
+def _stats_path():
+    return GlobalSettings.save_directory + "/" + STATS_FILE
+
+
+def empty(next_record_id=0):
+    """New table without any result, as a bytearray of the file content without its CRC"""
+    table = bytearray(_FILE_SIZE - 4)
+    struct.pack_into(_HEADER_FORMAT, table, 0, STATS_MAGIC, STATS_VERSION, DAYS, 0, next_record_id)
+    return table
+
+
+def load():
+    """Table of the file, None if it's missing or damaged."""
+    try:
+        with open(_stats_path(), "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    if (len(data) != _FILE_SIZE or struct.unpack_from("<I", data, _FILE_SIZE - 4)[0] != crc32(data[:-4])
+            or data[:4] != STATS_MAGIC or data[4] != STATS_VERSION or data[5] != DAYS):
+        return None
+    return bytearray(data[:-4])
+
+
+def write(table):
+    path = _stats_path()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(table)
+        file.write(struct.pack("<I", crc32(table)))
+    os.rename(tmp_path, path)
+
+
+def next_record_id(table):
+    """Id of the next record to count: the ones below were counted, or are older than the table."""
+    return struct.unpack_from("<I", table, 8)[0]
+
+
+def add(table, result, record_id):
+    """Count a record.Result in the table. A result older than the days kept is left out."""
+    day = result.timestamp // SECONDS_PER_DAY
+    offset = _HEADER_SIZE + day % DAYS * _SLOT_SIZE
+    (slot_day, count, hr_sum, hr_min, hr_max, rmssd_sum, rmssd_min, rmssd_max,
+     sdnn_sum, sdnn_min, sdnn_max) = struct.unpack_from(_SLOT_FORMAT, table, offset)
+    if record_id >= next_record_id(table):
+        struct.pack_into("<I", table, 8, record_id + 1)
+    if count and slot_day > day:
+        return  # the slot holds a newer day
+    if not count or slot_day < day:
+        count = hr_sum = rmssd_sum = sdnn_sum = 0
+        hr_min = rmssd_min = sdnn_min = 0xffffffff
+        hr_max = rmssd_max = sdnn_max = 0
+    struct.pack_into(_SLOT_FORMAT, table, offset, day, min(count + 1, 0xffff), hr_sum + result.hr,
+                     min(hr_min, result.hr), max(hr_max, result.hr),
+                     rmssd_sum + result.rmssd, min(rmssd_min, result.rmssd), max(rmssd_max, result.rmssd),
+                     sdnn_sum + result.sdnn, min(sdnn_min, result.sdnn), max(sdnn_max, result.sdnn))
+
+
+def clear_day(table, day):
+    """Empty the slot of a day, to count its results again after one of them changed."""
+    offset = _HEADER_SIZE + day % DAYS * _SLOT_SIZE
+    if struct.unpack_from("<H", table, offset)[0] == day:
+        struct.pack_into("<H", table, offset + 2, 0)
+
+
+def newest_day(table):
+    """Day number of the newest day with results, -1 if there's none."""
+    newest = -1
+    for offset in range(_HEADER_SIZE, _HEADER_SIZE + DAYS * _SLOT_SIZE, _SLOT_SIZE):
+        day, count = struct.unpack_from("<HH", table, offset)
+        if count and day > newest:
+            newest = day
+    return newest
+
+
+def day_stats(table, day):
+    """Return (count, HR mean, min, max, RMSSD mean, min, max, SDNN mean, min, max) of a day, in hundredths,
+    None if it has no result or is not kept."""
+    (slot_day, count, hr_sum, hr_min, hr_max, rmssd_sum, rmssd_min, rmssd_max,
+     sdnn_sum, sdnn_min, sdnn_max) = struct.unpack_from(_SLOT_FORMAT, table, _HEADER_SIZE + day % DAYS * _SLOT_SIZE)
+    if not count or slot_day != day:
+        return None
+    return (count, hr_sum // count, hr_min, hr_max, rmssd_sum // count, rmssd_min, rmssd_max,
+            sdnn_sum // count, sdnn_min, sdnn_max)
+
+
+def baseline(table, end_day, days):
+    """Return (count, HR mean, RMSSD mean, SDNN mean) of the results of the 'days' days up to 'end_day',
+    in hundredths, None if there's none. 'days' is at most DAYS."""
+    count = hr_sum = rmssd_sum = sdnn_sum = 0
+    for offset in range(_HEADER_SIZE, _HEADER_SIZE + DAYS * _SLOT_SIZE, _SLOT_SIZE):
+        slot_day, slot_count, slot_hr, _, _, slot_rmssd, _, _, slot_sdnn, _, _ = struct.unpack_from(
+            _SLOT_FORMAT, table, offset)
+        if slot_count and end_day - days < slot_day <= end_day:
+            count += slot_count
+            hr_sum += slot_hr
+            rmssd_sum += slot_rmssd
+            sdnn_sum += slot_sdnn
+    if not count:
+        return None
+    return count, hr_sum // count, rmssd_sum // count, sdnn_sum // count
@@ -1,4 +1,6 @@
-from src.utils import print_log, get_datetime, GlobalSettings
+from src.utils import GlobalSettings
+from src.record import Result
+from src import log
 from math import sqrt
 import urequests as requests
 from src.data_structure import Fifo, SlidingWindow
@@ -181,42 +183,49 @@ def calculate_hrv(IBI_list_raw):
 
 def get_kubios_analysis(ibi_list):
     """Return: tuple(success, response)"""
+    for step in kubios_analysis_steps(ibi_list):
+        if step is not None:
+            return step
+
+
+def kubios_analysis_steps(ibi_list):
+    """Generator of the Kubios analysis, yields None before each blocking request,
+    so the caller can keep the main loop (and loading animation) running between the requests.
+    The last value yielded is tuple(success, response), as returned by get_kubios_analysis."""
     # run gc.collect() to free up memory, otherwise the 'requests' might fail due to it probably using a lot of memory
     gc.collect()
-    print_log("RAM before garbage: " + str(round((gc.mem_free() / 1024), 2)) + " KB")
+    log.debug("RAM before garbage: %d B", gc.mem_free())
     amount = random.randint(10, 30)
     garbage = [i for i in range(amount)]
-    print_log("RAM after garbage: " + str(round((gc.mem_free() / 1024), 2)) + " KB")
-    print_log("RAM before kubios request: " + str(round((gc.mem_free() / 1024), 2)) + " KB")
+    log.debug("RAM after garbage: %d B", gc.mem_free())
+    log.debug("RAM before kubios request: %d B", gc.mem_free())
     try:
         APIKEY = GlobalSettings.kubios_apikey
         CLIENT_ID = GlobalSettings.kubios_client_id
         CLIENT_SECRET = GlobalSettings.kubios_client_secret
         TOKEN_URL = "https://kubioscloud.auth.eu-west-1.amazoncognito.com/oauth2/token"
+        yield None
         response = requests.post(url=TOKEN_URL, data='grant_type=client_credentials&client_id={}'.format(CLIENT_ID),
                                  headers={'Content-Type': 'application/x-www-form-urlencoded'},
                                  auth=(CLIENT_ID, CLIENT_SECRET))
         gc.collect()
         response = response.json()  # Parse JSON response into a python dictionary
-        print_log("RAM after the first kubios request: " + str(round((gc.mem_free() / 1024), 2)) + " KB")
+        log.debug("RAM after the first kubios request: %d B", gc.mem_free())
         access_token = response["access_token"]  # Parse access token
         dataset = {"type": "RRI", "data": ibi_list, "analysis": {"type": "readiness"}}
+        yield None
         response = requests.post(url="https://analysis.kubioscloud.com/v2/analytics/analyze",
                                  headers={"Authorization": "Bearer {}".format(access_token), "X-Api-Key": APIKEY},
                                  json=dataset)
         analysis = response.json()["analysis"]
-        print_log("RAM after the second kubios request: " + str(round((gc.mem_free() / 1024), 2)) + " KB")
-        result = {"DATE": get_datetime(),
-                  "HR": str(round(analysis["mean_hr_bpm"], 2)) + "BPM",
-                  "IBI": str(round(analysis["mean_rr_ms"], 2)) + "ms",
-                  "RMSSD": str(round(analysis["rmssd_ms"], 2)) + "ms",
-                  "SDNN": str(round(analysis["sdnn_ms"], 2)) + "ms",
-                  "SNS": str(round(analysis["sns_index"], 2)),
-                  "PNS": str(round(analysis["pns_index"], 2)),
-                  "STRESS": str(round(analysis["stress_index"], 2))}
+        log.debug("RAM after the second kubios request: %d B", gc.mem_free())
+        result = Result.from_values(analysis["mean_hr_bpm"], analysis["mean_rr_ms"], analysis["rmssd_ms"],
+                                    analysis["sdnn_ms"], analysis["sns_index"], analysis["pns_index"],
+                                    analysis["stress_index"])
     except Exception as e:
-        print_log(f"Kubios analysis failed: {e}")
+        log.warning("Kubios analysis failed: %s", e)
         del garbage
-        return False, None
+        yield False, None
+        return
     del garbage
-    return True, result
+    yield True, result
@@ -140,3 +140,51 @@ class SlidingWindow:
 
     def has_data(self):
         return self.current_window.has_data()
+
+
+class LogHistogram:
+    """Fixed size histogram of durations in microseconds with power of two buckets:
+    bucket 0 counts 0..1 us, bucket i counts 2^i..2^(i+1)-1 us, the last bucket counts everything above.
+    Adding a value is a bit length and an increment, no allocation, so it can run on every loop iteration.
+    Percentiles are the upper bound of their bucket, so at most 2x the real value."""
+
+    def __init__(self, buckets=20, budget_us=None):
+        self.buckets = array.array('L', [0] * buckets)
+        self.count = 0
+        self.max = 0
+        self.budget_us = budget_us  # values above it are counted as overruns, None: no budget
+        self.overruns = 0
+
+    def add(self, us):
+        index = 0
+        value = us >> 1
+        while value:
+            index += 1
+            value >>= 1
+        if index >= len(self.buckets):
+            index = len(self.buckets) - 1
+        self.buckets[index] += 1
+        self.count += 1
+        if us > self.max:
+            self.max = us
+        if self.budget_us is not None and us > self.budget_us:
+            self.overruns += 1
+
+    def percentile(self, percent):
+        """Upper bound of the bucket holding the percentile, capped at the max seen, 0 if empty"""
+        if self.count == 0:
+            return 0
+        rank = (self.count * percent + 99) // 100  # the rank-th smallest value, 1 based
+        seen = 0
+        for index in range(len(self.buckets)):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min((2 << index) - 1, self.max)
+        return self.max
+
+    def clear(self):
+        for index in range(len(self.buckets)):
+            self.buckets[index] = 0
+        self.count = 0
+        self.max = 0
+        self.overruns = 0
@@ -2,9 +2,12 @@ from machine import Pin, I2C, ADC
 from ssd1306 import SSD1306_I2C as SSD1306_I2C_
 import time
 from piotimer import Piotimer
-from src.utils import print_log
+from micropython import const
+from src import log
 from src.data_processing import Fifo
 
+_LOG_DEBUG = const(0)  # set to 1 to compile in debug logging of encoder and screen updates
+
 
 class EncoderEvent:
     NONE = 0
@@ -19,12 +22,15 @@ class HeartSensor:
         self._timer = None
         self.sensor_fifo = Fifo(100, 'H')
         self._started = False
+        self.wake = None  # set() when started, e.g. a ThreadSafeFlag of the runtime, see src/runtime.py
 
     def start(self):
         if self._started:
             return
         self._timer = Piotimer(freq=self._sampling_rate, callback=self._sensor_handler)
         self._started = True
+        if self.wake is not None:
+            self.wake.set()
 
     def stop(self):
         if not self._started:
@@ -36,6 +42,9 @@ class HeartSensor:
     def get_sampling_rate(self):
         return self._sampling_rate
 
+    def is_started(self):
+        return self._started
+
     def read(self):
         """Read the current sensor value directly."""
         return self._adc.read_u16() >> 2
@@ -64,6 +73,9 @@ class RotaryEncoder:
         self._items_count = 0
         self._loop_mode = False
         self._position = 0
+        # set() on every event, e.g. a ThreadSafeFlag of the runtime, see src/runtime.py
+        self.wake = None
+        self.event_time_us = 0  # ticks_us of the last event, for wake-up latency
 
     """public methods"""
 
@@ -85,7 +97,8 @@ class RotaryEncoder:
 
     def get_position(self):
         """Get the current absolute position of the encoder."""
-        print_log("Encoder position:" + str(self._position))
+        if _LOG_DEBUG:
+            log.debug("Encoder position: %d", self._position)
         return self._position
 
     def get_event(self):
@@ -115,12 +128,69 @@ class RotaryEncoder:
             self._event_fifo.put(1)
         else:
             self._event_fifo.put(-1)
+        self._wake()
 
     def _press_handler(self, pin):
         current_time = time.ticks_ms()
         if current_time - self._last_press_time > self._btn_debounce_ms:
             self._event_fifo.put(0)
             self._last_press_time = time.ticks_ms()
+            self._wake()
+
+    def _wake(self):
+        self.event_time_us = time.ticks_us()
+        if self.wake is not None:
+            self.wake.set()
+
+
+class RefreshGovernor:
+    """Chooses the refresh period of the display from the measured cost of a flush and the sensor fifo backlog.
+    When the sensor is running and samples pile up, the period is doubled (lower frame rate) to give time back to
+    the detector. It's then shortened step by step while the backlog stays low, and it's back at the max frame
+    rate on idle screens, e.g. menus. While the sensor is running, flushing is also capped to a share of the time."""
+
+    def __init__(self, min_rate=5, max_rate=40, backlog_high=25, backlog_low=5, flush_share=4):
+        """Args:
+        min_rate, max_rate: frame rate limits in Hz
+        backlog_high: sensor fifo count that halves the frame rate
+        backlog_low: sensor fifo count below which the frame rate recovers
+        flush_share: while sensing, the period is at least flush cost * flush_share, e.g. 4 means 25% of time"""
+        self.min_period = 1000 // max_rate  # ms, of the max frame rate
+        self._max_period = 1000 // min_rate
+        self._backlog_high = backlog_high
+        self._backlog_low = backlog_low
+        self._flush_share = flush_share
+        self._heart_sensor = None
+        self.period = self.min_period  # ms
+        self.flush_cost_us = 0  # moving average of the flush time
+        self._backed_off = False  # period doubled since the last flush
+
+    def set_heart_sensor(self, heart_sensor):
+        self._heart_sensor = heart_sensor
+
+    def check_backlog(self):
+        """Call before deciding to flush, lowers the frame rate at once if the detector is falling behind.
+        At most once per frame, however many times it's called while the frame waits."""
+        if (not self._backed_off and self._heart_sensor is not None
+                and self._heart_sensor.sensor_fifo.count() >= self._backlog_high):
+            self.period = min(self._max_period, self.period * 2)
+            self._backed_off = True
+
+    def on_flush(self, cost_us):
+        """Call after every flush with its duration, the frame rate recovers here, one step per frame."""
+        self.flush_cost_us = (self.flush_cost_us * 3 + cost_us) // 4 if self.flush_cost_us else cost_us
+        if self._backed_off:
+            self._backed_off = False
+            return  # doubled for this frame, recovers from the next one
+        min_period = self.min_period
+        if self._heart_sensor is not None and self._heart_sensor.is_started():
+            if self._heart_sensor.sensor_fifo.count() > self._backlog_low:
+                return
+            min_period = max(min_period, self.flush_cost_us * self._flush_share // 1000)
+        self.period = max(min_period, self.period - 2)
+
+    def get_rate(self):
+        return 1000 // self.period
 
 
 class Display(SSD1306_I2C_):
@@ -130,28 +200,64 @@ class Display(SSD1306_I2C_):
         self.width = width
         self.height = height
         self._updated = False
-        self._update_force = False  # force update once regardless of refresh rate
         self._last_update_time = 0
-        self._refresh_period = 1000 // refresh_rate
+        self.governor = RefreshGovernor(max_rate=refresh_rate)
+        # stats, shown in debug info
+        self.frames_shown = 0
+        self.frames_merged = 0  # frames shown with updates marked while they were already pending
+        self.frames_dropped = 0  # pending frames held back by the governor beyond the max frame rate
+        self._held = False
+        self._merged = False
+        self.wake = None  # set() when an update is marked, e.g. a ThreadSafeFlag of the runtime, see src/runtime.py
         super().__init__(width, height, I2C(1, scl=Pin(scl), sda=Pin(sda), freq=400000))
 
     def refresh(self):
         """
         Refresh the screen, call this in the main loop.
         It will only update the screen if the screen has been marked as updated by set_update() method.
-        And the screen will only be updated at the refresh rate"""
-        if (time.ticks_diff(time.ticks_ms(),
-                            self._last_update_time) > self._refresh_period and self._updated) or self._update_force:
-            super().show()
-            print_log("screen updated")
-            self._last_update_time = time.ticks_ms()
-            self._updated = False
-            self._update_force = False
+        And the screen will only be updated at the refresh rate chosen by the governor"""
+        if not self._updated:
+            return
+        self.governor.check_backlog()
+        elapsed = time.ticks_diff(time.ticks_ms(), self._last_update_time)
+        if elapsed < self.governor.period:
+            if not self._held and elapsed >= self.governor.min_period:
+                self._held = True
+                self.frames_dropped += 1
+            return
+        start = time.ticks_us()
+        super().show()
+        self.governor.on_flush(time.ticks_diff(time.ticks_us(), start))
+        if _LOG_DEBUG:
+            log.debug("screen updated")
+        self._last_update_time = time.ticks_ms()
+        self._updated = False
+        self._held = False
+        if self._merged:
+            self._merged = False
+            self.frames_merged += 1
+        self.frames_shown += 1
 
     def set_update(self, force=False):
-        """Mark the screen as updated.
-        The option 'force' will update the screen at next 'refresh' regardless of the refresh rate, but only once."""
-        if force:
-            self._update_force = True
-        else:
-            self._updated = True
+        """Mark the screen as updated, it's shown at next 'refresh' when the governor allows.
+        The option 'force' is kept for compatibility, forced updates are coalesced like others, not shown at once."""
+        if self._updated:
+            self._merged = True  # counted once when the frame is shown
+            return
+        self._updated = True
+        if self.wake is not None:
+            self.wake.set()
+
+    def ms_until_refresh(self):
+        """Time until the governor allows the next frame, for a caller that sleeps between refreshes."""
+        elapsed = time.ticks_diff(time.ticks_ms(), self._last_update_time)
+        return max(0, self.governor.period - elapsed)
+
+    def is_update_pending(self):
+        """True if the frame buffer has changes that are not on the screen yet."""
+        return self._updated
+
+    def get_refresh_stats(self):
+        """Return a tuple of frame rate (Hz), flush cost (us), shown, merged and dropped frame counts."""
+        return (self.governor.get_rate(), self.governor.flush_cost_us,
+                self.frames_shown, self.frames_merged, self.frames_dropped)
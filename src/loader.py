@@ -0,0 +1,107 @@
+"""
+Check of precompiled bytecode (.mpy) deployments, see tools/build_mpy.py. Run by main.py before any other import.
+
+A bytecode deployment has src/bytecode.txt with "build id,mpy version", and src/build_id.mpy compiled in the same
+build. mip installs src/build_id.mpy first and src/bytecode.txt last, so an interrupted or mixed deployment leaves
+the two different. Bytecode compiled for another .mpy version can't be loaded by the firmware at all.
+In both cases the stale .mpy files are removed, rather than crashing later in the middle of some import, and the
+device runs from the .py sources if they are all there, otherwise it needs to be deployed again.
+
+MicroPython imports a .py before the .mpy of the same name, so each deployment removes the twins of the other kind
+left by the previous one, see remove_twins(), run by install.sh and install.cmd after mip.
+
+This module is always deployed as source, the check must not depend on the bytecode it checks.
+"""
+import os
+import sys
+
+STAMP_FILE = "src/bytecode.txt"
+BUILD_ID_MODULE = "src/build_id.mpy"
+
+
+def check_bytecode():
+    """Return True if running from a consistent bytecode deployment, False if from source.
+    Stale bytecode is removed, then False if every module has its source, otherwise raise ImportError,
+    the device needs to be deployed again."""
+    try:
+        with open(STAMP_FILE, "r") as file:
+            build_id, mpy_version = file.read().strip().split(",")
+    except OSError:
+        return False  # source deployment
+    reason = None
+    if int(mpy_version) != sys.implementation._mpy & 0xff:
+        reason = "mpy v{} not supported by firmware".format(mpy_version)
+    else:
+        try:
+            from src.build_id import BUILD_ID
+            if BUILD_ID != build_id:
+                reason = "build {} != {}".format(BUILD_ID, build_id)
+        except (ImportError, ValueError) as e:
+            reason = str(e)
+    if reason is None:
+        return True
+    os.remove(STAMP_FILE)
+    removed, without_source = _remove_bytecode("src")
+    if without_source:
+        raise ImportError("stale bytecode ({}), {} files removed, {} without source, deploy again".format(
+            reason, removed, without_source))
+    print("stale bytecode ({}), {} files removed, running from source".format(reason, removed))
+    return False
+
+
+def remove_twins(keep):
+    """Remove the files left by the previous deployment of the other kind: keep=".mpy" removes the .py of each
+    .mpy, keep=".py" removes the .mpy of each .py, the build id and the stamp. Return the number of files removed.
+    Run after mip by install.sh and install.cmd, through mpremote exec."""
+    other = ".py" if keep == ".mpy" else ".mpy"
+    removed = _remove_twins("src", keep, other)
+    if keep == ".py":
+        for path in (BUILD_ID_MODULE, STAMP_FILE):
+            if _exists(path):
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def _exists(path):
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def _remove_twins(directory, keep, other):
+    removed = 0
+    names = []
+    for entry in os.ilistdir(directory):
+        if entry[1] == 0x4000:  # directory
+            removed += _remove_twins(directory + "/" + entry[0], keep, other)
+        else:
+            names.append(entry[0])
+    for name in names:
+        if name.endswith(keep) and name[:-len(keep)] + other in names:
+            os.remove(directory + "/" + name[:-len(keep)] + other)
+            removed += 1
+    return removed
+
+
+def _remove_bytecode(directory):
+    """Remove the .mpy files, return (files removed, of which without a .py)."""
+    removed = without_source = 0
+    names = []
+    for entry in os.ilistdir(directory):
+        path = directory + "/" + entry[0]
+        if entry[1] == 0x4000:  # directory
+            counts = _remove_bytecode(path)
+            removed += counts[0]
+            without_source += counts[1]
+        else:
+            names.append(entry[0])
+    for name in names:
+        if name.endswith(".mpy"):
+            os.remove(directory + "/" + name)
+            removed += 1
+            if name[:-4] + ".py" not in names and directory + "/" + name != BUILD_ID_MODULE:
+                without_source += 1
+    return removed, without_source
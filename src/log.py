@@ -0,0 +1,106 @@
+"""
+Lightweight logging with levels, lazy formatting and a ring buffer sink.
+
+Usage:
+- log.debug("View added: %s, active: %d", view.type, len(views))
+  The message is only formatted (message % args) when the level is enabled, so pass values as arguments,
+  never as f-strings or concatenated strings, otherwise they are built even when logging is off.
+- Logged lines are kept in a small ring buffer (see get_lines), shown in Settings -> Debug Info,
+  and printed to the console if enabled by set_print(True).
+
+Compile-out:
+For hot paths, even a call to a disabled log function costs a lookup and a call.
+Modules with hot paths define their own switch, and MicroPython removes the guarded code at compile time:
+    from micropython import const
+    _LOG_DEBUG = const(0)
+    ...
+    if _LOG_DEBUG:
+        log.debug("...", value)
+"""
+import time
+from micropython import const
+
+DEBUG = const(10)
+INFO = const(20)
+WARNING = const(30)
+ERROR = const(40)
+OFF = const(100)
+
+_LEVEL_NAMES = {DEBUG: "D", INFO: "I", WARNING: "W", ERROR: "E"}
+
+
+class _LogState:
+    level = INFO
+    print_enabled = False
+    ring_size = 32
+    ring = [None] * ring_size
+    ring_index = 0  # next slot to write
+
+
+def set_level(level):
+    """Messages below the level are dropped without being formatted."""
+    _LogState.level = level
+
+
+def get_level():
+    return _LogState.level
+
+
+def is_enabled(level):
+    """Check before building an expensive argument, e.g. a dict summary."""
+    return level >= _LogState.level
+
+
+def set_print(enabled):
+    """Also print logged lines to the console."""
+    _LogState.print_enabled = enabled
+
+
+def debug(message, *args):
+    if DEBUG >= _LogState.level:
+        _emit(DEBUG, message, args)
+
+
+def info(message, *args):
+    if INFO >= _LogState.level:
+        _emit(INFO, message, args)
+
+
+def warning(message, *args):
+    if WARNING >= _LogState.level:
+        _emit(WARNING, message, args)
+
+
+def error(message, *args):
+    if ERROR >= _LogState.level:
+        _emit(ERROR, message, args)
+
+
+def get_lines():
+    """Return logged lines in the ring buffer, oldest first."""
+    lines = []
+    size = _LogState.ring_size
+    for i in range(size):
+        line = _LogState.ring[(_LogState.ring_index + i) % size]
+        if line is not None:
+            lines.append(line)
+    return lines
+
+
+def clear():
+    for i in range(_LogState.ring_size):
+        _LogState.ring[i] = None
+    _LogState.ring_index = 0
+
+
+def _emit(level, message, args):
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = message + " " + str(args)  # wrong format string should not crash the caller
+    line = "{} {} {}".format(time.ticks_ms(), _LEVEL_NAMES[level], message)
+    _LogState.ring[_LogState.ring_index] = line
+    _LogState.ring_index = (_LogState.ring_index + 1) % _LogState.ring_size
+    if _LogState.print_enabled:
+        print(line)
@@ -1,6 +1,5 @@
 import time
 from src.state import State
-from src.utils import print_log
 
 
 class MainMenu(State):
@@ -16,7 +15,7 @@ class MainMenu(State):
     def enter(self, args):
         self._view.remove_all()  # clear screen
         self._menu = self._view.add_menu()
-        self._rotary_encoder.enable_rotate(items_count=5, position=self._selection, loop_mode=False)
+        self._rotary_encoder.enable_rotate(items_count=6, position=self._selection, loop_mode=False)
         self._rotary_encoder.enable_press()
         self._menu.set_selection(self._selection)  # resume selected index from last time
 
@@ -39,6 +38,9 @@ class MainMenu(State):
                 self._state_machine.set_module(self._state_machine.MODULE_HISTORY)
                 self._state_machine.set(self._state_machine.STATE_SHOW_HISTORY)
             elif self._selection == 4:
+                self._state_machine.set_module(self._state_machine.MODULE_RECORD)
+                self._state_machine.set(self._state_machine.STATE_RECORD)
+            elif self._selection == 5:
                 self._state_machine.set_module(self._state_machine.MODULE_SETTINGS)
                 self._state_machine.set(self._state_machine.STATE_SETTINGS)
             else:
@@ -1,6 +1,6 @@
-from src.utils import print_log
 import time
-from src.state import State
+from src import log
+from src.state import State, LoopScheduler
 from src.data_processing import IBICalculator
 
 
@@ -13,25 +13,33 @@ class MeasureWait(State):
         self._start_threshold = 200  # threshold that triggers the start of measurement when finger is placed
 
     def enter(self, args):
-        # take arguments: heading_text, hr_text
+        # take arguments: heading_text, countdown
         if self._state_machine.current_module == self._state_machine.MODULE_HR:
             heading_text = "HR Measure"
-            hr_text = "-- BPM"
+            countdown = None
         elif self._state_machine.current_module == self._state_machine.MODULE_HRV:
             heading_text = "HRV Analysis"
-            hr_text = "-- BPM  30s"
+            countdown = 30
         elif self._state_machine.current_module == self._state_machine.MODULE_KUBIOS:
             heading_text = "Kubios Analysis"
-            hr_text = "-- BPM  30s"
+            countdown = 30
         else:
             raise ValueError("Invalid module code")
         self._view.remove_all()  # clear screen
         self._view.add_text(text="Put finger on ", x=0, y=14, vid="text_put_finger1")
         self._view.add_text(text="sensor to start", x=0, y=24, vid="text_put_finger2")
         self._view.add_text(text=heading_text, x=0, y=0, invert=True, vid="text_heading")
-        self._view.add_text(text=hr_text, x=0, y=64 - 8, vid="text_hr")
+        # big digits for HR, readable at arm's length, 16x16 pixels each at the bottom of the screen
+        self._view.add_number(value=None, x=0, y=64 - 16, digits=3, scale=2, unit="BPM", vid="number_hr")
+        if countdown is not None:
+            # right aligned: 2 digits of 8 pixels, the 2 pixel gap and the 8 pixel unit
+            self._view.add_number(value=countdown, x=128 - (2 * 8 + 2 + 8), y=64 - 8, digits=2, unit="s",
+                                  vid="number_countdown")
         self._rotary_encoder.enable_press()
 
+    def next_loop_ms(self):
+        return 20  # polls the finger on the sensor
+
     def loop(self):
         # check finger on sensor
         value = self._heart_sensor.read()
@@ -63,7 +71,8 @@ class Measure(State):
         self._hr = 0
         self._ibi_list = []
         # placeholders for ui
-        self._textview_hr = None
+        self._numberview_hr = None
+        self._numberview_countdown = None
         self._graphview = None
         # settings
         self._hr_update_interval = 5  # number of sample
@@ -72,6 +81,18 @@ class Measure(State):
         self._countdown = None
         self._last_graph_update_time = 0
         self._last_count_down_time = 0
+        # work of each loop(), by priority within a budget: the samples waiting in the sensor fifo for sensor(),
+        # which runs before loop() or in its own task, take their time from it, so the HR text and graph are
+        # deferred when the fifo backs up (10 samples fill 40 ms at 250 Hz).
+        # The countdown and the encoder are cheap and must not wait.
+        self._loop_budget_us = 40000
+        self._sample_us = 1000000 // self._heart_sensor.get_sampling_rate()
+        self._scheduler = LoopScheduler()
+        self._scheduler.add("countdown", LoopScheduler.PRIORITY_ALWAYS, 500, self._countdown_due,
+                            self._update_countdown)
+        self._scheduler.add("encoder", LoopScheduler.PRIORITY_ALWAYS, 100, self._always, self._poll_encoder)
+        self._scheduler.add("hr", 1, 2000, self._hr_due, self._update_hr)
+        self._scheduler.add("graph", 2, 1500, self._graph_due, self._update_graph)
 
     def enter(self, args):
         """args: (countdown). countdown: time for counting down, unfilled means unlimited time"""
@@ -83,13 +104,17 @@ class Measure(State):
         self._hr = 0
         self._ibi_list.clear()
         self._ibi_calculator.reinit()  # remember to reinit the calculator before use every time
+        self._scheduler.clear_stats()
         # ui
-        self._textview_hr = self._view.select_by_id("text_hr")  # assigned to self.xxx, avoid select_by_id in loop()
-        self._graphview = self._view.add_graph(y=14, h=64 - 14 - 12)
+        # assigned to self.xxx, avoid select_by_id in loop()
+        self._numberview_hr = self._view.select_by_id("number_hr")
+        if self._countdown is not None:
+            self._numberview_countdown = self._view.select_by_id("number_countdown")
+        self._graphview = self._view.add_graph(y=14, h=64 - 14 - 20)
         self._rotary_encoder.enable_press()
         self._heart_sensor.start()  # start lastly to reduce the chance of data piling, maybe not needed
 
-    def loop(self):
+    def sensor(self):
         self._ibi_calculator.run()  # keep calling calculator: sensor_fifo -> ibi_fifo
         # monitor and get data from ibi fifo, calculate hr and put into list
         while self._ibi_fifo.has_data():
@@ -98,48 +123,73 @@ class Measure(State):
             if self._countdown is not None:  # countdown mode
                 self._ibi_list.append(ibi)
 
+    def next_loop_ms(self):
+        # the graph is the most frequent timer, the countdown and HR follow from it
+        elapsed = time.ticks_diff(time.ticks_ms(), self._last_graph_update_time)
+        return max(0, self._graph_update_interval - elapsed)
+
+    def loop(self):
+        backlog_us = self._heart_sensor.sensor_fifo.count() * self._sample_us
+        self._scheduler.run(self._loop_budget_us - backlog_us)
+
+    def get_deferred(self):
+        """Return a list of (job name, cost estimate us, deferred count) of the loop() work"""
+        return self._scheduler.get_stats()
+
+    def _exit(self):
+        if self._scheduler.deferred:
+            log.info("Measure deferred: %s", ", ".join(
+                "{} {}".format(name, deferred) for name, _, deferred in self._scheduler.get_stats() if deferred))
+
+    def _always(self):
+        return True
+
+    def _hr_due(self):
+        return len(self._hr_show_list) >= self._hr_update_interval
+
+    def _update_hr(self):
         # for every _hr_update_interval samples, calculate the median value and update the HR display
-        if len(self._hr_show_list) >= self._hr_update_interval:
-            self._hr = sorted(self._hr_show_list)[len(self._hr_show_list) // 2]
-            # use set_text method to update the text, view (screen) will auto refresh
-            if self._countdown is not None:  # countdown mode
-                hr_text = str(self._hr) + " BPM  " + str(self._countdown) + "s"
-            else:
-                hr_text = str(self._hr) + " BPM"
+        self._hr = sorted(self._hr_show_list)[len(self._hr_show_list) // 2]
+        # only the changed digits are redrawn, view (screen) will auto refresh
+        self._numberview_hr.set_value(self._hr)
+        self._hr_show_list.clear()
 
-            self._textview_hr.set_text(hr_text)
-            self._hr_show_list.clear()
+    def _countdown_due(self):
+        return self._countdown is not None
 
-        # countdown mode
-        if self._countdown is not None:
-            if self._last_count_down_time == 0 and len(self._ibi_list) > 2:
-                self._last_count_down_time = time.ticks_ms()
-
-            if self._last_count_down_time != 0 and time.ticks_diff(time.ticks_ms(), self._last_count_down_time) >= 1000:
-                self._countdown -= 1
-                self._last_count_down_time = time.ticks_ms()
-                if self._hr == 0:
-                    self._textview_hr.set_text("-- BPM  " + str(self._countdown) + "s")
-                else:
-                    self._textview_hr.set_text(str(self._hr) + " BPM  " + str(self._countdown) + "s")
-            if self._countdown <= 0:
-                self._heart_sensor.stop()
-                self._view.remove(self._graphview)
-                self._view.remove(self._textview_hr)
-                self._state_machine.set(state_code=self._state_machine.STATE_MEASURE_RESULT_CHECK,
-                                        args=[self._ibi_list])
-                return
-
-        # set maximum update interval, and skip when sensor fifo reaches 10 to avoid data piling
-        if (time.ticks_diff(time.ticks_ms(), self._last_graph_update_time) > self._graph_update_interval and
-                self._heart_sensor.sensor_fifo.count() < 10):
-            self._last_graph_update_time = time.ticks_ms()
-            self._graphview.set_value(self._heart_sensor.read(),
-                                      self._ibi_calculator.get_window_min(), self._ibi_calculator.get_window_max())
+    def _update_countdown(self):
+        if self._last_count_down_time == 0 and len(self._ibi_list) > 2:
+            self._last_count_down_time = time.ticks_ms()
+
+        if self._last_count_down_time != 0 and time.ticks_diff(time.ticks_ms(), self._last_count_down_time) >= 1000:
+            self._countdown -= 1
+            self._last_count_down_time = time.ticks_ms()
+            self._numberview_countdown.set_value(self._countdown)
+        if self._countdown <= 0:
+            self._heart_sensor.stop()
+            self._view.remove(self._graphview)
+            self._view.remove(self._numberview_hr)
+            self._view.remove(self._numberview_countdown)
+            self._exit()
+            self._state_machine.set(state_code=self._state_machine.STATE_MEASURE_RESULT_CHECK,
+                                    args=[self._ibi_list])
+            return True
+
+    def _graph_due(self):
+        # maximum update rate of the graph, it's deferred by the scheduler when samples pile up
+        return time.ticks_diff(time.ticks_ms(), self._last_graph_update_time) > self._graph_update_interval
+
+    def _update_graph(self):
+        self._last_graph_update_time = time.ticks_ms()
+        self._graphview.set_value(self._heart_sensor.read(),
+                                  self._ibi_calculator.get_window_min(), self._ibi_calculator.get_window_max())
+
+    def _poll_encoder(self):
         # keep watching rotary encoder press event
         event = self._rotary_encoder.get_event()
         if event == self._rotary_encoder.EVENT_PRESS:
             self._heart_sensor.stop()
             self._view.remove_all()
+            self._exit()
             self._state_machine.set(state_code=self._state_machine.STATE_MENU)
-            return
+            return True
@@ -1,11 +1,8 @@
-import time
-from src.utils import get_datetime
+from src.record import Result
 from src.result import dict2show_items
 from src.save_system import save_system
 from src.state import State
-from src.data_processing import calculate_hrv, get_kubios_analysis
-from src.res.pic_loading_circle import LoadingCircle
-import framebuf
+from src.data_processing import calculate_hrv, kubios_analysis_steps
 
 
 class MeasureResultCheck(State):
@@ -49,79 +46,82 @@ class MeasureResultCheck(State):
 class HRVAnalysis(State):
     def __init__(self, state_machine):
         super().__init__(state_machine)
+        self._ibi_list = []
+        self._loading = None
+        self._steps = None
 
     def enter(self, args):
-        ibi_list = args[0]
-        """start of loading animation"""
-        # the animation now is actually a fake one. It does nothing but block the system for a while
-        # also, it is ugly implemented, the reason to do this is just for fun. at least for now.
-        loading_circle = LoadingCircle()
-        ani_start_time = time.ticks_ms()
-        ani_refresh_time = time.ticks_ms()
-        ani_index = 0
-        self._display.text("loading", 35, 56, 1)
-        while time.ticks_diff(time.ticks_ms(), ani_start_time) < 1000:
-            if time.ticks_diff(time.ticks_ms(), ani_refresh_time) > 5:
-                buf = framebuf.FrameBuffer(loading_circle.seq[ani_index], 32, 32, framebuf.MONO_VLSB)
-                self._display.blit(buf, 48, 20)
-                self._display.show()
-                ani_index = (ani_index + 1) % len(loading_circle.seq)
-                ani_refresh_time = time.ticks_ms()
-        """end of loading animation"""
-        hr, ppi, rmssd, sdnn = calculate_hrv(ibi_list)
-        self._display.fill_rect(0, 14, 128, 50, 0)  # clear loading animation
+        self._ibi_list = args[0]
+        self._loading = self._view.add_loading("loading")
+        self._steps = self._analyse()
+
+    def next_loop_ms(self):
+        return 0  # work in progress until the state is switched
+
+    def loop(self):
+        # one step of the work per loop, the loading animation is advanced by view.refresh() in between
+        try:
+            next(self._steps)
+        except StopIteration:
+            self._steps = None
+
+    def _analyse(self):
+        hr, ppi, rmssd, sdnn = calculate_hrv(self._ibi_list)
         # save data
-        result = {"DATE": get_datetime(),
-                  "HR": str(hr) + "BPM",
-                  "IBI": str(ppi) + "ms",
-                  "RMSSD": str(rmssd) + "ms",
-                  "SDNN": str(sdnn) + "ms"}
-        save_system(result)
+        result = Result.from_values(hr, ppi, rmssd, sdnn)
+        save_system(result, self._ibi_list)  # with the IBIs, to analyse the session again later
+        yield
         show_items = dict2show_items(result)
-        # send to mqtt
-        mqtt_success = self._state_machine.data_network.mqtt_publish(result)
-        if not mqtt_success:
+        # send to mqtt, in the network task with the asyncio runtime
+        sent = []
+        self._state_machine.submit_io(self._data_network.mqtt_publish, [result], sent.append)
+        while not sent:
+            yield
+        if not sent[0]:
             show_items.extend(["---", "MQTT not sent", "Please connect", "in settings"])
+        self._view.remove(self._loading)
         self._state_machine.set(state_code=self._state_machine.STATE_SHOW_RESULT, args=[show_items])
         self._rotary_encoder.enable_press()  # resume after process done
 
-    def loop(self):
-        return
-
 
 class KubiosAnalysis(State):
     def __init__(self, state_machine):
         super().__init__(state_machine)
         self._ibi_list = []
         self._listview_retry = None
+        self._loading = None
+        self._steps = None
 
     def enter(self, args):
         self._ibi_list = args[0]
-        """start of loading animation"""
-        # the animation now is actually a fake one. It does nothing but block the system for a while
-        # also, it is ugly implemented, the reason to do this is just for fun. at least for now.
-        loading_circle = LoadingCircle()
-        ani_start_time = time.ticks_ms()
-        ani_refresh_time = time.ticks_ms()
-        ani_index = 0
-        self._display.text("loading", 35, 56, 1)
-        while time.ticks_diff(time.ticks_ms(), ani_start_time) < 1000:
-            if time.ticks_diff(time.ticks_ms(), ani_refresh_time) > 5:
-                buf = framebuf.FrameBuffer(loading_circle.seq[ani_index], 32, 32, framebuf.MONO_VLSB)
-                self._display.blit(buf, 48, 20)
-                self._display.show()
-                ani_index = (ani_index + 1) % len(loading_circle.seq)
-                ani_refresh_time = time.ticks_ms()
-        """end of loading animation"""
-        kubios_success, result = get_kubios_analysis(self._ibi_list)
-        self._display.fill_rect(0, 14, 128, 50, 0)  # clear loading animation
+        self._loading = self._view.add_loading("loading")
+        self._steps = self._analyse()
+
+    def _analyse(self):
+        kubios_steps = kubios_analysis_steps(self._ibi_list)
+        step = None
+        while step is None:
+            # the next step blocks on network, let the current loading frame reach the screen first
+            while self._display.is_update_pending():
+                yield
+            # then run it in the network task with the asyncio runtime, the loading animation goes on meanwhile
+            done = []
+            self._state_machine.submit_io(next, [kubios_steps], done.append)
+            while not done:
+                yield
+            step = done[0]
+        kubios_success, result = step
+        self._view.remove(self._loading)
         if kubios_success:
             # success, save and goto show result
-            save_system(result)
+            save_system(result, self._ibi_list)
             show_items = dict2show_items(result)
-            # send to mqtt
-            mqtt_success = self._state_machine.data_network.mqtt_publish(result)
-            if not mqtt_success:
+            # send to mqtt, in the network task with the asyncio runtime
+            sent = []
+            self._state_machine.submit_io(self._data_network.mqtt_publish, [result], sent.append)
+            while not sent:
+                yield
+            if not sent[0]:
                 show_items.extend(["---", "MQTT not sent", "Please connect", "in settings"])
             self._state_machine.set(state_code=self._state_machine.STATE_SHOW_RESULT, args=[show_items])
             return
@@ -133,7 +133,17 @@ class KubiosAnalysis(State):
             self._listview_retry = self._view.add_list(items=["Try again", "Show HRV result"], y=44)
         self._rotary_encoder.enable_press()
 
+    def next_loop_ms(self):
+        return 0 if self._steps is not None else None
+
     def loop(self):
+        if self._steps is not None:
+            # analysis in progress, one step per loop
+            try:
+                next(self._steps)
+            except StopIteration:
+                self._steps = None
+            return
         # send failed, retry or show HRV result
         event = self._rotary_encoder.get_event()
         if event == self._rotary_encoder.EVENT_ROTATE:
@@ -1,6 +1,6 @@
 import network
-from src.utils import GlobalSettings, print_log
-import json
+from src.utils import GlobalSettings
+from src import log
 from umqtt.simple import MQTTClient
 
 
@@ -18,17 +18,18 @@ class PicoNetwork:
         try:
             self._mqtt_client.connect(clean_session=True)
         except:
+            log.warning("MQTT connect failed: %s", GlobalSettings.mqtt_broker_ip)
             return False
         return True
 
     def mqtt_publish(self, result):
-        measurement = {"mean_hr": result["HR"], "mean_ppi": result["IBI"],
-                       "rmssd": result["RMSSD"], "sdnn": result["SDNN"]}
+        """Publish a record.Result, as numbers without units, see Result.to_payload()"""
         topic = "hwp/measurement"
-        message = json.dumps(measurement)
+        message = result.to_payload()
         try:
             self._mqtt_client.publish(topic, message)
         except:
+            log.warning("MQTT publish failed")
             return False
         return True
 
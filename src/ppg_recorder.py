@@ -0,0 +1,256 @@
+"""
+Raw PPG recording, to tune the peak detection on waveforms from the field: the samples of the heart sensor are
+written to flash as they are, instead of being turned into IBIs and dropped.
+
+    Recordings/00000001.ppg, 00000002.ppg, ...   one file per recording, numbered in order
+
+File: a header, then blocks of samples. All integers little endian.
+    header: magic b"HWPG", version u8, reserved u8, sampling rate u16 (Hz), start time u32 (seconds since 2000),
+            block size u16 (samples), reserved u16
+    block: sequence number u32, sample count u16, dropped u16, CRC32 u32 of the samples, then the samples u16
+Samples are the 14-bit values of HeartSensor (read_u16() >> 2). Every block but the last one is full.
+'dropped' is the number of samples the sensor fifo dropped while the block was filled, because it was full,
+so the samples of that block are not evenly spaced. A block cut short by a power loss, or with a wrong CRC,
+ends the recording when it's read, see read_blocks().
+
+Writing: sensor() moves the samples from the sensor fifo into one of two RAM blocks. When a block is full, the
+samples go on into the other one until the fifo is empty, then the full block is written with one write() of its
+header and one of its samples, so the file system gets one large sequential write per block instead of a small
+one per sample. The fifo being empty before the write, all its 100 samples (400 ms at 250 Hz) are left to take
+the time of the write, including an erase of the flash on the way. The longest write is shown with the drops.
+
+Replay on the host: host/replay_ppg.py, and Board.play_recording() feeds a recording to the simulated sensor.
+"""
+import array
+import os
+import struct
+import time
+from binascii import crc32
+from src import log
+from src.state import State
+from src.utils import pico_rom_stat, get_timestamp
+
+RECORD_DIRECTORY = "Recordings"
+RECORDING_MAGIC = b"HWPG"
+RECORDING_VERSION = 1
+BLOCK_SAMPLES = 1024  # 4.1 s at 250 Hz, 2 KB: half a block of the file system
+MIN_FREE_KB = 100  # recording stops before the flash is too full to save results
+_HEADER_FORMAT = "<4sBBHIHH"
+_HEADER_SIZE = 16
+_BLOCK_FORMAT = "<IHHI"
+_BLOCK_HEADER_SIZE = 12
+
+
+def _recording_path(number):
+    return "{}/{:08d}.ppg".format(RECORD_DIRECTORY, number)
+
+
+def _next_number():
+    try:
+        names = os.listdir(RECORD_DIRECTORY)
+    except OSError:
+        os.mkdir(RECORD_DIRECTORY)
+        return 1
+    numbers = [int(name[:8]) for name in names if name.endswith(".ppg") and name[:8].isdigit()]
+    return max(numbers) + 1 if numbers else 1
+
+
+def read_header(file):
+    """Return (sampling rate, start time, block size) of a recording, ValueError if it's not one."""
+    header = file.read(_HEADER_SIZE)
+    if len(header) < _HEADER_SIZE:
+        raise ValueError("Not a PPG recording")
+    magic, version, _, rate, start_time, block_samples, _ = struct.unpack(_HEADER_FORMAT, header)
+    if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+        raise ValueError("Not a PPG recording of version {}".format(RECORDING_VERSION))
+    return rate, start_time, block_samples
+
+
+def read_blocks(file):
+    """Iterate (sequence number, dropped, samples) of the blocks after read_header(), samples as array('H').
+    Stops at the end of the file, or at a block cut short or with a wrong CRC."""
+    while True:
+        header = file.read(_BLOCK_HEADER_SIZE)
+        if len(header) < _BLOCK_HEADER_SIZE:
+            return
+        sequence, count, dropped, crc = struct.unpack(_BLOCK_FORMAT, header)
+        data = file.read(2 * count)
+        if len(data) < 2 * count or crc32(data) != crc:
+            log.warning("PPG block %d damaged", sequence)
+            return
+        samples = array.array("H", data)
+        yield sequence, dropped, samples
+
+
+class RecordPPG(State):
+    def __init__(self, state_machine):
+        super().__init__(state_machine)
+        self._fifo = self._heart_sensor.sensor_fifo
+        self._rate = self._heart_sensor.get_sampling_rate()
+        # two blocks: one is filled while the other one waits for its write, allocated once
+        self._blocks = (array.array("H", bytes(2 * BLOCK_SAMPLES)), array.array("H", bytes(2 * BLOCK_SAMPLES)))
+        self._block_dropped = [0, 0]
+        self._block_header = bytearray(_BLOCK_HEADER_SIZE)
+        self._active = 0  # block being filled
+        self._count = 0  # samples in the active block
+        self._full = -1  # block waiting for its write, -1 if none
+        # recording
+        self._file = None
+        self._name = ""
+        self._sequence = 0
+        self._samples = 0  # samples written
+        self._dropped = 0  # samples dropped by the fifo
+        self._dropped_base = 0  # drop count of the fifo when the active block was started
+        self._write_max_us = 0
+        self._stop_reason = None  # set by sensor() when it can't go on, loop() stops the recording
+        # placeholders for ui
+        self._textview_name = None
+        self._textview_time = None
+        self._textview_dropped = None
+        self._textview_write = None
+        self._textview_press = None
+        self._last_update_time = 0
+
+    def enter(self, args):
+        self._view.remove_all()  # clear screen
+        self._view.add_text(text="Record PPG", x=0, y=0, invert=True)
+        self._rotary_encoder.enable_press()
+        self._file = None
+        if pico_rom_stat() < MIN_FREE_KB:
+            self._show_error("Storage full")
+            return
+        try:
+            number = _next_number()
+            self._name = "{:08d}.ppg".format(number)
+            self._file = open(_recording_path(number), "wb")
+            self._file.write(struct.pack(_HEADER_FORMAT, RECORDING_MAGIC, RECORDING_VERSION, 0, self._rate,
+                                         get_timestamp(), BLOCK_SAMPLES, 0))
+        except OSError as e:
+            log.error("Recording not started: %s", e)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._show_error("Storage error")
+            return
+        self._active = 0
+        self._count = 0
+        self._full = -1
+        self._sequence = 0
+        self._samples = 0
+        self._dropped = 0
+        self._dropped_base = self._fifo.dropped()
+        self._write_max_us = 0
+        self._stop_reason = None
+        self._textview_name = self._view.add_text(text=self._name, x=0, y=14)
+        self._textview_time = self._view.add_text(text="Time: 0s", x=0, y=24)
+        self._textview_dropped = self._view.add_text(text="Dropped: 0", x=0, y=34)
+        self._textview_write = self._view.add_text(text="Write: 0ms", x=0, y=44)
+        self._textview_press = self._view.add_text(text="Press to stop", x=0, y=56)
+        self._last_update_time = time.ticks_ms()
+        log.info("Recording %s", self._name)
+        self._heart_sensor.start()
+
+    def _show_error(self, text):
+        self._view.add_text(text=text, x=0, y=14)
+        self._textview_press = self._view.add_text(text="Press to exit", x=0, y=56)
+
+    def sensor(self):
+        if self._file is None or self._stop_reason is not None:
+            return
+        fifo = self._fifo
+        block = self._blocks[self._active]
+        count = self._count
+        while fifo.has_data():
+            block[count] = fifo.get()
+            count += 1
+            if count == BLOCK_SAMPLES:
+                self._close_block()
+                block = self._blocks[self._active]
+                count = 0
+        self._count = count
+        if self._full >= 0:
+            # the fifo is empty now, it takes the samples arriving during the write
+            if self._write_block(self._full, BLOCK_SAMPLES):
+                self._full = -1  # otherwise it stays pending, counted as lost by _stop()
+
+    def next_loop_ms(self):
+        if self._file is None:
+            return None
+        return max(0, 1000 - time.ticks_diff(time.ticks_ms(), self._last_update_time))
+
+    def loop(self):
+        event = self._rotary_encoder.get_event()
+        if self._file is None:
+            if event == self._rotary_encoder.EVENT_PRESS:
+                self._view.remove_all()
+                self._state_machine.set(state_code=self._state_machine.STATE_MENU)
+            return
+        if event == self._rotary_encoder.EVENT_PRESS or self._stop_reason is not None:
+            self._stop()
+            return
+        if time.ticks_diff(time.ticks_ms(), self._last_update_time) >= 1000:
+            self._last_update_time = time.ticks_ms()
+            self._update_texts()
+
+    def _update_texts(self):
+        self._textview_time.set_text("Time: {}s".format((self._samples + self._count) // self._rate))
+        self._textview_dropped.set_text("Dropped: {}".format(self._dropped + self._fifo.dropped() - self._dropped_base))
+        self._textview_write.set_text("Write: {}ms".format(self._write_max_us // 1000))
+
+    def _close_block(self):
+        """The active block is full: it waits for its write, the samples go on into the other one."""
+        dropped = self._fifo.dropped()
+        self._block_dropped[self._active] = dropped - self._dropped_base
+        self._dropped_base = dropped
+        self._full = self._active
+        self._active ^= 1
+
+    def _write_block(self, index, count):
+        """Write a block to the file, return False if the write failed, which stops the recording."""
+        samples = self._blocks[index]
+        if count < BLOCK_SAMPLES:
+            samples = memoryview(samples)[:count]
+        struct.pack_into(_BLOCK_FORMAT, self._block_header, 0, self._sequence, count,
+                         min(self._block_dropped[index], 0xffff), crc32(samples))
+        start = time.ticks_us()
+        try:
+            self._file.write(self._block_header)
+            self._file.write(samples)
+            self._file.flush()  # a power loss loses one block at most
+        except OSError as e:
+            log.error("Recording write failed: %s", e)
+            self._stop_reason = "Write failed"
+            return False
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        if elapsed > self._write_max_us:
+            self._write_max_us = elapsed
+        self._sequence += 1
+        self._samples += count
+        self._dropped += self._block_dropped[index]
+        if pico_rom_stat() < MIN_FREE_KB:
+            self._stop_reason = "Storage full"
+        return True
+
+    def _stop(self):
+        self.sensor()  # the samples still in the fifo, stop() clears it
+        lost = 0
+        if self._stop_reason is not None:
+            # nothing more is written: the block waiting for its write, the active one and the fifo are lost
+            lost = (BLOCK_SAMPLES if self._full >= 0 else 0) + self._count + self._fifo.count()
+        self._heart_sensor.stop()
+        if self._stop_reason is None and self._count:
+            self._close_block()
+            if not self._write_block(self._full, self._count):
+                lost = self._count
+        if lost:
+            log.warning("Recording stopped (%s): %d samples lost", self._stop_reason, lost)
+        self._full = -1
+        self._count = 0
+        self._file.close()
+        self._file = None
+        log.info("Recorded %s: %d samples, %d dropped, write max %d us",
+                 self._name, self._samples, self._dropped, self._write_max_us)
+        self._update_texts()
+        if self._stop_reason is not None:
+            self._textview_name.set_text(self._stop_reason)
+        self._textview_press.set_text("Press to exit")
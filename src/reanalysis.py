@@ -0,0 +1,54 @@
+"""
+Batch re-analysis of saved sessions from their IBI series, e.g. after an improvement of calculate_hrv(),
+or to get the Kubios analysis of sessions whose Kubios request failed and were saved as HRV results.
+Sessions are streamed from flash one at a time, see save_system.iter_sessions(), so the history size doesn't matter.
+
+On the device, from the REPL after Ctrl-C:
+    >>> from src.reanalysis import reanalyse
+    >>> reanalyse()                         # HRV again, prints the saved and the new values
+    >>> reanalyse(kubios=True, save=True)   # Kubios for sessions without it, replacing their saved results
+On the host, for the history copied from the device, see host/reanalyse.py.
+"""
+from src.data_processing import calculate_hrv, kubios_analysis_steps
+from src.record import Result, format_hundredths
+from src.save_system import iter_sessions, update_record
+from src import log
+
+
+def reanalysis_steps(kubios=False):
+    """Generator of (record id, saved Result, new Result or None if the analysis failed), newest session first.
+    kubios: Kubios analysis of the sessions that have no Kubios result yet, otherwise HRV of all sessions"""
+    for record_id, saved, ibi in iter_sessions():
+        if kubios:
+            if saved.is_kubios():
+                continue
+            step = None
+            for step in kubios_analysis_steps(list(ibi)):
+                pass
+            success, result = step
+            if success:
+                result.timestamp = saved.timestamp
+            yield record_id, saved, result if success else None
+        else:
+            hr, ppi, rmssd, sdnn = calculate_hrv(ibi)
+            yield record_id, saved, Result.from_values(hr, ppi, rmssd, sdnn, timestamp=saved.timestamp)
+
+
+def reanalyse(kubios=False, save=False):
+    """Print the saved and the new HR, RMSSD and SDNN of each session, replace the saved results
+    by the new ones if 'save', in place, so they keep their IBI series and are not counted twice.
+    Return the number of sessions analysed."""
+    count = 0
+    print("{:>6} {:>16} {:>16} {:>16}".format("record", "HR", "RMSSD", "SDNN"))
+    for record_id, saved, result in reanalysis_steps(kubios):
+        count += 1
+        if result is None:
+            print("{:>6} failed".format(record_id))
+            continue
+        print("{:>6} {:>16} {:>16} {:>16}".format(
+            record_id, *["{}>{}".format(format_hundredths(old), format_hundredths(new)) for old, new in
+                         ((saved.hr, result.hr), (saved.rmssd, result.rmssd), (saved.sdnn, result.sdnn))]))
+        if save:
+            update_record(record_id, result)
+    log.info("Re-analysed %d sessions", count)
+    return count
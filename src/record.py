@@ -0,0 +1,134 @@
+"""
+Result of an analysis as numbers: created by HRV and Kubios analysis, saved to the history log,
+sent over MQTT and formatted to text only for the screen, see result.dict2show_items().
+
+Values are integer hundredths, e.g. hr 7245 is 72.45 BPM, the precision the analysis rounds to,
+so they are stored and compared without float rounding. The time is seconds since 2000, see utils.to_timestamp().
+
+Binary form (pack), 28 bytes little endian, the history log adds a CRC32, see save_system:
+    timestamp u32, schema version u8, flags u8 (bit 0: Kubios),
+    HR u16, IBI u32, RMSSD u32, SDNN u32, SNS i16, PNS i16, stress u16, reserved u16
+A change of the layout needs a new SCHEMA_VERSION, unpack() of another version raises ValueError.
+
+IBI series of a session (pack_ibi): the first IBI, then the difference of each IBI to the previous one,
+zigzag encoded (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...) and written as varint, 7 bits per byte, low bits first,
+high bit set on all but the last byte. Neighbouring IBIs differ by tens of ms, so most take one byte instead of two.
+"""
+import array
+import json
+import struct
+from src.utils import get_timestamp, parse_datetime
+
+SCHEMA_VERSION = 1
+_FORMAT = "<IBBHIIIhhHH"
+PACKED_SIZE = 28
+_FLAG_KUBIOS = 1
+
+
+def _hundredths(value, low, high):
+    value = int(round(value * 100))
+    return low if value < low else high if value > high else value
+
+
+def format_hundredths(value):
+    """Text of a value in hundredths like str(round(x, 2)) of the float, without float: 7250 -> "72.5\""""
+    text = "{}{}.{:02d}".format("-" if value < 0 else "", abs(value) // 100, abs(value) % 100)
+    return text[:-1] if text.endswith("0") else text
+
+
+class Result:
+    def __init__(self, timestamp, hr, ibi, rmssd, sdnn, sns=None, pns=None, stress=None):
+        """All values in hundredths, sns, pns and stress only for a Kubios analysis."""
+        self.timestamp = timestamp
+        self.hr = hr
+        self.ibi = ibi
+        self.rmssd = rmssd
+        self.sdnn = sdnn
+        self.sns = sns
+        self.pns = pns
+        self.stress = stress
+
+    @classmethod
+    def from_values(cls, hr, ibi, rmssd, sdnn, sns=None, pns=None, stress=None, timestamp=None):
+        """Result of analysis values as numbers in their units, timestamped now by the RTC if not given."""
+        kubios = sns is not None
+        return cls(get_timestamp() if timestamp is None else timestamp,
+                   _hundredths(hr, 0, 0xffff), _hundredths(ibi, 0, 0xffffffff),
+                   _hundredths(rmssd, 0, 0xffffffff), _hundredths(sdnn, 0, 0xffffffff),
+                   _hundredths(sns, -0x8000, 0x7fff) if kubios else None,
+                   _hundredths(pns, -0x8000, 0x7fff) if kubios else None,
+                   _hundredths(stress, 0, 0xffff) if kubios else None)
+
+    @classmethod
+    def from_legacy_dict(cls, data):
+        """Result of a dict of text values saved by earlier versions, e.g. {"HR": "72.45BPM", ...}"""
+
+        def number(key, unit=""):
+            text = data[key]
+            return float(text[:-len(unit)] if unit and text.endswith(unit) else text)
+
+        kubios = "SNS" in data
+        return cls.from_values(number("HR", "BPM"), number("IBI", "ms"), number("RMSSD", "ms"), number("SDNN", "ms"),
+                               number("SNS") if kubios else None, number("PNS") if kubios else None,
+                               number("STRESS") if kubios else None, timestamp=parse_datetime(data["DATE"]))
+
+    def is_kubios(self):
+        return self.sns is not None
+
+    def pack(self):
+        kubios = self.is_kubios()
+        return struct.pack(_FORMAT, self.timestamp, SCHEMA_VERSION, _FLAG_KUBIOS if kubios else 0,
+                           self.hr, self.ibi, self.rmssd, self.sdnn,
+                           self.sns if kubios else 0, self.pns if kubios else 0, self.stress if kubios else 0, 0)
+
+    @classmethod
+    def unpack(cls, buffer):
+        timestamp, version, flags, hr, ibi, rmssd, sdnn, sns, pns, stress, _ = struct.unpack_from(_FORMAT, buffer)
+        if version != SCHEMA_VERSION:
+            raise ValueError("Unknown result schema version: {}".format(version))
+        if flags & _FLAG_KUBIOS:
+            return cls(timestamp, hr, ibi, rmssd, sdnn, sns, pns, stress)
+        return cls(timestamp, hr, ibi, rmssd, sdnn)
+
+    def to_payload(self):
+        """Compact JSON of the MQTT message: numbers in their units, no unit suffixes, schema version in "v"."""
+        return json.dumps({"v": SCHEMA_VERSION, "ts": self.timestamp, "mean_hr": self.hr / 100,
+                           "mean_ppi": self.ibi / 100, "rmssd": self.rmssd / 100, "sdnn": self.sdnn / 100},
+                          separators=(",", ":"))
+
+
+def pack_ibi(ibi_list):
+    """Compressed bytes of a series of IBIs (ms, 0..65535), see the module doc."""
+    out = bytearray()
+    previous = 0
+    for ibi in ibi_list:
+        delta = ibi - previous
+        previous = ibi
+        value = delta * 2 if delta >= 0 else -delta * 2 - 1
+        while value >= 0x80:
+            out.append(value & 0x7f | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def unpack_ibi(data, count):
+    """array('H') of 'count' IBIs of bytes of pack_ibi(), ValueError if the data is short."""
+    ibi = array.array("H", bytes(2 * count))
+    previous = 0
+    position = 0
+    for index in range(count):
+        value = 0
+        shift = 0
+        while True:
+            if position >= len(data):
+                raise ValueError("IBI data too short")
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7f) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        previous += value >> 1 if not value & 1 else -((value + 1) >> 1)
+        ibi[index] = previous
+    return ibi
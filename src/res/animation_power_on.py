@@ -4,2149 +4,113 @@ from src.hardware import Display
 
 
 class PowerOnAnimation:
+    """Plays the power-on animation from src/res/animation_power_on.hwa, see tools/anim_codec.py for the format.
+    Images are decoded one at a time from the file into one reused 1 KB buffer, so the RAM usage doesn't depend
+    on the number of frames. Order of images in the file: "HeartWave" title, Pico frames, heart."""
+    _FILE = "src/res/animation_power_on.hwa"
+    _FLAG_DELTA = 1
+    # offsets of each image in the frame buffer, MONO_VLSB: width * pages
+    _HEARTWAVE = 0  # 122 x 27
+    _PICO = 122 * 4  # 61 x 29
+    _HEART = _PICO + 61 * 4  # 15 x 13
+
     def __init__(self):
-        self._power_on_heart = bytearray([
-            # // font edit begin : monovlsb : 15 : 13 : 15
-            0x3C, 0xFE, 0xFF, 0xFF, 0xFF, 0xFE, 0xFC, 0xFC,
-            0xFC, 0xFE, 0xFF, 0xFF, 0xFF, 0xFE, 0x3C, 0x00,
-            0x00, 0x01, 0x03, 0x07, 0x0F, 0x1F, 0x1F, 0x1F,
-            0x0F, 0x07, 0x03, 0x01, 0x00, 0x00
-            # // font edit end
-        ])
-        self._power_on_heartwave = bytearray([
-            # // font edit begin : monovlsb : 122 : 27 : 122
-            0x00, 0x00, 0x00, 0x00, 0xFC, 0xFF, 0xFF, 0x3F,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0xFC, 0xFF, 0xFF,
-            0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0xF0, 0xF0, 0xF0, 0x10, 0x00,
-            0x00, 0x00, 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00,
-            0x00, 0xE0, 0xFC, 0xFF, 0xFF, 0xFF, 0x00, 0x00,
-            0x00, 0xC0, 0xF8, 0xFF, 0x7F, 0x0F, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0xE0, 0xFF, 0xFF, 0xFF,
-            0x3F, 0x3C, 0x3C, 0x3C, 0x3C, 0xFC, 0xFF, 0xFF,
-            0xFF, 0x07, 0x00, 0x00, 0x80, 0xF0, 0xF8, 0xFC,
-            0x1E, 0x0E, 0x06, 0x0E, 0xFE, 0xFE, 0xF8, 0x00,
-            0x00, 0x80, 0xF0, 0xFC, 0xFE, 0x1E, 0x0E, 0x0E,
-            0x0E, 0xFC, 0xFE, 0xFE, 0x3E, 0x00, 0x00, 0x00,
-            0xF0, 0xFE, 0xFE, 0x7E, 0x18, 0x0C, 0x0E, 0x0E,
-            0x00, 0x00, 0x04, 0xC6, 0xFE, 0xFF, 0xFF, 0x07,
-            0x06, 0x02, 0x00, 0x00, 0xFF, 0xFF, 0xFF, 0x00,
-            0xE0, 0xFC, 0xFF, 0x1F, 0x03, 0xFF, 0xFF, 0xFF,
-            0x00, 0xF0, 0xFE, 0xFF, 0x1F, 0x03, 0x00, 0x80,
-            0xF0, 0xFC, 0xFE, 0x1E, 0x0E, 0x0E, 0x0E, 0xFC,
-            0xFE, 0xFE, 0x3E, 0x00, 0x00, 0x02, 0xFE, 0xFE,
-            0xFE, 0x00, 0x00, 0x80, 0xE0, 0xFC, 0x7E, 0x1E,
-            0x06, 0x80, 0xF0, 0xF8, 0xFC, 0x1E, 0x0E, 0x06,
-            0x0E, 0xFE, 0xFE, 0xF8, 0x00, 0xF8, 0xFF, 0xFF,
-            0x7F, 0x01, 0x00, 0x00, 0x00, 0x00, 0xF8, 0xFF,
-            0xFF, 0x7F, 0x01, 0x00, 0x00, 0xF0, 0xFF, 0xFF,
-            0xFF, 0x07, 0x07, 0x07, 0x87, 0xE7, 0xE7, 0x67,
-            0x07, 0x00, 0xF0, 0xFF, 0xFF, 0xFF, 0x01, 0x00,
-            0x00, 0xC0, 0xF8, 0xFF, 0xFF, 0x0F, 0x00, 0x00,
-            0x00, 0xFC, 0xFF, 0xFF, 0x0F, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0xF0, 0xFF, 0xFF, 0x3F,
-            0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF, 0xFF,
-            0xFF, 0xFE, 0x3F, 0x07, 0x00, 0x00, 0x00, 0xFF,
-            0xFF, 0xFB, 0xFF, 0x1F, 0x03, 0x00, 0x00, 0x00,
-            0xF0, 0xFF, 0xFF, 0xFF, 0x01, 0x00, 0x00, 0xC0,
-            0xF8, 0xFF, 0xFF, 0x0F, 0x00, 0x00, 0x00, 0x00,
-            0x1F, 0xFF, 0xFF, 0xE0, 0xFC, 0x3F, 0x0F, 0x01,
-            0x00, 0x00, 0xF0, 0xFF, 0xFF, 0xFF, 0x07, 0x07,
-            0x07, 0x87, 0xE7, 0xE7, 0x67, 0x07, 0x06, 0x07,
-            0x07, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06,
-            0x07, 0x07, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x03, 0x07, 0x07, 0x07, 0x07, 0x07, 0x07, 0x03,
-            0x01, 0x00, 0x00, 0x00, 0x00, 0x07, 0x07, 0x07,
-            0x07, 0x07, 0x03, 0x07, 0x07, 0x07, 0x03, 0x00,
-            0x00, 0x00, 0x07, 0x07, 0x07, 0x03, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x07, 0x07,
-            0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x07, 0x07, 0x07, 0x01, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x07, 0x07, 0x07, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x07, 0x07, 0x07, 0x07, 0x07,
-            0x03, 0x07, 0x07, 0x07, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x07, 0x07, 0x07, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x07, 0x07,
-            0x07, 0x07, 0x07, 0x07, 0x03, 0x01, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico0 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico1 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x70,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico2 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x02, 0x03, 0x03, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico3 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x38,
-            0x3E, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico4 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x01, 0x01, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico5 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x1C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico6 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico7 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xE0, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico8 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0x70, 0x70, 0x60,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico9 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x06, 0x0F, 0x0F, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico10 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x40, 0x60,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico11 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x02, 0x03, 0x07, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico12 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x08, 0x0C,
-            0x0C, 0x0E, 0x07, 0x07, 0x03, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico13 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico14 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico15 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0x38,
-            0x1E, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico16 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0x30,
-            0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0x38,
-            0x1E, 0x0F, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico17 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0x38,
-            0x1E, 0x0F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico18 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x0F, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico19 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico20 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0x3C,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico21 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0x40, 0x20, 0x10,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0x3C,
-            0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico22 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0x40, 0x20, 0x10,
-            0x10, 0x10, 0x18, 0x18, 0x10, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0x3C,
-            0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico23 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0x40, 0x20, 0x10,
-            0x10, 0x10, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0x3C,
-            0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico24 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0x3C,
-            0x07, 0x03, 0x01, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico25 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0x7C,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico26 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico27 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x04, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico28 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0x80, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico29 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0x78, 0x1C, 0x08, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico30 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0x78, 0x1C, 0x0F, 0x03,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico31 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0x70, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0x78, 0x1C, 0x0F, 0x03,
-            0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico32 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0x78, 0x1C, 0x0F, 0x07,
-            0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico33 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0x78, 0x3C, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico34 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico35 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico36 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x08,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico37 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico38 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC0, 0xE0, 0xC0, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico39 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC0, 0xF0, 0xFC, 0x30,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico40 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC0, 0xF0, 0xFC, 0x3F,
-            0x0E, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico41 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x00,
-            0x00, 0x00, 0xC0, 0xC0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC0, 0xF0, 0xFC, 0x3F,
-            0x0F, 0x01, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico42 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0x08,
-            0x08, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC0, 0xF0, 0xFC, 0x3F,
-            0x0F, 0x01, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico43 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC0, 0xF0, 0xFC, 0x3F,
-            0x0F, 0x01, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico44 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico45 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico46 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico47 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico48 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico49 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico50 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico51 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico52 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico53 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico54 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico55 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico56 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
-        power_on_pico57 = bytearray([
-            # // font edit begin : monovlsb : 61 : 29 : 61
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0xF8, 0x60, 0x20, 0x10, 0x10, 0xF0, 0xF0, 0xE0,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xE0, 0xF0,
-            0x20, 0x06, 0x0F, 0x06, 0x80, 0xC0, 0xE0, 0xF0,
-            0x70, 0x30, 0x18, 0x98, 0xF0, 0xE0, 0x00, 0x00,
-            0x00, 0x00, 0x80, 0xC0, 0xE0, 0xF0, 0x70, 0xF8,
-            0xF8, 0x38, 0xF0, 0xE0, 0x80, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xF0, 0xF8,
-            0xFE, 0x1F, 0x0F, 0x03, 0x01, 0x00, 0xC0, 0xE0,
-            0xF8, 0x7E, 0x3F, 0x0F, 0x81, 0xC0, 0xF0, 0xF8,
-            0x7E, 0x1F, 0x0F, 0x03, 0x01, 0xE0, 0xF8, 0xFC,
-            0x3F, 0x0F, 0x07, 0x01, 0x00, 0x00, 0x00, 0x1F,
-            0x0F, 0x87, 0xC1, 0xE0, 0xF8, 0xFC, 0x3F, 0x0F,
-            0x03, 0x01, 0x00, 0x80, 0xC1, 0xF3, 0xFE, 0x3F,
-            0x0F, 0x05, 0x00, 0x00, 0x80, 0xE0, 0xF0, 0x7C,
-            0x1E, 0x0F, 0x07, 0x01, 0x07, 0x0C, 0x18, 0x1C,
-            0x1C, 0x1E, 0x17, 0x17, 0x1B, 0x08, 0x0C, 0x04,
-            0x07, 0x0F, 0x1F, 0x1F, 0x10, 0x10, 0x08, 0x0C,
-            0x06, 0x03, 0x03, 0x0F, 0x0F, 0x18, 0x10, 0x10,
-            0x10, 0x08, 0x08, 0x0C, 0x06, 0x03, 0x01, 0x00,
-            0x0F, 0x0F, 0x10, 0x10, 0x18, 0x18, 0x0C, 0x0E,
-            0x07, 0x03, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18,
-            0x1E, 0x07, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00
-            # // font edit end
-        ])
+        self._buf = bytearray(1024)
+        self._read_buf = bytearray(512)  # compressed data of one image, at most raw size + raw size / 128
+        self._read_mv = memoryview(self._read_buf)
 
-        self.seq = [power_on_pico0, power_on_pico1, power_on_pico2, power_on_pico3, power_on_pico4,
-                    power_on_pico5, power_on_pico6, power_on_pico7, power_on_pico8, power_on_pico9,
-                    power_on_pico10, power_on_pico11, power_on_pico12, power_on_pico13, power_on_pico14,
-                    power_on_pico15, power_on_pico16, power_on_pico17, power_on_pico18, power_on_pico19,
-                    power_on_pico20, power_on_pico21, power_on_pico22, power_on_pico23, power_on_pico24,
-                    power_on_pico25, power_on_pico26, power_on_pico27, power_on_pico28, power_on_pico29,
-                    power_on_pico30, power_on_pico31, power_on_pico32, power_on_pico33, power_on_pico34,
-                    power_on_pico35, power_on_pico36, power_on_pico37, power_on_pico38, power_on_pico39,
-                    power_on_pico40, power_on_pico41, power_on_pico42, power_on_pico43, power_on_pico44,
-                    power_on_pico45, power_on_pico46, power_on_pico47, power_on_pico48, power_on_pico49,
-                    power_on_pico50, power_on_pico51, power_on_pico52, power_on_pico53, power_on_pico54,
-                    power_on_pico55, power_on_pico56, power_on_pico57]
+    def play(self, display=None):
+        """Play the whole animation, returns when it's done."""
+        for _ in self.frames(display if display is not None else Display()):
+            pass
 
-    def play(self):
-        display = Display()
-        buf_heartwave = framebuf.FrameBuffer(self._power_on_heartwave, 122, 27, framebuf.MONO_VLSB)
-        for i in range(0, 64, 2):
-            display.blit(buf_heartwave, 2, 0)
-            display.fill_rect(63 + i, 0, 128 - 63 - i, 63, 0)
-            display.fill_rect(0, 0, 63 - i, 63, 0)
-            display.show()
+    def frames(self, display):
+        """Generator of the animation, yields after each frame shown, and while the last Pico frame is held.
+        The caller can do other work between the frames, e.g. the staged boot in src/boot.py.
+        The buffers are freed when the animation ends."""
+        try:
+            file = open(self._FILE, "rb")
+        except OSError:
+            self._free()
+            return  # missing, skip the animation rather than block booting
+        with file:
+            header = file.read(7)
+            if header[:4] != b"HWPA" or header[4] != 1:
+                self._free()
+                return  # unknown format, skip the animation rather than block booting
+            count = header[5] | header[6] << 8
+
+            buf_heartwave = self._read_image(file, self._HEARTWAVE)
+            for i in range(0, 64, 2):
+                display.blit(buf_heartwave, 2, 0)
+                display.fill_rect(63 + i, 0, 128 - 63 - i, 63, 0)
+                display.fill_rect(0, 0, 63 - i, 63, 0)
+                display.show()
+                yield
 
-        for i in range(len(self.seq)):
-            buf_pico = framebuf.FrameBuffer(self.seq[i], 61, 29, framebuf.MONO_VLSB)
-            display.blit(buf_pico, 63, 32)
+            for i in range(count - 2):
+                buf_pico = self._read_image(file, self._PICO)
+                display.blit(buf_pico, 63, 32)
+                display.show()
+                yield
+            hold_until = time.ticks_add(time.ticks_ms(), 500)
+            while time.ticks_diff(hold_until, time.ticks_ms()) > 0:
+                yield
+
+            buf_heart = self._read_image(file, self._HEART)
+            display.blit(buf_heart, 23, 40)
             display.show()
-        time.sleep_ms(500)
+        self._free()
+
+    def _free(self):
+        self._buf = None
+        self._read_buf = None
+        self._read_mv = None
 
-        buf_heart = framebuf.FrameBuffer(self._power_on_heart, 15, 13, framebuf.MONO_VLSB)
-        display.blit(buf_heart, 23, 40)
-        display.show()
-        del self._power_on_heartwave
-        del self._power_on_heart
-        del buf_heartwave
-        del buf_heart
-        for i in range(len(self.seq)):
-            self.seq[0] = None
-            del self.seq[0]
-        del self.seq
-        del display
+    def _read_image(self, file, offset):
+        """Decode the next image in the file into the frame buffer at offset, return a FrameBuffer of it.
+        A delta image is XOR-ed onto the previous image at the same offset."""
+        header = file.read(5)
+        width, height, flags = header[0], header[1], header[2]
+        length = header[3] | header[4] << 8
+        file.readinto(self._read_mv[:length])
+        size = width * ((height + 7) // 8)
+        self._unpack(length, offset, flags & self._FLAG_DELTA)
+        return framebuf.FrameBuffer(memoryview(self._buf)[offset:offset + size], width, height, framebuf.MONO_VLSB)
 
+    def _unpack(self, length, offset, delta):
+        # PackBits: c < 128: c + 1 literal bytes follow, c >= 128: next byte repeated c - 126 times
+        src = self._read_buf
+        dst = self._buf
+        i = 0
+        o = offset
+        while i < length:
+            c = src[i]
+            i += 1
+            if c < 128:
+                end = i + c + 1
+                if delta:
+                    while i < end:
+                        dst[o] ^= src[i]
+                        i += 1
+                        o += 1
+                else:
+                    while i < end:
+                        dst[o] = src[i]
+                        i += 1
+                        o += 1
+            else:
+                value = src[i]
+                i += 1
+                run = c - 126
+                if delta:
+                    if value:
+                        for _ in range(run):
+                            dst[o] ^= value
+                            o += 1
+                    else:
+                        o += run  # unchanged bytes, most of a delta frame
+                else:
+                    for _ in range(run):
+                        dst[o] = value
+                        o += 1
@@ -1,104 +0,0 @@
-icon_hr = bytearray([
-    # // font edit begin : monovlsb : 32 : 32 : 32
-    0x00, 0x00, 0x80, 0xC0, 0xE0, 0x70, 0x30, 0x38,
-    0x38, 0x38, 0x38, 0x38, 0x30, 0x70, 0xE0, 0xC0,
-    0xC0, 0xE0, 0x70, 0x30, 0x38, 0x38, 0x38, 0x38,
-    0x38, 0x30, 0x70, 0xE0, 0xC0, 0x80, 0x00, 0x00,
-    0x3C, 0xFF, 0xFF, 0x81, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01,
-    0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x81, 0xFF, 0xFF, 0x3C,
-    0x00, 0x00, 0x03, 0x07, 0x0E, 0x18, 0x38, 0x70,
-    0xE0, 0xC0, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0,
-    0x70, 0x38, 0x18, 0x0E, 0x07, 0x03, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x01, 0x03, 0x07, 0x0E, 0x1C, 0x18, 0x38,
-    0x38, 0x18, 0x1C, 0x0E, 0x07, 0x03, 0x01, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-    # // font edit end
-])
-
-icon_hrv = bytearray([
-    # // font edit begin : monovlsb : 32 : 32 : 32
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xF0,
-    0xF0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0xC0, 0xF0, 0x38,
-    0xF8, 0xF0, 0x00, 0x00, 0xE0, 0xFC, 0xFF, 0x03,
-    0x03, 0xFF, 0xF8, 0xE0, 0xF8, 0x7C, 0x1E, 0x7C,
-    0xF0, 0xC0, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
-    0x01, 0x03, 0x03, 0x03, 0x03, 0x03, 0x01, 0x00,
-    0x03, 0x1F, 0xFC, 0xF0, 0xFF, 0x1F, 0x01, 0x00,
-    0x00, 0x01, 0x03, 0x03, 0x00, 0x00, 0x00, 0x00,
-    0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x03, 0x07, 0x01, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-    # // font edit end
-])
-
-icon_kubios = bytearray([
-    # // font edit begin : monovlsb : 32 : 32 : 32
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0xC0, 0xE0, 0x70, 0x30, 0x30, 0x38, 0x38, 0x38,
-    0x38, 0x30, 0x70, 0xE0, 0xC0, 0xC0, 0xC0, 0x80,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x80, 0xE0, 0xF0, 0x70, 0x18, 0x1C, 0x0E, 0x0F,
-    0x07, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x01, 0x01, 0x01, 0x03,
-    0x0F, 0x0F, 0x1C, 0x1C, 0x38, 0xF0, 0xE0, 0xC0,
-    0x07, 0x0F, 0x0F, 0x38, 0x30, 0x30, 0x30, 0x70,
-    0x70, 0x60, 0x08, 0x0C, 0xFE, 0xFE, 0x0C, 0x08,
-    0x80, 0x80, 0xFE, 0xFE, 0x80, 0x80, 0x30, 0x70,
-    0x70, 0x70, 0x30, 0x30, 0x38, 0x0F, 0x0F, 0x03,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x03, 0x03, 0x00, 0x00,
-    0x00, 0x01, 0x03, 0x03, 0x01, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-    # // font edit end
-])
-
-icon_history = bytearray([
-    # // font edit begin : monovlsb : 32 : 32 : 32
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0xC0, 0xE0,
-    0x70, 0x30, 0x30, 0x30, 0x30, 0x30, 0x30, 0x30,
-    0x30, 0x30, 0x30, 0x30, 0x30, 0x30, 0x30, 0x70,
-    0xE0, 0xC0, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0xF0, 0xF8, 0x5C, 0x4E, 0x47, 0x43, 0x41, 0x40,
-    0x40, 0x48, 0x49, 0xC9, 0xC9, 0x09, 0x09, 0x09,
-    0x09, 0x09, 0x09, 0xC9, 0xC9, 0x49, 0x48, 0x40,
-    0x40, 0x41, 0x43, 0x47, 0x4E, 0x5C, 0xF8, 0xF0,
-    0xFF, 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x01, 0x07, 0x06, 0x0E, 0x0C,
-    0x0C, 0x0E, 0x06, 0x07, 0x01, 0x00, 0x00, 0x00,
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF, 0xFF,
-    0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03,
-    0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03,
-    0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03,
-    0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03, 0x03
-    # // font edit end
-])
-
-icon_settings = bytearray([
-    # // font edit begin : monovlsb : 32 : 32 : 32
-    0x00, 0x00, 0x80, 0xC0, 0x60, 0x60, 0x60, 0xC0,
-    0xC0, 0x60, 0x30, 0x3E, 0x1F, 0x03, 0x03, 0x03,
-    0x03, 0x03, 0x03, 0x1F, 0x3E, 0x70, 0x60, 0xC0,
-    0xC0, 0x60, 0x60, 0x60, 0xC0, 0x80, 0x00, 0x00,
-    0x00, 0x1E, 0x3F, 0xF1, 0xE0, 0x00, 0x00, 0x00,
-    0x00, 0xC0, 0xF0, 0x38, 0x1C, 0x0C, 0x06, 0x06,
-    0x06, 0x06, 0x0C, 0x1C, 0x38, 0xF0, 0xC0, 0x00,
-    0x00, 0x00, 0x00, 0xE0, 0xF1, 0x3F, 0x1E, 0x00,
-    0x00, 0x78, 0xFC, 0x8F, 0x07, 0x00, 0x00, 0x00,
-    0x00, 0x03, 0x0F, 0x1C, 0x38, 0x30, 0x70, 0x70,
-    0x70, 0x70, 0x30, 0x38, 0x1C, 0x0F, 0x03, 0x00,
-    0x00, 0x00, 0x00, 0x07, 0x8F, 0xFC, 0x78, 0x00,
-    0x00, 0x00, 0x01, 0x03, 0x06, 0x06, 0x06, 0x03,
-    0x03, 0x06, 0x0E, 0x7C, 0xF8, 0xC0, 0xC0, 0xC0,
-    0xC0, 0xC0, 0xC0, 0xF8, 0x7C, 0x0E, 0x06, 0x03,
-    0x03, 0x06, 0x06, 0x06, 0x03, 0x01, 0x00, 0x00
-    # // font edit end
-])
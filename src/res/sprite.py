@@ -0,0 +1,49 @@
+import framebuf
+
+# sprite sheet files, see tools/sprite_sheet.py for the format
+LOADING_CIRCLE = "src/res/loading_circle.hws"
+ICONS = "src/res/icons.hws"  # frames: HR, HRV, Kubios, History, Record, Settings, in main menu order
+
+
+class SpriteSheet:
+    """Frames of the same size stored in one file, uncompressed, so any frame can be read directly.
+    Only one frame is in RAM: it's read with readinto() into one buffer, wrapped by one FrameBuffer,
+    so showing a frame doesn't allocate. Use get_sprite_sheet() to share an opened sheet."""
+    _HEADER_SIZE = 8  # b"HWPS", version u8, width u8, height u8, frame count u8
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        header = self._file.read(self._HEADER_SIZE)
+        if header[:4] != b"HWPS" or header[4] != 1:
+            raise ValueError("Invalid sprite sheet file: " + path)
+        self.width = header[5]
+        self.height = header[6]
+        self.count = header[7]
+        self._frame_size = self.width * ((self.height + 7) // 8)
+        self._buf = bytearray(self._frame_size)
+        self._frame_buf = framebuf.FrameBuffer(self._buf, self.width, self.height, framebuf.MONO_VLSB)
+        self._index = -1
+
+    def frame(self, index):
+        """Return the FrameBuffer of a frame. The same object is returned for every frame,
+        its content is only valid until the next call."""
+        if index != self._index:
+            self._file.seek(self._HEADER_SIZE + index * self._frame_size)
+            self._file.readinto(self._buf)
+            self._index = index
+        return self._frame_buf
+
+    def close(self):
+        self._file.close()
+
+
+_sheets = {}
+
+
+def get_sprite_sheet(path):
+    """Open a sprite sheet once and share it, the file stays open for fast frame reads."""
+    sheet = _sheets.get(path)
+    if sheet is None:
+        sheet = SpriteSheet(path)
+        _sheets[path] = sheet
+    return sheet
@@ -1,6 +1,8 @@
-from src.utils import print_log, GlobalSettings
 from src.state import State
-from src.save_system import load_history_list, load_history_data
+from src.save_system import HistorySource, load_stats, read_index, find_time, find_range, latest_per_day
+from src.record import format_hundredths
+from src.utils import format_datetime, get_timestamp, from_timestamp, to_timestamp, days_in_month
+from src import daily_stats
 
 
 class ShowHistory(State):
@@ -8,23 +10,27 @@ class ShowHistory(State):
         super().__init__(state_machine)
         self._selection = 0  # to preserve selected index, resume when exit and re-enter
         self._page = 0  # to preserve page index, resume when exit and re-enter
-        self._history_dates = []
+        self._history_source = None
         # ui
         self._listview_history_list = None
 
     def enter(self, args):
-        # load data
-        self._history_dates.clear()
-        self._history_dates.append("Back")
-        files = load_history_list()
-        self._history_dates.extend(files)
+        """args: (index position) of a result to select, e.g. from HistoryJump"""
+        # data source, only the names on screen are read from the history index
+        self._history_source = HistorySource(prefix=["Back", "Trends", "Go to date"])
+        if args is not None:
+            self._selection = self._history_source.row_of(args[0])
+            self._page = 0  # the list scrolls to the selection
         # ui
         self._view.add_text(text="History", x=0, y=0, invert=True)
-        self._listview_history_list = self._view.add_list(items=self._history_dates, y=14)
+        self._listview_history_list = self._view.add_list(items=self._history_source, y=14)
+        # the history may have shrunk since the page and selection were kept, e.g. by a roll-off
+        self._page = max(0, min(self._page, self._listview_history_list.get_page_max()))
+        self._selection = min(self._selection, self._listview_history_list.get_selection_max())
         self._listview_history_list.set_page(self._page)
         self._listview_history_list.set_selection(self._selection)
         # rotary encoder
-        self._rotary_encoder.enable_rotate(items_count=len(self._history_dates), position=self._selection)
+        self._rotary_encoder.enable_rotate(items_count=len(self._history_source), position=self._selection)
         self._rotary_encoder.enable_press()
 
     def loop(self):
@@ -43,6 +49,15 @@ class ShowHistory(State):
                 self._rotary_encoder.disable_rotate()
                 self._view.remove_all()
                 self._state_machine.set(state_code=self._state_machine.STATE_MENU)
+            elif self._selection == 1:
+                self._rotary_encoder.disable_rotate()
+                self._view.remove(self._listview_history_list)
+                show_items = trend_show_items(load_stats(), get_timestamp() // daily_stats.SECONDS_PER_DAY)
+                self._state_machine.set(state_code=self._state_machine.STATE_SHOW_RESULT, args=[show_items])
+            elif self._selection == 2:
+                self._rotary_encoder.disable_rotate()
+                self._view.remove(self._listview_history_list)
+                self._state_machine.set(state_code=self._state_machine.STATE_HISTORY_JUMP)
             else:
                 # save selection and page
                 self._selection = self._rotary_encoder.get_position()
@@ -50,12 +65,103 @@ class ShowHistory(State):
                 self._rotary_encoder.disable_rotate()
                 self._view.remove(self._listview_history_list)
                 # set state to show data, and pass the data
-                data = load_history_data(self._history_dates[self._selection])
-                show_items = dict2show_items(data, show_datetime=True)
+                data = self._history_source.load(self._selection)
+                if data is None:
+                    show_items = ["Damaged record"]  # CRC mismatch, the rest of the history is fine
+                else:
+                    show_items = dict2show_items(data, show_datetime=True)
                 self._state_machine.set(state_code=self._state_machine.STATE_SHOW_RESULT,
                                         args=[show_items])
 
 
+class HistoryJump(State):
+    """Pick a date, year, month then day, and go to the newest result of that day in the history list,
+    or the newest one before it. The index is searched by time, so no result is read whatever the history size."""
+    _FIELD_X = (80, 56, 32)  # year, month, day in "DD.MM.YY"
+
+    def __init__(self, state_machine):
+        super().__init__(state_machine)
+        self._field = 0  # 0: year, 1: month, 2: day
+        self._first_year = 0
+        self._last_year = 0
+        self._date = [0, 0, 0]  # year, month, day
+        self._textview_date = None
+        self._textview_marker = None
+        self._textview_found = None
+
+    def enter(self, args):
+        self._view.add_text(text="Go to date", x=0, y=14)
+        self._rotary_encoder.enable_press()
+        newest = latest_per_day(1)
+        if not newest:
+            self._date = None
+            self._view.add_text(text="No results", x=0, y=30)
+            return
+        year, month, day = from_timestamp(newest[0][0])[:3]
+        self._first_year = from_timestamp(read_index(0, 1)[0][0])[0]
+        self._last_year = year
+        self._date = [year, month, day]
+        self._field = 0
+        self._textview_date = self._view.add_text(text="", x=32, y=30)
+        self._textview_marker = self._view.add_text(text="", x=0, y=40)
+        self._textview_found = self._view.add_text(text="", x=0, y=54)
+        self._edit_field()
+        self._update_texts()
+
+    def loop(self):
+        event = self._rotary_encoder.get_event()
+        if self._date is None:
+            if event == self._rotary_encoder.EVENT_PRESS:
+                self._view.remove_all()
+                self._state_machine.set(state_code=self._state_machine.STATE_SHOW_HISTORY)
+            return
+        if event == self._rotary_encoder.EVENT_ROTATE:
+            position = self._rotary_encoder.get_position()
+            if self._field == 0:
+                self._date[0] = self._first_year + position
+            else:
+                self._date[self._field] = position + 1
+            # keep the day in the month
+            self._date[2] = min(self._date[2], days_in_month(self._date[0], self._date[1]))
+            self._update_texts()
+        elif event == self._rotary_encoder.EVENT_PRESS:
+            if self._field < 2:
+                self._field += 1
+                self._edit_field()
+                self._update_texts()
+                return
+            self._rotary_encoder.disable_rotate()
+            # the newest result up to the end of the day, the oldest one if the day is before all of them
+            position = max(find_time(self._day_start() + daily_stats.SECONDS_PER_DAY - 1) - 1, 0)
+            self._view.remove_all()
+            self._state_machine.set(state_code=self._state_machine.STATE_SHOW_HISTORY, args=[position])
+
+    def _day_start(self):
+        return to_timestamp(self._date[0], self._date[1], self._date[2], 0, 0, 0)
+
+    def _edit_field(self):
+        if self._field == 0:
+            self._rotary_encoder.enable_rotate(items_count=self._last_year - self._first_year + 1,
+                                               position=self._date[0] - self._first_year)
+        elif self._field == 1:
+            self._rotary_encoder.enable_rotate(items_count=12, position=self._date[1] - 1)
+        else:
+            self._rotary_encoder.enable_rotate(items_count=days_in_month(self._date[0], self._date[1]),
+                                               position=self._date[2] - 1)
+
+    def _update_texts(self):
+        year, month, day = self._date
+        self._textview_date.set_text("{:02d}.{:02d}.{:02d}".format(day, month, year % 100))
+        self._textview_marker.set_text(" " * (self._FIELD_X[self._field] // 8) + "^^")
+        start = self._day_start()
+        first, stop = find_range(start, start + daily_stats.SECONDS_PER_DAY - 1)
+        if stop > first:
+            self._textview_found.set_text("{} results".format(stop - first))
+        else:
+            before = latest_per_day(1, before=start)
+            self._textview_found.set_text("Before:" + format_datetime(before[0][0])[:8] if before else "No results")
+
+
 class ShowResult(State):
     def __init__(self, state_machine):
         super().__init__(state_machine)
@@ -88,20 +194,49 @@ class ShowResult(State):
                 raise ValueError("Undefined result showing module")
 
 
-def dict2show_items(dict_data, show_datetime=False):
+def dict2show_items(result, show_datetime=False):
+    """List view items of a record.Result, the only place where its numbers become text."""
     list_data = []
     # history data: date time first
     if show_datetime:
-        list_data = ["Date:" + str(dict_data["DATE"][:8]),
-                     "Time:" + str(dict_data["DATE"][9:17])]
+        datetime = format_datetime(result.timestamp)
+        list_data = ["Date:" + datetime[:8],
+                     "Time:" + datetime[9:17]]
     # common data: in the middle
-    list_data.extend(["HR:" + str(dict_data["HR"]),
-                      "IBI:" + str(dict_data["IBI"]),
-                      "RMSSD:" + str(dict_data["RMSSD"]),
-                      "SDNN:" + str(dict_data["SDNN"])])
+    list_data.extend(["HR:" + format_hundredths(result.hr) + "BPM",
+                      "IBI:" + format_hundredths(result.ibi) + "ms",
+                      "RMSSD:" + format_hundredths(result.rmssd) + "ms",
+                      "SDNN:" + format_hundredths(result.sdnn) + "ms"])
     # kubios data: at the end
-    if "SNS" in dict_data:
-        list_data.extend(["SNS:" + str(dict_data["SNS"]),
-                          "PNS:" + str(dict_data["PNS"]),
-                          "Stress:" + str(dict_data["STRESS"])])
+    if result.is_kubios():
+        list_data.extend(["SNS:" + format_hundredths(result.sns),
+                          "PNS:" + format_hundredths(result.pns),
+                          "Stress:" + format_hundredths(result.stress)])
+    return list_data
+
+
+def trend_show_items(table, today):
+    """List view items of the daily aggregates (daily_stats): the 7 and 30 day baselines, then the mean HR and RMSSD
+    of each day of the last week with results, and its HR range and count, newest first."""
+    end_day = max(today, daily_stats.newest_day(table))  # the RTC may be behind the results
+    list_data = []
+    for days in (7, 30):
+        list_data.append("[{} days]".format(days))
+        stats = daily_stats.baseline(table, end_day, days)
+        if stats is None:
+            list_data.append("No results")
+            continue
+        count, hr, rmssd, sdnn = stats
+        list_data.extend(["HR:" + format_hundredths(hr) + "BPM",
+                          "RMSSD:" + format_hundredths(rmssd) + "ms",
+                          "SDNN:" + format_hundredths(sdnn) + "ms",
+                          "Results:{}".format(count)])
+    list_data.append("[Day] HR RMSSD")
+    for day in range(end_day, end_day - 7, -1):
+        stats = daily_stats.day_stats(table, day)
+        if stats is not None:
+            count, hr, hr_min, hr_max, rmssd = stats[:5]
+            list_data.append("{} {:>3} {:>4}".format(format_datetime(day * daily_stats.SECONDS_PER_DAY)[:5],
+                                                     hr // 100, rmssd // 100))
+            list_data.append("  {}-{} x{}".format(hr_min // 100, hr_max // 100, count))
     return list_data
@@ -0,0 +1,195 @@
+"""
+Cooperative runtime on uasyncio, replacing the polling main loop (state_machine.run() in a while loop).
+
+The work of one main loop iteration is split into tasks, each waking up on its own schedule:
+- sensor: state.sensor() every SENSOR_MS while the heart sensor runs. The fifo holds 100 samples (400 ms at 250 Hz).
+- ui: enter() of a new state, otherwise state.loop().
+- display: view.refresh() when the refresh governor allows the next frame, or an animation needs the next one.
+- network: blocking calls queued by state_machine.submit_io(), one at a time, results passed to the callbacks.
+Network calls still block all tasks while they run, MicroPython sockets are blocking, but they no longer run in
+the middle of a state's loop(), and the other tasks get their turn between two calls.
+
+Idle: no task polls. Each one sleeps until its next deadline, or waits for a flag set by an interrupt or another task:
+- ui: until state.next_loop_ms() (None: no deadline), or an encoder event (RotaryEncoder.wake).
+- sensor: until the heart sensor is started (HeartSensor.wake).
+- display: until the pending frame is allowed, the next animation frame, or an update is marked (Display.wake).
+- network: until a call is queued (state_machine.io_wake).
+When every task waits, the uasyncio scheduler waits for the earliest deadline in one low power wait, which
+interrupts end early through the flags, so on menus, history and settings the CPU sleeps between two events.
+machine.lightsleep() is not used: it stops the clocks of the PIO sampling timer and of the USB serial.
+
+Scheduling latency: each time a task wakes up, how late it is compared to when it asked to wake up.
+"wake" is the time from an encoder interrupt to the ui task running. Count, average and max per task are kept,
+see get_latency_stats(), shown in Settings -> Debug Info. While it runs, the runtime is state_machine.runtime.
+
+Runs on CPython asyncio too, see host/run_async.py, and host/idle_check.py for the idle and wake-up check.
+"""
+import time
+from src import log
+
+try:
+    import uasyncio as asyncio  # MicroPython
+except ImportError:
+    import asyncio  # CPython, host simulation
+
+if hasattr(asyncio, "sleep_ms"):
+    sleep_ms = asyncio.sleep_ms
+    wait_for_ms = asyncio.wait_for_ms
+else:
+    def sleep_ms(ms):
+        return asyncio.sleep(ms / 1000)
+
+    def wait_for_ms(awaitable, ms):
+        return asyncio.wait_for(awaitable, ms / 1000)
+
+if hasattr(asyncio, "ThreadSafeFlag"):
+    Flag = asyncio.ThreadSafeFlag
+else:
+    class Flag:
+        """ThreadSafeFlag on CPython, the host board calls the 'interrupt' handlers in the event loop thread"""
+
+        def __init__(self):
+            self._event = asyncio.Event()
+
+        def set(self):
+            self._event.set()
+
+        async def wait(self):
+            await self._event.wait()
+            self._event.clear()
+
+
+class _TaskStats:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def add(self, late_us):
+        self.count += 1
+        self.total_us += late_us
+        if late_us > self.max_us:
+            self.max_us = late_us
+
+
+class Runtime:
+    SENSOR_MS = 20
+
+    def __init__(self, state_machine):
+        self._sm = state_machine
+        self._running = False
+        self._stats = [_TaskStats("sensor"), _TaskStats("ui"), _TaskStats("display"), _TaskStats("network"),
+                       _TaskStats("wake")]
+        self._flags = []
+
+    def run(self, duration_ms=None, *coroutines):
+        """Run the tasks, forever or for 'duration_ms'. Extra coroutines run next to them, e.g. a test script."""
+        asyncio.run(self._main(duration_ms, coroutines))
+
+    def stop(self):
+        self._running = False
+        for flag in self._flags:
+            flag.set()  # let the waiting tasks see it
+
+    def get_latency_stats(self):
+        """Return a list of (task name, wake-ups, average us, max us) of each task."""
+        return [(stats.name, stats.count, stats.total_us // stats.count if stats.count else 0, stats.max_us)
+                for stats in self._stats]
+
+    async def _main(self, duration_ms, coroutines):
+        sm = self._sm
+        sm.runtime = self  # the debug screen shows its stats
+        self._running = True
+        sm.io_queue = []  # submit_io() queues for the network task from now on
+        # flags are created in the event loop, CPython binds them to it
+        sensor_flag, ui_flag, display_flag, io_flag = Flag(), Flag(), Flag(), Flag()
+        self._flags = [sensor_flag, ui_flag, display_flag, io_flag]
+        sm.heart_sensor.wake = sensor_flag
+        sm.rotary_encoder.wake = ui_flag
+        sm.display.wake = display_flag
+        sm.io_wake = io_flag
+        log.info("Runtime started")
+        tasks = [asyncio.create_task(self._sensor_task(sensor_flag)),
+                 asyncio.create_task(self._ui_task(ui_flag)),
+                 asyncio.create_task(self._display_task(display_flag)),
+                 asyncio.create_task(self._network_task(io_flag))]
+        for coroutine in coroutines:
+            tasks.append(asyncio.create_task(coroutine))
+        if duration_ms is not None:
+            await sleep_ms(duration_ms)
+            self.stop()
+        for task in tasks:
+            await task
+        sm.heart_sensor.wake = None
+        sm.rotary_encoder.wake = None
+        sm.display.wake = None
+        sm.io_wake = None
+        # back to the polling loop: run the calls still queued at once
+        queue = sm.io_queue
+        sm.io_queue = None
+        for function, args, callback in queue:
+            callback(function(*args))
+        sm.runtime = None
+
+    async def _wait(self, stats, flag, ms):
+        """Wait for the flag, or 'ms' at most, None: no deadline. Return True if woken by the flag.
+        Lateness of a deadline is added to the stats."""
+        if ms is None:
+            await flag.wait()
+            return True
+        wake = time.ticks_add(time.ticks_us(), ms * 1000)
+        if ms > 0:
+            try:
+                await wait_for_ms(flag.wait(), ms)
+                return True
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await sleep_ms(0)
+        stats.add(max(0, time.ticks_diff(time.ticks_us(), wake)))
+        return False
+
+    async def _sensor_task(self, flag):
+        sm = self._sm
+        stats = self._stats[0]
+        while self._running:
+            if sm.heart_sensor.is_started():
+                sm.process_sensor()
+                await self._wait(stats, flag, self.SENSOR_MS)
+            else:
+                await flag.wait()
+
+    async def _ui_task(self, flag):
+        sm = self._sm
+        encoder = sm.rotary_encoder
+        stats = self._stats[1]
+        wake_stats = self._stats[4]
+        while self._running:
+            if not sm.enter_switched():
+                sm.loop_state()
+            if await self._wait(stats, flag, sm.next_loop_ms()) and self._running:
+                wake_stats.add(max(0, time.ticks_diff(time.ticks_us(), encoder.event_time_us)))
+
+    async def _display_task(self, flag):
+        view = self._sm.view
+        display = self._sm.display
+        stats = self._stats[2]
+        while self._running:
+            self._sm.refresh_view()
+            if display.is_update_pending():
+                wait = display.ms_until_refresh()
+            else:
+                wait = view.ms_until_animation()
+            await self._wait(stats, flag, wait)
+
+    async def _network_task(self, flag):
+        queue = self._sm.io_queue
+        stats = self._stats[3]
+        while self._running:
+            if queue:
+                function, args, callback = queue.pop(0)
+                callback(function(*args))
+                await self._wait(stats, flag, 0)
+            else:
+                await flag.wait()
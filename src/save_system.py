@@ -1,17 +1,634 @@
+"""
+Measurement history: an append-only log of fixed-size binary records, split in segment files.
+
+    Saved_Values/00000001.seg, 00000002.seg, ...   numbered in order, oldest first
+
+Segment: header, then up to SEGMENT_RECORDS records. Every segment but the newest one is full,
+so the n-th record of the history is found by arithmetic, without listing or reading other segments.
+    header: magic b"HWRL", version u8, record size u8, records per segment u16, segment number u32, CRC32 u32
+    record: a packed record.Result (28 bytes, its schema version at byte 4), then CRC32 u32 of it
+All integers are little endian. A record with a wrong CRC is skipped when read, and so are the records of a
+segment whose header is damaged or doesn't match this layout, e.g. from another version, see _header_ok().
+A newest segment with such a header is left as it is and taken as full, the next save starts a new segment.
+
+Saving opens the newest segment and appends one record, whatever the size of the history.
+The oldest results roll off a whole segment at a time, when a new segment is started and the full segments left
+after it would still hold files_limit results, so at least files_limit results are kept, or the flash is almost full.
+
+Index: Saved_Values/history.idx has one entry per record, in chronological order rather than the order of saving,
+which differs when the RTC was set back or lost its time. Each entry is 12 bytes:
+    timestamp u32, record id u32, HR u16 (hundredths), flags u16 (of the record)
+The record id is (segment number - 1) * SEGMENT_RECORDS + position in the segment, so it stays valid when older
+segments roll off. A save appends an entry, or inserts it at its place if it's older than the newest entry.
+A roll-off removes the entries of the removed segment. Listing, newest N and queries by time read the index only,
+see HistorySource and the queries: newest(), between() and latest_per_day(), which find times by binary search.
+The index is rebuilt from the log when it's missing or has more entries than the log.
+
+IBI series: Saved_Values/00000001.ibi next to each segment holds the IBIs of its sessions, so they can be analysed
+again later, see iter_sessions() and src/reanalysis.py. Each series is a header, then the IBIs of record.pack_ibi():
+    position of the record in the segment u8, reserved u8, IBI count u16, data length u16, CRC32 u32 of the data
+A series is written before its record, the last series of a position wins, so a series left by an interrupted save
+is replaced by the next save. The file rolls off with its segment.
+
+Power loss: a save writes a journal first, Saved_Values/journal, which holds the index entry of the record being
+saved and its CRC32, and removes it after the index entry is written. Files are rewritten to a .tmp file that
+replaces them with one rename, so they are either old or new. At boot, check_home_dir() looks only at the tail:
+a partial record or index entry at the end of its file is cut off, and if a journal is left, the IBI file of the
+newest segment is cut after its last complete series, and the index entry is added if the record made it to the log.
+Neither the log nor the index is read in full, unless the index is missing or has more entries than the log.
+A roll-off removes the index entries before the segment, a power loss in between only hides records being removed.
+
+Daily aggregates of the results, for trends and baselines, are kept in Saved_Values/daily.agg, see daily_stats.
+
+A result analysed again replaces its record in place, see update_record(), rather than being saved again.
+
+Results saved as one JSON file each by earlier versions are moved into the log on the first boot,
+see check_home_dir().
+"""
 import os
 import json
-from src.utils import GlobalSettings, pico_rom_stat
+import struct
+from binascii import crc32
+from src.utils import GlobalSettings, pico_rom_stat, parse_datetime, format_datetime
+from src.record import Result, PACKED_SIZE, pack_ibi, unpack_ibi
+from src import log, daily_stats
+
+SEGMENT_MAGIC = b"HWRL"
+LOG_VERSION = 1
+SEGMENT_RECORDS = 64  # 64 * 32 B, a segment fits in one 4 KB block of the file system with its header
+_HEADER_FORMAT = "<4sBBHI"
+_HEADER_SIZE = 16  # with its CRC32
+RECORD_SIZE = PACKED_SIZE + 4  # with its CRC32
+_MIGRATED_MARKER = "migrated"
+INDEX_FILE = "history.idx"
+_INDEX_FORMAT = "<IIHH"
+INDEX_ENTRY_SIZE = 12
+JOURNAL_FILE = "journal"
+_JOURNAL_SIZE = 16  # index entry and its CRC32
+_IBI_HEADER_FORMAT = "<BBHHI"
+_IBI_HEADER_SIZE = 10
+
+
+class _Log:
+    """Position of the log, found once by check_home_dir(), then kept up to date by each save."""
+    bad_segments = set()  # numbers of the segments with a bad header, warned about once
+    first = 0  # number of the oldest segment, 0 if there's none
+    last = 0  # number of the newest segment
+    last_count = 0  # records in the newest segment
+    index_count = 0  # entries in the index
+    index_last_time = 0  # timestamp of the newest entry
+
+
+def _segment_path(number):
+    return "{}/{:08d}.seg".format(GlobalSettings.save_directory, number)
+
+
+def _ibi_path(number):
+    return "{}/{:08d}.ibi".format(GlobalSettings.save_directory, number)
+
+
+def _exists(path):
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def _pack_header(number):
+    header = struct.pack(_HEADER_FORMAT, SEGMENT_MAGIC, LOG_VERSION, RECORD_SIZE, SEGMENT_RECORDS, number)
+    return header + struct.pack("<I", crc32(header))
+
+
+def _header_ok(header, number):
+    """True if a segment header is intact and of this layout: magic, version, record size, records per segment
+    and segment number."""
+    if len(header) < _HEADER_SIZE or struct.unpack_from("<I", header, _HEADER_SIZE - 4)[0] != crc32(
+            header[:_HEADER_SIZE - 4]):
+        return False
+    return struct.unpack_from(_HEADER_FORMAT, header) == (SEGMENT_MAGIC, LOG_VERSION, RECORD_SIZE, SEGMENT_RECORDS,
+                                                          number)
+
+
+def _segment_ok(file, number):
+    """Check the header of an open segment file, the records of a bad one must not be read."""
+    file.seek(0)
+    if _header_ok(file.read(_HEADER_SIZE), number):
+        return True
+    if number not in _Log.bad_segments:
+        _Log.bad_segments.add(number)
+        log.warning("Segment %d: bad header, skipped", number)
+    return False
+
+
+def pack_record(result):
+    """Binary record of a Result: the packed result and its CRC32"""
+    packed = result.pack()
+    return packed + struct.pack("<I", crc32(packed))
+
+
+def unpack_record(record):
+    """Result of a binary record, None if the CRC is wrong or the schema is unknown."""
+    if len(record) != RECORD_SIZE or struct.unpack_from("<I", record, PACKED_SIZE)[0] != crc32(record[:PACKED_SIZE]):
+        return None
+    try:
+        return Result.unpack(record)
+    except ValueError:
+        return None
+
+
+def record_count():
+    if _Log.first == 0:
+        return 0
+    return (_Log.last - _Log.first) * SEGMENT_RECORDS + _Log.last_count
+
+
+def _open_log():
+    """Find the oldest and newest segment, the only listing of the save directory.
+    Return the names of the files of a JSON history still to migrate, see _migrate_json(), usually none."""
+    _IbiCache.segment = 0
+    _Log.bad_segments = set()
+    numbers = []
+    legacy = []
+    for name in os.listdir(GlobalSettings.save_directory):
+        if name.endswith(".seg"):
+            numbers.append(int(name[:-4]))
+        elif name.endswith(".tmp"):
+            os.remove(GlobalSettings.save_directory + "/" + name)  # a rewrite cut short, the file it was for is intact
+        elif name.endswith(".txt") or name == _MIGRATED_MARKER:
+            legacy.append(name)
+    if not numbers:
+        _Log.first = _Log.last = _Log.last_count = 0
+        return legacy
+    numbers.sort()
+    _Log.first = numbers[0]
+    _Log.last = numbers[-1]
+    path = _segment_path(_Log.last)
+    size = os.stat(path)[6] - _HEADER_SIZE
+    if size < 0:
+        # the segment was being started: write its header again
+        with open(path, "wb") as file:
+            file.write(_pack_header(_Log.last))
+        size = 0
+    else:
+        with open(path, "rb") as file:
+            if not _segment_ok(file, _Log.last):
+                _Log.last_count = SEGMENT_RECORDS  # nothing is appended to it, its records are skipped
+                return legacy
+    _Log.last_count = size // RECORD_SIZE
+    if size % RECORD_SIZE:
+        # a save was interrupted: keep the complete records, so the next one is appended at the right place
+        _truncate(path, _HEADER_SIZE + _Log.last_count * RECORD_SIZE)
+        log.warning("Segment %d: partial record dropped", _Log.last)
+    return legacy
+
+
+def _copy(src, dst, size=-1):
+    """Copy 'size' bytes of a file to another one in chunks, all the rest if -1."""
+    while size:
+        chunk = src.read(512 if size < 0 else min(size, 512))
+        if not chunk:
+            break
+        dst.write(chunk)
+        if size > 0:
+            size -= len(chunk)
+
+
+def _truncate(path, size):
+    """Keep the first 'size' bytes of a file: copied to a .tmp file, which then replaces the file in one rename."""
+    tmp_path = path + ".tmp"
+    with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+        _copy(src, dst, size)
+    os.rename(tmp_path, path)
+
+
+def _overwrite(path, offset, data):
+    """Replace the bytes at 'offset' of a file with 'data', by a copy to a .tmp file as _truncate()."""
+    tmp_path = path + ".tmp"
+    with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+        _copy(src, dst, offset)
+        dst.write(data)
+        src.seek(offset + len(data))
+        _copy(src, dst)
+    os.rename(tmp_path, path)
+
+
+def _new_segment():
+    number = _Log.last + 1
+    with open(_segment_path(number), "wb") as file:
+        file.write(_pack_header(number))
+    if _Log.first == 0:
+        _Log.first = number
+    _Log.last = number
+    _Log.last_count = 0
+    # roll off: the full segments left after the oldest one still hold the limit, or the flash is almost full.
+    # Checked once per segment, not per save.
+    while _Log.first < _Log.last and ((_Log.last - _Log.first - 1) * SEGMENT_RECORDS >= GlobalSettings.files_limit
+                                      or pico_rom_stat() <= 10):
+        number = _Log.first
+        _Log.first += 1
+        if _exists(_index_path()):  # not yet while migrating
+            # entries first: cut short here, the records of the segment are hidden, rather than entries left
+            # without their records, and the segment is removed by the next roll-off
+            _rewrite_index(drop_below=(_Log.first - 1) * SEGMENT_RECORDS)
+        os.remove(_segment_path(number))
+        if _exists(_ibi_path(number)):
+            os.remove(_ibi_path(number))
+        log.info("Removed oldest segment: %d", number)
+
+
+def _next_record_id():
+    """Record id of the next record appended, a new segment is started if the newest one is full."""
+    if _Log.first == 0 or _Log.last_count >= SEGMENT_RECORDS:
+        _new_segment()
+    return (_Log.last - 1) * SEGMENT_RECORDS + _Log.last_count
+
+
+def _append(record, ibi_list=None):
+    """Append a record to the log, and the IBI series of its session if given, return its record id."""
+    record_id = _next_record_id()
+    if ibi_list:
+        data = pack_ibi(ibi_list)
+        with open(_ibi_path(_Log.last), "ab") as file:
+            file.write(struct.pack(_IBI_HEADER_FORMAT, _Log.last_count, 0, len(ibi_list), len(data), crc32(data)))
+            file.write(data)
+        _IbiCache.segment = 0  # series added
+    with open(_segment_path(_Log.last), "ab") as file:
+        file.write(record)
+    _Log.last_count += 1
+    return record_id
+
+
+def read_records(start, count):
+    """Return 'count' binary records from record index 'start', oldest first, index 0 is the oldest record."""
+    records = []
+    while count > 0:
+        segment = _Log.first + start // SEGMENT_RECORDS
+        position = start % SEGMENT_RECORDS
+        run = min(count, SEGMENT_RECORDS - position)
+        with open(_segment_path(segment), "rb") as file:
+            if _segment_ok(file, segment):
+                file.seek(_HEADER_SIZE + position * RECORD_SIZE)
+                block = file.read(run * RECORD_SIZE)
+            else:
+                block = b""  # empty records, skipped as damaged ones
+        for offset in range(0, run * RECORD_SIZE, RECORD_SIZE):
+            records.append(block[offset:offset + RECORD_SIZE])
+        start += run
+        count -= run
+    return records
+
+
+def read_record(record_id):
+    """Return the binary record of an id of the index, None if its segment has rolled off or has a bad header."""
+    segment = record_id // SEGMENT_RECORDS + 1
+    if segment < _Log.first or segment > _Log.last:
+        return None
+    with open(_segment_path(segment), "rb") as file:
+        if not _segment_ok(file, segment):
+            return None
+        file.seek(_HEADER_SIZE + record_id % SEGMENT_RECORDS * RECORD_SIZE)
+        return file.read(RECORD_SIZE)
+
+
+class _IbiCache:
+    """Where each series of one .ibi file is, the file is scanned once for all of its series."""
+    segment = 0
+    series = {}  # position in segment: (offset of data, IBI count, data length, CRC32)
+
+
+def _ibi_series(segment):
+    if _IbiCache.segment != segment:
+        series = {}
+        try:
+            with open(_ibi_path(segment), "rb") as file:
+                offset = 0
+                while True:
+                    header = file.read(_IBI_HEADER_SIZE)
+                    if len(header) < _IBI_HEADER_SIZE:
+                        break
+                    position, _, count, length, crc = struct.unpack(_IBI_HEADER_FORMAT, header)
+                    offset += _IBI_HEADER_SIZE
+                    series[position] = (offset, count, length, crc)
+                    file.seek(offset + length)
+                    offset += length
+        except OSError:
+            pass  # no series in this segment, e.g. saved before IBIs were kept
+        _IbiCache.segment = segment
+        _IbiCache.series = series
+    return _IbiCache.series
+
+
+def load_ibi(record_id):
+    """Return the IBI series (array('H'), ms) of the session of a record id, None if it wasn't kept or is damaged."""
+    segment = record_id // SEGMENT_RECORDS + 1
+    if segment < _Log.first or segment > _Log.last:
+        return None
+    found = _ibi_series(segment).get(record_id % SEGMENT_RECORDS)
+    if found is None:
+        return None
+    offset, count, length, crc = found
+    with open(_ibi_path(segment), "rb") as file:
+        file.seek(offset)
+        data = file.read(length)
+    if len(data) != length or crc32(data) != crc:
+        return None
+    return unpack_ibi(data, count)
+
+
+def iter_sessions(with_ibi_only=True):
+    """Generator of (record id, Result, IBI array or None) of the saved sessions, newest first.
+    One session is in RAM at a time, the index is read a page at a time. Newest first, so results saved while
+    iterating, which are inserted after the entries of the same or older time, don't move the entries still to come."""
+    position = _Log.index_count
+    while position > 0:
+        count = min(8, position)
+        position -= count
+        entries = read_index(position, count)
+        entries.reverse()
+        for _, record_id, _, _ in entries:
+            result = load_history_data(record_id)
+            if result is None:
+                continue
+            ibi = load_ibi(record_id)
+            if ibi is None and with_ibi_only:
+                continue
+            yield record_id, result, ibi
+
 
+def _index_path():
+    return GlobalSettings.save_directory + "/" + INDEX_FILE
 
-def check_file_nr():
-    """If file limit exceeded, delete the oldest one."""
-    directory = GlobalSettings.save_directory + "/"
-    files = os.listdir(directory)
-    num_files = len(files)
-    # also check storage space, if less than 10KB, delete the oldest file
-    if num_files > GlobalSettings.files_limit or pico_rom_stat() <= 10:
-        files.sort()  # With current file names setting, the oldest file is the first file using the sort().
-        os.remove(directory + files[0])
+
+def _index_entry(record):
+    """Index entry of a binary record: timestamp, record id (filled in later), HR and flags."""
+    timestamp, _, flags, hr = struct.unpack_from("<IBBH", record)
+    return timestamp, hr, flags
+
+
+def read_index(start, count):
+    """Return 'count' index entries (timestamp, record id, HR hundredths, flags) from entry 'start', oldest first."""
+    with open(_index_path(), "rb") as file:
+        file.seek(start * INDEX_ENTRY_SIZE)
+        block = file.read(count * INDEX_ENTRY_SIZE)
+    return [struct.unpack_from(_INDEX_FORMAT, block, offset) for offset in range(0, len(block), INDEX_ENTRY_SIZE)]
+
+
+def find_time(timestamp):
+    """Position of the first index entry newer than 'timestamp', by binary search with one entry read per step."""
+    low = 0
+    high = _Log.index_count
+    with open(_index_path(), "rb") as file:
+        while low < high:
+            middle = (low + high) // 2
+            file.seek(middle * INDEX_ENTRY_SIZE)
+            if struct.unpack("<I", file.read(4))[0] <= timestamp:
+                low = middle + 1
+            else:
+                high = middle
+    return low
+
+
+def newest(count):
+    """Return the index entries of the newest 'count' results, newest first."""
+    count = min(count, _Log.index_count)
+    entries = read_index(_Log.index_count - count, count) if count else []
+    entries.reverse()
+    return entries
+
+
+def find_range(start, end):
+    """Index positions (first, stop) of the entries from timestamp 'start' to 'end' included, by binary search."""
+    return find_time(start - 1), find_time(end)
+
+
+def between(start, end, limit=32):
+    """Return the index entries from timestamp 'start' to 'end' included, oldest first,
+    the newest 'limit' ones if there are more, so the RAM used is bounded."""
+    first, stop = find_range(start, end)
+    first = max(first, stop - limit)
+    return read_index(first, stop - first) if stop > first else []
+
+
+def latest_per_day(count, before=None):
+    """Return the newest index entry of each of the 'count' newest days with results, newest first,
+    of the days before timestamp 'before' only if given. One binary search per day, not a scan of the entries."""
+    stop = _Log.index_count if before is None else find_time(before - 1)
+    entries = []
+    while stop > 0 and len(entries) < count:
+        entry = read_index(stop - 1, 1)[0]
+        entries.append(entry)
+        stop = find_time(entry[0] // daily_stats.SECONDS_PER_DAY * daily_stats.SECONDS_PER_DAY - 1)  # day's first
+    return entries
+
+
+def _index_add(timestamp, record_id, hr, flags):
+    entry = struct.pack(_INDEX_FORMAT, timestamp, record_id, hr, flags)
+    if _Log.index_count == 0 or timestamp >= _Log.index_last_time:
+        with open(_index_path(), "ab") as file:
+            file.write(entry)
+        _Log.index_count += 1
+        _Log.index_last_time = timestamp
+    else:
+        # older than the newest result, e.g. the RTC was reset: insert at its place
+        _rewrite_index(insert_at=find_time(timestamp), entry=entry)
+
+
+def _rewrite_index(insert_at=-1, entry=None, drop_below=-1):
+    """Copy the index in chunks, inserting 'entry' before position 'insert_at' and dropping the entries of
+    record ids below 'drop_below'. RAM usage doesn't depend on the size of the index."""
+    path = _index_path()
+    tmp_path = path + ".tmp"
+    count = 0
+    position = 0
+    with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+        while True:
+            block = src.read(INDEX_ENTRY_SIZE * 32)
+            for offset in range(0, len(block), INDEX_ENTRY_SIZE):
+                if position == insert_at:
+                    dst.write(entry)
+                    count += 1
+                position += 1
+                if struct.unpack_from("<I", block, offset + 4)[0] >= drop_below:
+                    dst.write(block[offset:offset + INDEX_ENTRY_SIZE])
+                    count += 1
+            if not block:
+                break
+        if position == insert_at:  # at the end
+            dst.write(entry)
+            count += 1
+    os.rename(tmp_path, path)
+    _Log.index_count = count
+
+
+def _build_index():
+    """Write the index from the log, sorted by time. Only when the index is missing or doesn't match the log."""
+    entries = []
+    record_id = (_Log.first - 1) * SEGMENT_RECORDS
+    for start in range(0, record_count(), SEGMENT_RECORDS):
+        for record in read_records(start, min(SEGMENT_RECORDS, record_count() - start)):
+            if unpack_record(record) is not None:  # CRC checked
+                timestamp, hr, flags = _index_entry(record)
+                entries.append(struct.pack(_INDEX_FORMAT, timestamp, record_id, hr, flags))
+            record_id += 1
+    entries.sort(key=lambda entry: struct.unpack_from("<I", entry)[0])
+    with open(_index_path(), "wb") as file:
+        for entry in entries:
+            file.write(entry)
+    _Log.index_count = len(entries)
+    _Log.index_last_time = struct.unpack_from("<I", entries[-1])[0] if entries else 0
+    log.info("History index built: %d", len(entries))
+
+
+def _check_index():
+    try:
+        size = os.stat(_index_path())[6]
+    except OSError:
+        _build_index()
+        return
+    _Log.index_count = size // INDEX_ENTRY_SIZE
+    if _Log.index_count > record_count():
+        _build_index()  # entries of records that are not in the log
+        return
+    # fewer entries than records is fine: damaged records have none, nor the records of a cut short roll-off
+    if size % INDEX_ENTRY_SIZE:
+        _truncate(_index_path(), _Log.index_count * INDEX_ENTRY_SIZE)  # an entry cut short
+        log.warning("History index: partial entry dropped")
+    if _Log.index_count:
+        _Log.index_last_time = read_index(_Log.index_count - 1, 1)[0][0]
+
+
+def _journal_path():
+    return GlobalSettings.save_directory + "/" + JOURNAL_FILE
+
+
+def _index_position(timestamp, record_id):
+    """Position of the index entry of a record, -1 if it has none."""
+    position = find_time(timestamp - 1)  # first entry of the time
+    while position < _Log.index_count:
+        entry_time, entry_id, _, _ = read_index(position, 1)[0]
+        if entry_time != timestamp:
+            return -1
+        if entry_id == record_id:
+            return position
+        position += 1
+    return -1
+
+
+def _truncate_ibi(segment):
+    """Cut an IBI file after its last complete series, the next series would be appended after a partial one."""
+    path = _ibi_path(segment)
+    try:
+        size = os.stat(path)[6]
+    except OSError:
+        return
+    end = 0
+    with open(path, "rb") as file:
+        while True:
+            header = file.read(_IBI_HEADER_SIZE)
+            if len(header) < _IBI_HEADER_SIZE:
+                break
+            length = struct.unpack(_IBI_HEADER_FORMAT, header)[3]
+            if end + _IBI_HEADER_SIZE + length > size:
+                break
+            end += _IBI_HEADER_SIZE + length
+            file.seek(end)
+    if end < size:
+        _truncate(path, end)
+        _IbiCache.segment = 0
+        log.warning("Segment %d: partial IBI series dropped", segment)
+
+
+def _recover():
+    """Complete a save cut short by a power loss, from its journal, see the module doc."""
+    path = _journal_path()
+    try:
+        with open(path, "rb") as file:
+            journal = file.read()
+    except OSError:
+        return  # the last save was completed
+    # a journal cut short: nothing else was written yet
+    if len(journal) == _JOURNAL_SIZE and crc32(journal[:INDEX_ENTRY_SIZE]) == struct.unpack_from(
+            "<I", journal, INDEX_ENTRY_SIZE)[0]:
+        timestamp, record_id, hr, flags = struct.unpack_from(_INDEX_FORMAT, journal)
+        _truncate_ibi(record_id // SEGMENT_RECORDS + 1)
+        record = read_record(record_id)
+        if record is not None and unpack_record(record) is not None and _index_position(timestamp, record_id) < 0:
+            _index_add(timestamp, record_id, hr, flags)
+            log.warning("History index: entry of %d recovered", timestamp)
+        table = daily_stats.load()
+        if record is not None and table is not None and record_id >= daily_stats.next_record_id(table):
+            result = unpack_record(record)
+            if result is not None:
+                daily_stats.add(table, result, record_id)
+                daily_stats.write(table)
+    os.remove(path)
+
+
+def _build_stats():
+    """Write the daily aggregates of the results of the days kept, read from the index and their records."""
+    table = daily_stats.empty(next_record_id=(_Log.last - 1) * SEGMENT_RECORDS + _Log.last_count if _Log.last else 0)
+    if _Log.index_count:
+        first_day = _Log.index_last_time // daily_stats.SECONDS_PER_DAY - daily_stats.DAYS + 1
+        position = find_time(first_day * daily_stats.SECONDS_PER_DAY - 1)
+        while position < _Log.index_count:
+            entries = read_index(position, 32)
+            for _, record_id, _, _ in entries:
+                result = load_history_data(record_id)
+                if result is not None:
+                    daily_stats.add(table, result, record_id)
+            position += len(entries)
+    daily_stats.write(table)
+    log.info("Daily stats built")
+    return table
+
+
+def load_stats():
+    """Daily aggregates of the history, see daily_stats."""
+    table = daily_stats.load()
+    return table if table is not None else _build_stats()
+
+
+def _migrate_json(legacy):
+    """Move results saved as JSON files (one per result) into the log, oldest first, then remove the files.
+    legacy: the JSON files and the marker file found by _open_log(), so a boot without them doesn't list again.
+    The marker file tells an interrupted migration was already written to the log, so it's not written twice."""
+    directory = GlobalSettings.save_directory
+    names = [name for name in legacy if name.endswith(".txt")]
+    marker = directory + "/" + _MIGRATED_MARKER
+    if names and _MIGRATED_MARKER not in legacy:
+        # segments left by an interrupted migration are written again from the start, the index is built after
+        for name in os.listdir(directory):
+            if name.endswith(".seg") or name.endswith(".ibi") or name in (INDEX_FILE, daily_stats.STATS_FILE):
+                os.remove(directory + "/" + name)
+        _open_log()
+        # sort by time, not by name: "DD.MM.YY" names sort by the day of the month
+        # (timestamp, position) pairs, each time parsed once rather than by a sort key at every comparison
+        order = []
+        for index, name in enumerate(names):
+            try:
+                # file name "DD.MM.YY hh.mm.ss.txt" of the result's "DD.MM.YY hh:mm:ss"
+                order.append((parse_datetime(name[:9] + name[9:17].replace(".", ":")), index))
+            except ValueError:
+                order.append((0, index))
+        order.sort()
+        migrated = 0
+        for _, index in order:
+            name = names[index]
+            try:
+                with open(directory + "/" + name, "r") as file:
+                    _append(pack_record(Result.from_legacy_dict(json.load(file))))
+                migrated += 1
+            except (ValueError, KeyError) as e:
+                log.warning("Not migrated %s: %s", name, e)
+        with open(marker, "w") as file:
+            file.write(str(migrated))
+        log.info("Migrated %d of %d results", migrated, len(names))
+    for name in names:
+        os.remove(directory + "/" + name)
+    if _exists(directory + ".idx"):
+        os.remove(directory + ".idx")  # name index of the JSON files
+    os.remove(marker)  # last, the files above are gone
 
 
 def check_home_dir():
@@ -20,33 +637,132 @@ def check_home_dir():
         os.stat(directory)
     except OSError:
         os.mkdir(directory)
+    legacy = _open_log()
+    if legacy:
+        _migrate_json(legacy)
+    _check_index()
+    _recover()
+    if daily_stats.load() is None:
+        _build_stats()
 
 
-def save_system(data):
-    check_home_dir()
-    check_file_nr()
-    directory = GlobalSettings.save_directory
-    filename = data["DATE"].replace(":", ".")
-    # format: DD.MM.YY hh:mm:ss,
-    # only last two digits for year, because screen is too small to display 4
-    # but seconds are important to distinguish files saved in the same minute, when measuring multiple times fast
-    # seconds will be cut off in listview, also because of the small screen
-    file_name = directory + "/" + filename + ".txt"
-    with open(file_name, "w") as file:
-        json.dump(data, file)
+def save_system(result, ibi_list=None):
+    """Save a record.Result to the history, with the IBI series (ms) it was analysed from, to analyse it again later"""
+    if _Log.first == 0 and not _exists(GlobalSettings.save_directory):
+        check_home_dir()
+    record = pack_record(result)
+    timestamp, hr, flags = _index_entry(record)
+    record_id = _next_record_id()
+    entry = struct.pack(_INDEX_FORMAT, timestamp, record_id, hr, flags)
+    with open(_journal_path(), "wb") as file:
+        file.write(entry + struct.pack("<I", crc32(entry)))
+    _append(record, ibi_list)
+    _index_add(timestamp, record_id, hr, flags)
+    table = daily_stats.load()
+    if table is None:
+        _build_stats()  # counts the record too
+    else:
+        daily_stats.add(table, result, record_id)
+        daily_stats.write(table)
+    os.remove(_journal_path())
+    log.info("Saved: %d", result.timestamp)
     return True
 
 
+def update_record(record_id, result):
+    """Replace a saved result by a new analysis of its session, e.g. from src/reanalysis.py: the record is rewritten
+    at its place, so it keeps its id, its index entry and its IBI series, and its day is counted again in the daily
+    aggregates. The result must have the time of the record. Return False if the record is damaged or gone.
+    A power loss in between leaves the HR of the index entry, or the day in the aggregates, of the old result."""
+    saved = load_history_data(record_id)
+    if saved is None:
+        return False
+    if result.timestamp != saved.timestamp:
+        raise ValueError("Result time differs from the record")
+    record = pack_record(result)
+    segment = record_id // SEGMENT_RECORDS + 1
+    _overwrite(_segment_path(segment), _HEADER_SIZE + record_id % SEGMENT_RECORDS * RECORD_SIZE, record)
+    timestamp, hr, flags = _index_entry(record)
+    position = _index_position(timestamp, record_id)
+    if position >= 0:
+        _overwrite(_index_path(), position * INDEX_ENTRY_SIZE,
+                   struct.pack(_INDEX_FORMAT, timestamp, record_id, hr, flags))
+    table = daily_stats.load()
+    if table is None:
+        _build_stats()
+    else:
+        day = timestamp // daily_stats.SECONDS_PER_DAY
+        daily_stats.clear_day(table, day)
+        first, stop = find_range(day * daily_stats.SECONDS_PER_DAY, (day + 1) * daily_stats.SECONDS_PER_DAY - 1)
+        while first < stop:
+            entries = read_index(first, min(stop - first, 32))
+            for _, entry_id, _, _ in entries:
+                entry_result = load_history_data(entry_id)
+                if entry_result is not None:
+                    daily_stats.add(table, entry_result, entry_id)
+            first += len(entries)
+        daily_stats.write(table)
+    log.info("Updated: %d", timestamp)
+    return True
+
+
+def _list_name(entry):
+    return format_datetime(entry[0]).replace(":", ".")
+
+
 def load_history_list():
-    directory = GlobalSettings.save_directory + "/"
-    files = os.listdir(directory)
-    files.sort(reverse=True)  # newest first
-    return files
-
-
-def load_history_data(file_name):
-    directory = GlobalSettings.save_directory + "/"
-    path = directory + file_name
-    with open(path, 'r') as file:
-        data = json.load(file)
-    return data
+    """Return names of all saved results, newest first. Prefer HistorySource for showing them in a list."""
+    return [_list_name(entry) for entry in newest(_Log.index_count)]
+
+
+def load_history_data(record_id):
+    """Return the record.Result of a record id of the index, None if the record is damaged or gone."""
+    record = read_record(record_id)
+    return unpack_record(record) if record is not None else None
+
+
+class HistorySource:
+    """List view data source of saved results, newest first, read from the history index page by page.
+    Only one page of entries is kept in RAM, so opening history costs the same regardless of the history size.
+    Args:
+        prefix: fixed items shown before the history, e.g. ["Back"]
+        page_size: number of entries read from flash at once, should be at least the rows of one screen"""
+
+    def __init__(self, prefix=None, page_size=8):
+        self._prefix = prefix if prefix is not None else []
+        self._page_size = page_size
+        self._count = _Log.index_count
+        self._page = -1
+        self._page_entries = []
+
+    def __len__(self):
+        return len(self._prefix) + self._count
+
+    def get(self, index):
+        if index < len(self._prefix):
+            return self._prefix[index]
+        return _list_name(self._get_entry(index))
+
+    def load(self, index):
+        """Return the record.Result of the item at 'index' of the list, None if it's damaged."""
+        return load_history_data(self._get_entry(index)[1])
+
+    def row_of(self, position):
+        """Index in the list of the entry at 'position' of the index, see find_range()."""
+        return len(self._prefix) + self._count - 1 - position
+
+    def _get_entry(self, index):
+        index -= len(self._prefix)
+        page = index // self._page_size
+        if page != self._page:
+            self._load_page(page)
+        return self._page_entries[index - page * self._page_size]
+
+    def _load_page(self, page):
+        # newest first: n-th item is the (count - 1 - n)-th entry, so a page is a contiguous block read backwards
+        first = page * self._page_size
+        last = min(first + self._page_size, self._count) - 1
+        start = self._count - 1 - last
+        self._page_entries = read_index(start, last - first + 1)
+        self._page_entries.reverse()
+        self._page = page
@@ -1,7 +1,8 @@
 import time
 from src.utils import pico_stat
+from src import log
 from src.state import State
-from src.res.pic_loading_circle import LoadingCircle
+from src.boot import load_report
 import framebuf
 
 
@@ -73,6 +74,7 @@ class SettingsDebugInfo(State):
     def __init__(self, state_machine):
         super().__init__(state_machine)
         self._listview_info = None
+        self._log_lines = 8  # number of latest log lines to show
 
     def enter(self, args):
         self._view.remove_all()  # clear screen
@@ -94,8 +96,11 @@ class SettingsDebugInfo(State):
             mqtt_broker_ip = "IP: N/A"
         # state info
         state_count = len(self._state_machine.get_states_info())
+        state_total = len(self._state_machine.state_dict)
         # view info
-        active_view, inactive_view = self._view.get_stat()
+        active_count, inactive_count = self._view.get_stat()
+        # display info
+        rate, flush_cost_us, shown, merged, dropped = self._display.get_refresh_stats()
         show_items = ["[RAM]", f"Used:{ram_used}KB", f"Free:{ram_free}KB", f"Total:{ram_total}KB",
                       "",
                       "[Storage]", f"Free:{storage_free}KB",
@@ -104,9 +109,55 @@ class SettingsDebugInfo(State):
                       "",
                       "[MQTT]", mqtt_connected, mqtt_broker_ip,
                       "",
-                      "[State in RAM]", str(state_count),
-                      "",
-                      "[View]", f"Active:{len(active_view) + 1}", f"Inactive:{len(inactive_view)}"]
+                      "[State in RAM]", f"{state_count} of {state_total}",
+                      f"Evicted:{self._state_machine.evicted_count}",
+                      "[First entry] ms,B"]
+        # import and creation of each state loaded so far, name cut to fit the screen: 7 + 4 + 5 characters
+        for name, us, used in self._state_machine.get_load_stats():
+            show_items.append("{:<7}{:>4}{:>5}".format(name[:7], us // 1000, used))
+        show_items.extend(["",
+                           "[View]", f"Active:{active_count + 1}", f"Inactive:{inactive_count}",
+                           "",
+                           "[Display]", f"Rate:{rate}Hz", f"Flush:{flush_cost_us}us", f"Shown:{shown}",
+                           f"Merged:{merged}", f"Dropped:{dropped}",
+                           ""])
+        # loop() (L) and view refresh (D) durations of each state: p50/p99/max
+        show_items.append("[Loop] ms")
+        overruns = []
+        for name, loop, refresh in self._state_machine.get_loop_stats():
+            show_items.append(name[:16])
+            for part, stats in (("L", loop), ("D", refresh)):
+                show_items.append(
+                    f" {part} {stats.percentile(50) // 1000}/{stats.percentile(99) // 1000}/{stats.max // 1000}")
+                if stats.overruns:
+                    overruns.append(f"{name[:11]} {part}:{stats.overruns}")
+        show_items.append(f"[Over] >{self._state_machine.loop_budget_us // 1000}ms")
+        show_items.extend(overruns if overruns else ["None"])
+        show_items.append("")
+        # deferred jobs of the last measurement, if Measure is loaded: name, cost estimate us, deferred count
+        measure = self._state_machine.get_states_info().get(self._state_machine.STATE_MEASURE)
+        if measure is not None:
+            show_items.append("[Measure] us,def")
+            for name, cost_us, deferred in measure.get_deferred():
+                show_items.append("{:<7}{:>5}{:>4}".format(name[:7], cost_us, deferred))
+            show_items.append("")
+        runtime = self._state_machine.runtime
+        if runtime is not None:
+            # scheduling latency of each task: average/max
+            show_items.append("[Task late] ms")
+            for name, count, average_us, max_us in runtime.get_latency_stats():
+                show_items.append(f"{name}:{average_us // 1000}/{max_us // 1000}")
+            show_items.append("")
+        show_items.append("[Boot] ms,KB free")
+        # one phase per line, name cut to fit the screen: 8 + 4 + 4 characters
+        for name, us, free in load_report():
+            if name.startswith("src."):
+                name = name[4:]
+            show_items.append("{:<8}{:>4}{:>4}".format(name[:8], us // 1000, free // 1024))
+        show_items.extend(["", "[Log]"])
+        # newest last, without the timestamp to fit the screen
+        for line in log.get_lines()[-self._log_lines:]:
+            show_items.append(line.split(" ", 1)[1])
         # active_view plus 1 because the view next line not yet activated
         self._listview_info = self._view.add_list(items=show_items, y=14, read_only=True)
         self._rotary_encoder.enable_rotate(items_count=self._listview_info.get_page_max() + 1, position=0)
@@ -129,11 +180,7 @@ class SettingsWifi(State):
         self._textview_ip = None
         self._last_check_time = 0
         self._connecting = False
-
-        # for animation
-        self._animation_refresh_time = time.ticks_ms()
-        self._animation_index = 0
-        self._loading_circle = LoadingCircle()
+        self._loading = None
 
     def enter(self, args):
         self._view.remove_all()  # clear screen
@@ -144,23 +191,23 @@ class SettingsWifi(State):
         self._textview_ip = self._view.add_text(text="", x=0, y=24)
         self._last_check_time = 0
         self._connecting = False
-
-        # for animation
-        self._animation_refresh_time = time.ticks_ms()
-        self._animation_index = 0
+        self._loading = None
 
         if self._data_network.is_wlan_connected():
             self._textview_info.set_text("Connected")
             self._textview_ip.set_text(self._data_network.get_wlan_ip())
         self._rotary_encoder.enable_press()
 
+    def next_loop_ms(self):
+        return max(0, 1000 - time.ticks_diff(time.ticks_ms(), self._last_check_time))
+
     def loop(self):
         # check Wi-Fi every 1s
         if time.ticks_diff(time.ticks_ms(), self._last_check_time) > 1000:
             self._last_check_time = time.ticks_ms()
             if self._data_network.is_wlan_connected() and self._connecting:
                 self._connecting = False
-                self._display.fill_rect(0, 20, 128, 44, 0)
+                self._view.remove(self._loading)
                 self._textview_info.set_text("Connected")
                 self._textview_ip.set_text(self._data_network.get_wlan_ip())
                 return
@@ -170,18 +217,9 @@ class SettingsWifi(State):
                 self._connecting = True
                 self._textview_info.set_text("")
                 self._textview_ip.set_text("")
-                self._display.text("Connecting", 24, 56, 1)
+                self._loading = self._view.add_loading("Connecting")  # animated by view.refresh()
                 self._data_network.connect_wlan()
 
-        # display loading animation when connecting
-        if self._connecting:
-            if time.ticks_ms() - self._animation_refresh_time > 5:
-                buf = framebuf.FrameBuffer(self._loading_circle.seq[self._animation_index], 32, 32, framebuf.MONO_VLSB)
-                self._display.blit(buf, 48, 20)
-                self._display.show()
-                self._animation_index = (self._animation_index + 1) % len(self._loading_circle.seq)
-                self._animation_refresh_time = time.ticks_ms()
-
         event = self._rotary_encoder.get_event()
         if event == self._rotary_encoder.EVENT_PRESS:
             self._view.remove_all()
@@ -204,12 +242,14 @@ class SettingsMqtt(State):
             self._textview_info.set_text("Connecting...")
             self._textview_ip.set_text("IP: N/A")
             self._display.show()
-            # force update display directly, because the next line blocks the program!
-            self._rotary_encoder.disable_press()  # just in case user press button a lot while sending
-            self._data_network.connect_mqtt()
-            self._rotary_encoder.enable_press()
-        # update status
-        if not self._data_network.is_mqtt_connected():
+            # force update display directly, because the connection blocks the program!
+            # press is enabled again when it's done, just in case user press button a lot while connecting
+            self._state_machine.submit_io(self._data_network.connect_mqtt, [], self._show_status)
+        else:
+            self._show_status(True)
+
+    def _show_status(self, connected):
+        if not connected:
             self._textview_info.set_text("Failed")
             self._textview_ip.set_text("IP: N/A")
         else:
@@ -5,11 +5,23 @@ Every state class must have the following methods:
 - enter(): to initialize variables, set ui, set rotary encoder(press, rotate), etc. called when the state is entered
 - loop(): called repeatedly until the state is changed
 
+Optional methods:
+- sensor(): process sensor data, e.g. sensor fifo -> IBI. Called before each loop() by the polling main loop,
+  and by the sensor task with the asyncio runtime (src/runtime.py), so it must not touch the UI.
+- next_loop_ms(): time until loop() needs to run again when nothing happens, None (default) if only an encoder
+  event needs it. The runtime sleeps until then, so a state that polls something must return a time.
+- blocking network calls go through state_machine.submit_io(function, args, callback), which runs them in the
+  network task with the asyncio runtime.
+
+A loop() doing several kinds of work can hand them to a LoopScheduler, which runs them in priority order
+within a time budget and defers the rest to the next loop(), see Measure.
+
 Setting next state:
 - To set the next state, call state_machine.set(state_code, args)
 - The state_code is defined in the StateMachine class, the data type is int
 - The args is a list of arguments to pass to the next state. (to method enter())
 """
+import time
 
 
 class State:
@@ -29,3 +41,53 @@ class State:
 
     def loop(self):
         raise NotImplementedError("This method must be defined and overridden")
+
+    def sensor(self):
+        return
+
+    def next_loop_ms(self):
+        return None
+
+
+class LoopScheduler:
+    """Runs the work of one loop() iteration by priority within a time budget.
+
+    Each job has a priority (lower first), a cost estimate in us, a due() check and the work() itself.
+    A due job runs if its estimated cost still fits in the budget left, otherwise it's deferred: skipped in this
+    iteration and counted, its due() is still true in the next one. Jobs of PRIORITY_ALWAYS run regardless of
+    the budget, e.g. sample processing. The estimate starts at the declared cost and follows the measured
+    run times, so it adapts to the real cost on the device.
+    work() returns True to end the iteration, e.g. after setting the next state."""
+    PRIORITY_ALWAYS = 0
+
+    def __init__(self):
+        self._jobs = []  # [priority, cost us, due, work, name, deferred count], by priority
+        self.deferred = 0
+
+    def add(self, name, priority, cost_us, due, work):
+        self._jobs.append([priority, cost_us, due, work, name, 0])
+        self._jobs.sort(key=lambda job: job[0])
+
+    def run(self, budget_us):
+        start = time.ticks_us()
+        for job in self._jobs:
+            if not job[2]():
+                continue
+            job_start = time.ticks_us()
+            if job[0] != self.PRIORITY_ALWAYS and time.ticks_diff(job_start, start) + job[1] > budget_us:
+                job[5] += 1
+                self.deferred += 1
+                continue
+            done = job[3]()
+            job[1] = (job[1] * 3 + time.ticks_diff(time.ticks_us(), job_start)) // 4
+            if done:
+                return
+
+    def get_stats(self):
+        """Return a list of (name, cost estimate us, deferred count) of each job, by priority."""
+        return [(job[4], job[1], job[5]) for job in self._jobs]
+
+    def clear_stats(self):
+        self.deferred = 0
+        for job in self._jobs:
+            job[5] = 0
@@ -1,11 +1,11 @@
+import gc
+import sys
+import time
 from src.hardware import Display, RotaryEncoder, HeartSensor
+from src import log
 from src.view import View
+from src.data_structure import LogHistogram
 from src.pico_network import PicoNetwork
-from src.main_menu import MainMenu
-from src.measure import MeasureWait, Measure
-from src.measure_analysis import MeasureResultCheck, HRVAnalysis, KubiosAnalysis
-from src.result import ShowHistory, ShowResult
-from src.settings import Settings, SettingsDebugInfo, SettingsWifi, SettingsMqtt, SettingsAbout
 
 
 class StateMachine:
@@ -30,43 +30,109 @@ class StateMachine:
     STATE_SETTINGS_WIFI = 16
     STATE_SETTINGS_MQTT = 17
     STATE_SETTINGS_ABOUT = 18
+    MODULE_RECORD = 19
+    STATE_RECORD = 20
+    STATE_HISTORY_JUMP = 21
 
-    # map the state code to each class object
-    state_dict = {STATE_MENU: MainMenu,
-                  STATE_MEASURE_WAIT: MeasureWait,
-                  STATE_MEASURE: Measure,
-                  STATE_MEASURE_RESULT_CHECK: MeasureResultCheck,
-                  STATE_HRV_ANALYSIS: HRVAnalysis,
-                  STATE_KUBIOS_ANALYSIS: KubiosAnalysis,
-                  STATE_SHOW_HISTORY: ShowHistory,
-                  STATE_SHOW_RESULT: ShowResult,
-                  STATE_SETTINGS: Settings,
-                  STATE_SETTINGS_DEBUG_INFO: SettingsDebugInfo,
-                  STATE_SETTINGS_WIFI: SettingsWifi,
-                  STATE_SETTINGS_MQTT: SettingsMqtt,
-                  STATE_SETTINGS_ABOUT: SettingsAbout,
+    # map the state code to the module and class name of each state,
+    # the module is imported and the state is created on the first set() of the state
+    state_dict = {STATE_MENU: ("src.main_menu", "MainMenu"),
+                  STATE_MEASURE_WAIT: ("src.measure", "MeasureWait"),
+                  STATE_MEASURE: ("src.measure", "Measure"),
+                  STATE_MEASURE_RESULT_CHECK: ("src.measure_analysis", "MeasureResultCheck"),
+                  STATE_HRV_ANALYSIS: ("src.measure_analysis", "HRVAnalysis"),
+                  STATE_KUBIOS_ANALYSIS: ("src.measure_analysis", "KubiosAnalysis"),
+                  STATE_SHOW_HISTORY: ("src.result", "ShowHistory"),
+                  STATE_SHOW_RESULT: ("src.result", "ShowResult"),
+                  STATE_HISTORY_JUMP: ("src.result", "HistoryJump"),
+                  STATE_SETTINGS: ("src.settings", "Settings"),
+                  STATE_SETTINGS_DEBUG_INFO: ("src.settings", "SettingsDebugInfo"),
+                  STATE_SETTINGS_WIFI: ("src.settings", "SettingsWifi"),
+                  STATE_SETTINGS_MQTT: ("src.settings", "SettingsMqtt"),
+                  STATE_SETTINGS_ABOUT: ("src.settings", "SettingsAbout"),
+                  STATE_RECORD: ("src.ppg_recorder", "RecordPPG"),
                   }
+    # rarely used states, dropped from RAM (least recently used first) when more than max_states are loaded
+    evictable = (STATE_SETTINGS_DEBUG_INFO, STATE_SETTINGS_WIFI, STATE_SETTINGS_MQTT, STATE_SETTINGS_ABOUT,
+                 STATE_RECORD)
 
-    def __init__(self):
-        self.display = Display()
+    def __init__(self, display=None, data_network=None, max_states=None, loop_budget_us=None):
+        """display and data_network can be created before, e.g. by the staged boot, otherwise they're created here.
+        max_states: number of states kept in RAM before evictable states are dropped, None to keep all
+        loop_budget_us: loop() or refresh() durations above it are counted as overruns,
+                        None for the time the sampling timer takes to fill half of the sensor fifo"""
+        self.display = display if display is not None else Display()
         self.rotary_encoder = RotaryEncoder()
         self.heart_sensor = HeartSensor()
+        self.display.governor.set_heart_sensor(self.heart_sensor)
         self.view = View(self.display)
-        self.data_network = PicoNetwork()
+        self.data_network = data_network if data_network is not None else PicoNetwork()
         self.current_module = self.MODULE_MENU
         self._args = None
-        self._states = {}
+        self._states = {}  # state code: state object, only the loaded ones
+        self._recent = []  # codes of loaded states, least recently used first
+        self.max_states = max_states
+        self._load_stats = {}  # state code: (class name, first entry us, RAM bytes)
+        self.evicted_count = 0
         self._state = None
+        self._state_code = None
         self._switched = False
+        if loop_budget_us is None:
+            loop_budget_us = (self.heart_sensor.sensor_fifo.size // 2 * 1000000
+                              // self.heart_sensor.get_sampling_rate())
+        self.loop_budget_us = loop_budget_us
+        self._loop_stats = {}  # state code: (loop() histogram, view refresh histogram), see get_loop_stats()
+        self.io_queue = None  # list of (function, args, callback) when the asyncio runtime runs, see submit_io()
+        self.runtime = None  # the asyncio runtime (src/runtime.py) while it runs
+        self.io_wake = None  # set() when a call is queued, e.g. a ThreadSafeFlag of the runtime
 
-    def get_state(self, state_class_obj):
-        if state_class_obj not in self._states:
-            self._states[state_class_obj] = state_class_obj(self)  # pass self to state class, to give property access
-        return self._states[state_class_obj]
+    def get_state(self, state_code):
+        """Return the state object of the code, imported and created if it's not loaded yet."""
+        state = self._states.get(state_code)
+        if state is None:
+            state = self._load_state(state_code)
+        else:
+            self._recent.remove(state_code)
+        self._recent.append(state_code)
+        if self.max_states is not None and len(self._states) > self.max_states:
+            self._evict(keep=state)
+        return state
 
     def preload_states(self):
-        for state_class_obj in self.state_dict.values():
-            self.get_state(state_class_obj)
+        """Load all states at once, e.g. for benchmarks, the device loads them on demand"""
+        for state_code in self.state_dict:
+            self.get_state(state_code)
+
+    def get_load_stats(self):
+        """Return a list of (class name, first entry us, RAM bytes) of each state loaded so far, in code order.
+        The time is the import and the creation of the state, the RAM is what stays allocated after them."""
+        return [self._load_stats[code] for code in sorted(self._load_stats)]
+
+    def _load_state(self, state_code):
+        module_name, class_name = self.state_dict[state_code]
+        gc.collect()
+        free = gc.mem_free()
+        start = time.ticks_us()
+        __import__(module_name)
+        state = getattr(sys.modules[module_name], class_name)(self)  # pass self to state class, to give property access
+        elapsed = time.ticks_diff(time.ticks_us(), start)
+        gc.collect()
+        used = free - gc.mem_free()
+        if state_code not in self._load_stats:
+            self._load_stats[state_code] = (class_name, elapsed, used)
+        log.info("Loaded %s: %d us, %d B", class_name, elapsed, used)
+        self._states[state_code] = state
+        return state
+
+    def _evict(self, keep):
+        for state_code in self._recent:
+            state = self._states[state_code]
+            if state_code in self.evictable and state is not keep and state is not self._state:
+                del self._states[state_code]
+                self._recent.remove(state_code)
+                self.evicted_count += 1
+                log.info("Evicted %s", self.state_dict[state_code][1])
+                return
 
     def set(self, state_code, args=None):
         # store additional arguments for the next state.enter()
@@ -74,24 +140,99 @@ class StateMachine:
             raise ValueError("args must be a list")
         try:
             self._args = args
-            state = self.state_dict[state_code]
-            self._state = self.get_state(state)
+            self._state = self.get_state(state_code)
+            self._state_code = state_code
             self._switched = True
+            log.info("State: %d", state_code)
         except KeyError:
             raise ValueError("Invalid state code to switch to")
 
     def run(self):
-        if self._switched:
-            # disable all irq automatically in case of fifo overflow
-            self.heart_sensor.stop()
-            self.rotary_encoder.disable_press()
-            self.rotary_encoder.disable_rotate()
-            self._switched = False
-            self._state.enter(self._args)
+        """One iteration of the polling main loop. With the asyncio runtime (src/runtime.py), each part of it
+        is run by its own task instead: enter_switched(), process_sensor(), loop_state() and view.refresh()."""
+        if self.enter_switched():
             return
             # skip loop() in the first run, because state can be changed again during enter()
+        state_code = self._state_code  # loop() may set the next state
+        start = time.ticks_us()
+        self._state.sensor()
+        self._state.loop()
+        looped = time.ticks_us()
+        self.view.refresh()
+        end = time.ticks_us()
+        loop_stats, refresh_stats = self._get_loop_stats(state_code)
+        loop_stats.add(time.ticks_diff(looped, start))
+        refresh_stats.add(time.ticks_diff(end, looped))
+
+    def enter_switched(self):
+        """Call enter() of the state set by set(), return True if a state was entered."""
+        if not self._switched:
+            return False
+        # disable all irq automatically in case of fifo overflow
+        self.heart_sensor.stop()
+        self.rotary_encoder.disable_press()
+        self.rotary_encoder.disable_rotate()
+        self._switched = False
+        self._state.enter(self._args)
+        return True
+
+    def loop_state(self):
+        state_code = self._state_code
+        start = time.ticks_us()
         self._state.loop()
+        self._get_loop_stats(state_code)[0].add(time.ticks_diff(time.ticks_us(), start))
+
+    def refresh_view(self):
+        """view.refresh(), timed like in run(), for the display task of the asyncio runtime"""
+        state_code = self._state_code
+        start = time.ticks_us()
         self.view.refresh()
+        self._get_loop_stats(state_code)[1].add(time.ticks_diff(time.ticks_us(), start))
+
+    def next_loop_ms(self):
+        """Time until loop_state() needs to run again without an encoder event, None if only an event needs it."""
+        if self._switched:
+            return 0
+        return self._state.next_loop_ms()
+
+    def process_sensor(self):
+        if not self._switched:  # the next state is not entered yet
+            self._state.sensor()
+
+    def submit_io(self, function, args, callback):
+        """Run a blocking network call, then callback(result). Run at once without the asyncio runtime,
+        with it the call is queued for the network task, so it doesn't run in the middle of a state's loop()."""
+        if self.io_queue is None:
+            callback(function(*args))
+        else:
+            self.io_queue.append((function, args, callback))
+            if self.io_wake is not None:
+                self.io_wake.set()
+
+    def _get_loop_stats(self, state_code):
+        stats = self._loop_stats.get(state_code)
+        if stats is None:
+            stats = (LogHistogram(budget_us=self.loop_budget_us), LogHistogram(budget_us=self.loop_budget_us))
+            self._loop_stats[state_code] = stats
+        return stats
+
+    def get_loop_stats(self):
+        """Return a list of (class name, loop() histogram, view refresh histogram) of each state run so far,
+        in code order. The histograms are data_structure.LogHistogram of durations in us, kept after eviction."""
+        return [(self.state_dict[code][1],) + self._loop_stats[code] for code in sorted(self._loop_stats)]
+
+    def clear_loop_stats(self):
+        self._loop_stats = {}
+
+    def dump_loop_stats(self):
+        """Print the loop durations of each state to the serial console, e.g. from the REPL after Ctrl-C:
+        >>> state_machine.dump_loop_stats()"""
+        print("loop durations, us, budget {} us".format(self.loop_budget_us))
+        print("{:<20}{:<8}{:>8}{:>8}{:>8}{:>8}{:>6}".format("state", "part", "count", "p50", "p99", "max", "over"))
+        for name, loop_stats, refresh_stats in self.get_loop_stats():
+            for part, stats in (("loop", loop_stats), ("refresh", refresh_stats)):
+                print("{:<20}{:<8}{:>8}{:>8}{:>8}{:>8}{:>6}".format(
+                    name, part, stats.count, stats.percentile(50), stats.percentile(99), stats.max, stats.overruns))
 
     def set_module(self, module):
         """The module is used to determine the next state accordingly,
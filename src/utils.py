@@ -1,4 +1,3 @@
-import time
 import os
 import gc
 import machine
@@ -6,7 +5,6 @@ import json
 
 
 class GlobalSettings:
-    print_log = False
     save_directory = "Saved_Values"
     files_limit = 1000
     wifi_ssid = ""
@@ -18,11 +16,6 @@ class GlobalSettings:
     kubios_client_secret = ""
 
 
-def print_log(message):
-    if GlobalSettings.print_log:
-        print(time.ticks_ms(), message)
-
-
 def pico_stat():
     """Return a tuple of used ram, free ram, total ram, free storage, all in KB.
     Note: If the result is going to be printed out in Thonny, the ram usage is inaccurate.
@@ -65,7 +58,67 @@ def get_datetime():
     rtc = machine.RTC()  # time initialization
     year, month, day, _, hour, minute, second, _ = rtc.datetime()
     year = year % 100  # only last 2 digits
-    datetime = "{:02d}.{:02d}.{} {:02d}:{:02d}:{:02d}".format(day, month, year, hour, minute, second)
+    datetime = "{:02d}.{:02d}.{:02d} {:02d}:{:02d}:{:02d}".format(day, month, year, hour, minute, second)
     return datetime
 
 
+def get_timestamp():
+    """RTC time as seconds since 2000, see to_timestamp()."""
+    year, month, day, _, hour, minute, second, _ = machine.RTC().datetime()
+    return to_timestamp(year, month, day, hour, minute, second)
+
+
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def to_timestamp(year, month, day, hour, minute, second):
+    """Seconds since 2000-01-01 00:00:00, the epoch of MicroPython, for the years 2000 to 2099.
+    Calculated here rather than by time.mktime(), which has another epoch on the host."""
+    years = year - 2000
+    days = years * 365 + (years + 3) // 4
+    for month_index in range(month - 1):
+        days += _MONTH_DAYS[month_index]
+    if month > 2 and years % 4 == 0:
+        days += 1
+    days += day - 1
+    return ((days * 24 + hour) * 60 + minute) * 60 + second
+
+
+def days_in_month(year, month):
+    return _MONTH_DAYS[month - 1] + (1 if month == 2 and year % 4 == 0 else 0)
+
+
+def from_timestamp(timestamp):
+    """Return (year, month, day, hour, minute, second) of seconds since 2000-01-01, see to_timestamp()."""
+    minutes, second = divmod(timestamp, 60)
+    hours, minute = divmod(minutes, 60)
+    days, hour = divmod(hours, 24)
+    year = 2000
+    while days >= (366 if year % 4 == 0 else 365):
+        days -= 366 if year % 4 == 0 else 365
+        year += 1
+    month = 1
+    for month_days in _MONTH_DAYS:
+        if month == 2 and year % 4 == 0:
+            month_days += 1
+        if days < month_days:
+            break
+        days -= month_days
+        month += 1
+    return year, month, days + 1, hour, minute, second
+
+
+def parse_datetime(datetime):
+    """Timestamp of a "DD.MM.YY hh:mm:ss" string of get_datetime(), ValueError if it's malformed."""
+    if len(datetime) != 17:
+        raise ValueError("Invalid date time: " + datetime)
+    return to_timestamp(2000 + int(datetime[6:8]), int(datetime[3:5]), int(datetime[0:2]),
+                        int(datetime[9:11]), int(datetime[12:14]), int(datetime[15:17]))
+
+
+def format_datetime(timestamp):
+    """"DD.MM.YY hh:mm:ss" of a timestamp, like get_datetime()"""
+    year, month, day, hour, minute, second = from_timestamp(timestamp)
+    return "{:02d}.{:02d}.{:02d} {:02d}:{:02d}:{:02d}".format(day, month, year % 100, hour, minute, second)
+
+
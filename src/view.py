@@ -1,19 +1,30 @@
 import array
-from src.res.pic_icon import icon_hr, icon_hrv, icon_kubios, icon_history, icon_settings
+import time
+from src.res.sprite import get_sprite_sheet, ICONS, LOADING_CIRCLE
 import framebuf
-from src.utils import print_log
-import os
+from micropython import const
+from src import log
+
+_LOG_DEBUG = const(0)  # set to 1 to compile in debug logging of view management and rendering
+_LOADING_FRAME_MS = const(40)  # max 25 fps of the loading animation, the refresh governor may show fewer
 
 
 class View:
     def __init__(self, display):
         """Args:
-        display: the display is the instance of SSD1306, to be used for rendering the views."""
+        display: the display is the instance of SSD1306, to be used for rendering the views.
+        Every view component added gets a handle (its vid) stored on itself, so add, remove and lookup are O(1).
+        Removed components are kept in a pool per type and reused by the next add of the same type."""
         self._display = display
         self.width = display.width
         self.height = display.height
-        self._active_views = {}
-        self._inactive_views = {}  # a separate dict with type as key for quicker search
+        self._active_views = {}  # vid: view
+        # pool of removed views, type as key. All keys are created here, add/remove only push/pop the lists
+        self._inactive_views = {}
+        for constructor in (TextView, ListView, GraphView, MenuView, NumberView, LoadingView):
+            self._inactive_views[constructor.type] = []
+        self._next_vid = 0  # auto vid is an int counter, never collides with user vid, which is a str
+        self._animated_views = []  # active views advanced by refresh(), e.g. loading animation
 
     def add_text(self, text, x, y, invert=False, invert_mode=1, vid=None):
         return self._add_view(TextView, vid, text, x, y, invert, invert_mode)
@@ -27,75 +38,93 @@ class View:
     def add_menu(self, vid=None):
         return self._add_view(MenuView, vid)
 
+    def add_number(self, value, x, y, digits=3, scale=1, unit="", vid=None):
+        return self._add_view(NumberView, vid, value, x, y, digits, scale, unit)
+
+    def add_loading(self, text, y=20, vid=None):
+        view = self._add_view(LoadingView, vid, text, y)
+        self._animated_views.append(view)
+        return view
+
     def set_update(self, force=False):
         self._display.set_update(force)
 
+    def ms_until_animation(self):
+        """Time until the next frame of an animated view, None if there's none."""
+        if not self._animated_views:
+            return None
+        now = time.ticks_ms()
+        return min(view._ms_until_frame(now) for view in self._animated_views)
+
     def refresh(self):
+        if self._animated_views:
+            now = time.ticks_ms()
+            for view in self._animated_views:
+                view._animate(now)
         self._display.refresh()
 
     def remove_by_id(self, vid):
-        if vid not in self._active_views.keys():
+        view = self._active_views.pop(vid, None)
+        if view is None:
             raise ValueError("View not found")
-        # remove from active views and add to inactive views
-        type_str = self._active_views[vid].type
-        self._active_views[vid]._clear()
-        self._active_views[vid]._active = False
-        if self._inactive_views[type_str] is None:
-            self._inactive_views[type_str] = [self._active_views.pop(vid)]
-        else:
-            self._inactive_views[type_str].append(self._active_views.pop(vid))
-        print_log(f"View removed: {type_str}, active: {self._active_views}, inactive: {self._inactive_views}")
+        # clear and move to the pool of its type
+        view._clear()
+        view._active = False
+        view._vid = None
+        self._inactive_views[view.type].append(view)
+        if view.type == LoadingView.type:
+            self._animated_views.remove(view)
+        if _LOG_DEBUG:
+            log.debug("View removed: %s, active: %d", view.type, len(self._active_views))
 
     def remove(self, view):
-        vid = ""
-        for key, value in self._active_views.items():
-            if value is view:
-                vid = key
-                break  # get one if enough because vid is unique as key
-        if vid == "":
+        if not view._active or self._active_views.get(view._vid) is not view:
             raise ValueError("View not found")
-        self.remove_by_id(vid)
+        self.remove_by_id(view._vid)
 
     def remove_all(self):
-        for vid in list(self._active_views.keys()):
-            self.remove_by_id(vid)
+        for view in self._active_views.values():
+            view._clear()
+            view._active = False
+            view._vid = None
+            self._inactive_views[view.type].append(view)
+        self._active_views.clear()
+        self._animated_views.clear()
 
     def select_by_id(self, vid):
-        if vid not in self._active_views.keys():
+        view = self._active_views.get(vid)
+        if view is None:
             raise ValueError("View not found")
-        return self._active_views[vid]
+        return view
 
     def get_stat(self):
-        return self._active_views, self._inactive_views
-
-    def _add_view(self, constructor, vid: str, *args, **kwargs):
-        self._vid_checker(vid)
-        if constructor.type not in self._inactive_views.keys():
-            self._inactive_views[constructor.type] = []
-
-        if len(self._inactive_views[constructor.type]) == 0:
-            view = constructor(self._display, *args, **kwargs)
-            self._active_views[self._vid_checker(vid)] = view
-            print_log(f"View added: {constructor.type}, active: {self._active_views}, inactive: {self._inactive_views}")
-            return view
-        else:
-            inactive_views = self._inactive_views[constructor.type]  # get inactive views from the list of the type
-            view = inactive_views.pop()  # get one
-            self._active_views[self._vid_checker(vid)] = view
-            view._reinit(*args, **kwargs)
-            print_log(
-                f"View reused: {constructor.type}, active: {self._active_views}, inactive: {self._inactive_views}")
-            return view
-
-    def _vid_checker(self, vid):
+        """Return the number of active and inactive (pooled) view components."""
+        inactive_count = 0
+        for views in self._inactive_views.values():
+            inactive_count += len(views)
+        return len(self._active_views), inactive_count
+
+    def _add_view(self, constructor, vid, *args, **kwargs):
+        """vid: str, or None for an auto vid"""
         if vid is None:
-            vid = os.urandom(4).hex()
-            while vid in self._active_views.keys():
-                vid = os.urandom(4).hex()
+            vid = self._next_vid
+            self._next_vid += 1
+        elif vid in self._active_views:
+            raise ValueError("View ID already exists")
+
+        pool = self._inactive_views[constructor.type]
+        if pool:
+            view = pool.pop()
+            view._reinit(*args, **kwargs)
+            if _LOG_DEBUG:
+                log.debug("View reused: %s, active: %d", constructor.type, len(self._active_views) + 1)
         else:
-            if vid in self._active_views.keys():
-                raise ValueError("View ID already exists")
-        return vid
+            view = constructor(self._display, *args, **kwargs)
+            if _LOG_DEBUG:
+                log.debug("View added: %s, active: %d", constructor.type, len(self._active_views) + 1)
+        view._vid = vid
+        self._active_views[vid] = view
+        return view
 
 
 class TextView:
@@ -166,7 +195,10 @@ class TextView:
 class ListView:
     """Methods: set_items, set_selection, set_page, get_page_max, get_page, get_selection_max.
     Note: current selection is got from rotary encoder get_position() method, which is absolute position
-    ListView doesn't remember index of current selection, it should be managed by the caller."""
+    ListView doesn't remember index of current selection, it should be managed by the caller.
+    Items can be a list of strings, or a data source object with len() and get(index) methods,
+    only the rows on screen are got from the data source, so it can be backed by storage (see HistorySource).
+    The length of a data source must not change until set_items is called again."""
     type = "list"
     _arrow_top = array.array('H', [3, 0, 0, 5, 6, 5])  # coordinates array of the poly vertex
     _arrow_bottom = array.array('H', [0, 0, 6, 0, 3, 5])
@@ -183,6 +215,7 @@ class ListView:
         self._slider_min_height = 2
         # param
         self._items = items
+        self._item_count = 0  # cached len(items), a data source may be costly to query
         self._y = y
         self._spacing = spacing
         self._read_only = read_only
@@ -199,11 +232,11 @@ class ListView:
 
     def get_page_max(self):
         """Get the max page index, starting from 0"""
-        return len(self._items) - self._display_count
+        return self._item_count - self._display_count
 
     def get_selection_max(self):
         """Get the max selection index, starting from 0"""
-        return len(self._items) - 1
+        return self._item_count - 1
 
     def need_scrollbar(self):
         """Return True if the list view needs a scrollbar, the caller can decide to set rotation irq of encoder"""
@@ -240,23 +273,25 @@ class ListView:
             raise ValueError("Trying to set an inactive view component")
         self._clear()
         self._items = items
+        self._item_count = len(items)
         # get max display count at once
         available_height = self._display.height - self._y
         item_height = self._font_size + self._spacing
         max_display_count = available_height // item_height
         if available_height % item_height > self._font_size:
             max_display_count += 1
-        print_log(f"List view item per page: {max_display_count}, total: {len(self._items)}")
+        if _LOG_DEBUG:
+            log.debug("List view item per page: %d, total: %d", max_display_count, self._item_count)
 
         # set scrollbar
-        if max_display_count >= len(self._items):
+        if max_display_count >= self._item_count:
             self._show_scrollbar = False
         else:
             self._show_scrollbar = True
-            self._slider_height = int(max_display_count / len(self._items) * (
+            self._slider_height = int(max_display_count / self._item_count * (
                     self._slider_bottom - self._slider_top - self._slider_min_height) + self._slider_min_height)
         # display count at once
-        self._display_count = min(max_display_count, len(self._items))
+        self._display_count = min(max_display_count, self._item_count)
         self._page = 0  # set view index to first item
         self.set_selection(0)
 
@@ -278,9 +313,9 @@ class ListView:
     def _draw_scrollbar(self):
         scrollbar_width = 5
         slider_width = scrollbar_width - 2
-        assert self._display_count <= len(self._items), "No need to draw scroll bar"
+        assert self._display_count <= self._item_count, "No need to draw scroll bar"
 
-        slider_y = round(self._page / (len(self._items) - self._display_count) * (
+        slider_y = round(self._page / (self._item_count - self._display_count) * (
                 self._slider_bottom - self._slider_top - self._slider_height) + self._slider_top)
         # scrollbar outline
         self._display.rect(self._display.width - scrollbar_width - 1, self._scrollbar_top, scrollbar_width,
@@ -294,17 +329,23 @@ class ListView:
         else:
             self._display.poly(self._display.width - 7, self._y, self._arrow_top, 1, 1)
         # draw arrow on bottom, 6 is the height of the arrow
-        if self._page == len(self._items) - self._display_count:
+        if self._page == self._item_count - self._display_count:
             self._display.poly(self._display.width - 7, self._display.height - 6, self._arrow_bottom, 1, 0)
         else:
             self._display.poly(self._display.width - 7, self._display.height - 6, self._arrow_bottom, 1, 1)
 
+    def _get_item(self, index):
+        if isinstance(self._items, list):
+            return self._items[index]
+        return self._items.get(index)
+
     def _update_framebuffer(self, selection):
         for i in range(self._page, self._page + self._display_count):
-            print_log(f"List view showing: {i} / {len(self._items) - 1}")
+            if _LOG_DEBUG:
+                log.debug("List view showing: %d / %d", i, self._item_count - 1)
             text_y = self._y + (i - self._page) * (self._font_size + self._spacing)
             # truncate text if too long
-            text = self._items[i]
+            text = self._get_item(i)
             max_text_length = self._display.width // self._font_size - 1 * (
                 not self._read_only) - 1 * self._show_scrollbar
             if len(text) > max_text_length:
@@ -348,9 +389,9 @@ class GraphView:
         self._speed = speed
 
     def set_value(self, value, min_val, max_val):
-        """Set value to be displayed, will automatically update the frame buffer with force=True.
-        That means the interval of updating should be handled by the caller,
-        so refresh rate of graph can be different from the screen."""
+        """Set value to be displayed, will automatically update the frame buffer.
+        The interval of adding points should be handled by the caller, the screen shows the graph
+        at the rate of the refresh governor, so several points can appear in one frame."""
         if not self._active:
             raise ValueError("Trying to set an inactive view component")
         self._update_framebuffer(value, min_val, max_val)
@@ -394,21 +435,18 @@ class GraphView:
         self._last_x = self._x
         self._last_y = y
 
-        # self._display.set_update()
-        self._display.set_update(force=True)
+        # coalesced with other updates, the refresh governor decides when it's shown
+        self._display.set_update()
 
 
 class MenuView:
     type = "menu"
-    _icon_buf_hr = framebuf.FrameBuffer(icon_hr, 32, 32, framebuf.MONO_VLSB)
-    _icon_buf_hrv = framebuf.FrameBuffer(icon_hrv, 32, 32, framebuf.MONO_VLSB)
-    _icon_buf_kubios = framebuf.FrameBuffer(icon_kubios, 32, 32, framebuf.MONO_VLSB)
-    _icon_buf_history = framebuf.FrameBuffer(icon_history, 32, 32, framebuf.MONO_VLSB)
-    _icon_buf_settings = framebuf.FrameBuffer(icon_settings, 32, 32, framebuf.MONO_VLSB)
+    _texts = ("HR Measure", "HRV Analysis", "Kubios Analysis", "History", "Record PPG", "Settings")
 
     def __init__(self, display):
         self._display = display
         self._active = True
+        self._icons = get_sprite_sheet(ICONS)  # icons are read from flash, one at a time
 
     def set_selection(self, selection):
         if not self._active:
@@ -423,29 +461,174 @@ class MenuView:
         self._display.set_update()
 
     def _update_framebuffer(self, selection):
-        if selection == 0:
-            icon_buf = self._icon_buf_hr
-            text = "HR Measure"
-        elif selection == 1:
-            icon_buf = self._icon_buf_hrv
-            text = "HRV Analysis"
-        elif selection == 2:
-            icon_buf = self._icon_buf_kubios
-            text = "Kubios Analysis"
-        elif selection == 3:
-            icon_buf = self._icon_buf_history
-            text = "History"
-        elif selection == 4:
-            icon_buf = self._icon_buf_settings
-            text = "Settings"
-        else:
+        if not 0 <= selection < len(self._texts):
             raise ValueError("Invalid index")
+        icon_buf = self._icons.frame(selection)
+        text = self._texts[selection]
 
         self._display.fill(0)
         self._display.text(text, int((128 - len(text) * 8) / 2), 38, 1)
         self._display.blit(icon_buf, int((128 - 32) / 2), 0)
         # draw selection indicator
-        for x in range(5):
-            self._display.rect(36 + 12 * x, 61, 2, 2, 1)
-        self._display.fill_rect(36 + 12 * selection, 60, 4, 4, 1)
+        left = 66 - 6 * len(self._texts)
+        for x in range(len(self._texts)):
+            self._display.rect(left + 12 * x, 61, 2, 2, 1)
+        self._display.fill_rect(left + 12 * selection, 60, 4, 4, 1)
+        self._display.set_update()
+
+
+class GlyphCache:
+    """Pre-rendered FrameBuffer tiles of the built-in 8x8 font, shared by all views.
+    Tiles are rendered once on first use and then only blitted, scaled tiles (2x, 3x...) are built
+    from the 8x8 ones, so a big font doesn't need any extra resource file."""
+    _instance = None
+    CHARS = "0123456789- "
+
+    def __new__(cls):
+        if not cls._instance:
+            cls._instance = super(GlyphCache, cls).__new__(cls)
+            cls._instance._tiles = {}
+        return cls._instance
+
+    def get(self, text, scale=1):
+        """Get the tile of a char or a short word (e.g. "BPM", "s") at the given scale, rendered on first use."""
+        key = (text, scale)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = self._render(text, scale)
+            self._tiles[key] = tile
+        return tile
+
+    def preload(self, scale=1):
+        """Render all the digit tiles of a scale in advance, e.g. in enter(), to keep loop() free of allocation."""
+        for char in self.CHARS:
+            self.get(char, scale)
+
+    @staticmethod
+    def _new_buffer(width, height):
+        buf = bytearray(width * ((height + 7) // 8))
+        return framebuf.FrameBuffer(buf, width, height, framebuf.MONO_VLSB)
+
+    def _render(self, text, scale):
+        width = 8 * len(text)
+        base = self._new_buffer(width, 8)
+        base.text(text, 0, 0, 1)
+        if scale == 1:
+            return base
+        tile = self._new_buffer(width * scale, 8 * scale)
+        for x in range(width):
+            for y in range(8):
+                if base.pixel(x, y):
+                    tile.fill_rect(x * scale, y * scale, scale, scale, 1)
+        return tile
+
+
+class NumberView:
+    """Fixed-width number drawn from cached glyph tiles, with an optional unit in normal size after it.
+    Only the digits that changed since the last value are redrawn, so it's cheap to update in loop()."""
+    type = "number"
+
+    def __init__(self, display, value, x, y, digits=3, scale=1, unit=""):
+        """Args:
+        value: the integer to be displayed, None to show dashes
+        x: x coordinate
+        y: y coordinate of the top of the digits, unit is aligned to the bottom
+        digits: max number of digits, the number is right aligned
+        scale: size of digits, 1: 8x8 pixels, 2: 16x16 pixels, etc.
+        unit: text shown after the digits, e.g. "BPM", "s", empty for none"""
+        self._display = display
+        self._glyph_cache = GlyphCache()
+        self._active = True
+        self._shown = ""
+        self._reinit(value, x, y, digits, scale, unit)
+
+    def set_value(self, value):
+        """Set value to be displayed, only changed digits are redrawn"""
+        if not self._active:
+            raise ValueError("Trying to set an inactive view component")
+        self._update_framebuffer(value)
+
+    def _reinit(self, value, x, y, digits=3, scale=1, unit=""):
+        self._active = True
+        self._x = x
+        self._y = y
+        self._digits = digits
+        self._scale = scale
+        self._unit = unit
+        self._cell = 8 * scale
+        self._shown = " " * digits  # blank cells, every digit differs on the first draw
+        self._glyph_cache.preload(scale)
+        self._display.fill_rect(x, y, self._cell * digits, self._cell, 0)
+        if unit:
+            self._display.blit(self._glyph_cache.get(unit), x + self._cell * digits + 2, y + self._cell - 8)
+        self._update_framebuffer(value)
+
+    def _clear(self):
+        width = self._cell * self._digits
+        if self._unit:
+            width += 2 + 8 * len(self._unit)
+        self._display.fill_rect(self._x, self._y, width, self._cell, 0)
+        self._display.set_update()
+
+    def _format(self, value):
+        if value is None:
+            text = "--"
+        else:
+            text = str(value)
+            if len(text) > self._digits:
+                text = "9" * self._digits  # clip rather than overflow into the unit
+        return " " * (self._digits - len(text)) + text
+
+    def _update_framebuffer(self, value):
+        text = self._format(value)
+        changed = False
+        for i in range(self._digits):
+            if text[i] != self._shown[i]:
+                # tiles are opaque, so blitting over the old digit also clears it
+                self._display.blit(self._glyph_cache.get(text[i], self._scale), self._x + i * self._cell, self._y)
+                changed = True
+        self._shown = text
+        if changed:
+            self._display.set_update()
+
+
+class LoadingView:
+    """Loading circle animation with a text under it, horizontally centered.
+    The animation is advanced by View.refresh() at a bounded frame rate, so a state only adds it,
+    does its work in small steps in loop(), and removes it when the work is done."""
+    type = "loading"
+
+    def __init__(self, display, text, y=20):
+        """Args:
+        text: shown under the circle, e.g. "loading", "Connecting"
+        y: y coordinate of the top of the circle, the text is 4 pixels under the circle"""
+        self._display = display
+        self._sheet = get_sprite_sheet(LOADING_CIRCLE)
+        self._reinit(text, y)
+
+    def _reinit(self, text, y=20):
+        self._active = True
+        self._text = text
+        self._y = y
+        self._text_x = (self._display.width - len(text) * 8) // 2
+        self._index = 0
+        self._display.text(text, self._text_x, y + 36, 1)
+        now = time.ticks_ms()
+        self._frame_time = time.ticks_add(now, -_LOADING_FRAME_MS)
+        self._animate(now)  # first frame at once, not one period later
+
+    def _clear(self):
+        self._display.fill_rect(48, self._y, 32, 32, 0)
+        self._display.fill_rect(self._text_x, self._y + 36, len(self._text) * 8, 8, 0)
+        self._display.set_update()
+
+    def _ms_until_frame(self, now):
+        return max(0, _LOADING_FRAME_MS - time.ticks_diff(now, self._frame_time))
+
+    def _animate(self, now):
+        if time.ticks_diff(now, self._frame_time) < _LOADING_FRAME_MS:
+            return
+        self._frame_time = now
+        self._display.blit(self._sheet.frame(self._index), 48, self._y)
+        self._index = (self._index + 1) % self._sheet.count
         self._display.set_update()
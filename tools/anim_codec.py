@@ -0,0 +1,129 @@
+"""
+Encoder/decoder of the compressed image sequence format (.hwa) used by the power-on animation.
+
+    python3 tools/anim_codec.py decode src/res/animation_power_on.hwa frames/   # one PBM per image
+    python3 tools/anim_codec.py encode frames/ src/res/animation_power_on.hwa   # PBMs in name order
+
+Format, all integers little endian:
+    header: b"HWPA", version u8 (1), image count u16
+    image:  width u8, height u8, flags u8, data length u16, data
+            data is the MONO_VLSB bytes of the image, PackBits RLE compressed.
+            flags bit 0 (DELTA): data is XOR against the previous image, which has the same size.
+PackBits: control byte c < 128 is followed by c + 1 literal bytes, c >= 128 by one byte repeated c - 126 times.
+XOR deltas of animation frames are mostly zero, so they compress to a few bytes.
+"""
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host.image import write_pbm, read_pbm, from_rows
+
+MAGIC = b"HWPA"
+VERSION = 1
+FLAG_DELTA = 1
+
+
+def pack(data):
+    out = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        run = 1
+        while i + run < n and run < 129 and data[i + run] == data[i]:
+            run += 1
+        if run >= 2:
+            out.append(run + 126)
+            out.append(data[i])
+            i += run
+            continue
+        start = i
+        while i < n and i - start < 128 and not (i + 1 < n and data[i + 1] == data[i]):
+            i += 1
+        out.append(i - start - 1)
+        out.extend(data[start:i])
+    return bytes(out)
+
+
+def unpack(data, size):
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        c = data[i]
+        i += 1
+        if c < 128:
+            out.extend(data[i:i + c + 1])
+            i += c + 1
+        else:
+            out.extend(bytes([data[i]]) * (c - 126))
+            i += 1
+    if len(out) != size:
+        raise ValueError("corrupt image data")
+    return out
+
+
+def encode(images):
+    """images: list of (width, height, MONO_VLSB bytes). Returns the file content."""
+    out = bytearray(MAGIC + struct.pack("<BH", VERSION, len(images)))
+    previous = None
+    for width, height, data in images:
+        packed = pack(data)
+        flags = 0
+        if previous is not None and previous[:2] == (width, height):
+            delta = pack(bytes(a ^ b for a, b in zip(data, previous[2])))
+            if len(delta) < len(packed):
+                packed = delta
+                flags = FLAG_DELTA
+        out.extend(struct.pack("<BBBH", width, height, flags, len(packed)))
+        out.extend(packed)
+        previous = (width, height, data)
+    return bytes(out)
+
+
+def decode(content):
+    """Returns a list of (width, height, MONO_VLSB bytes), deltas applied."""
+    if content[:4] != MAGIC or content[4] != VERSION:
+        raise ValueError("not an image sequence of version {}".format(VERSION))
+    count = struct.unpack_from("<H", content, 5)[0]
+    offset = 7
+    images = []
+    for _ in range(count):
+        width, height, flags, length = struct.unpack_from("<BBBH", content, offset)
+        offset += 5
+        data = unpack(content[offset:offset + length], width * ((height + 7) // 8))
+        offset += length
+        if flags & FLAG_DELTA:
+            data = bytearray(a ^ b for a, b in zip(data, images[-1][2]))
+        images.append((width, height, bytes(data)))
+    return images
+
+
+def main(argv):
+    if len(argv) != 3 or argv[0] not in ("encode", "decode"):
+        print(__doc__)
+        return 2
+    command, src, dst = argv
+    if command == "decode":
+        with open(src, "rb") as file:
+            images = decode(file.read())
+        os.makedirs(dst, exist_ok=True)
+        for i, (width, height, data) in enumerate(images):
+            write_pbm(os.path.join(dst, "{:03d}.pbm".format(i)), data, width, height)
+        print("{} images written to {}".format(len(images), dst))
+    else:
+        images = []
+        for name in sorted(os.listdir(src)):
+            if name.endswith(".pbm"):
+                width, height, rows = read_pbm(os.path.join(src, name))
+                images.append((width, height, bytes(from_rows(rows, width, height))))
+        content = encode(images)
+        with open(dst, "wb") as file:
+            file.write(content)
+        raw = sum(len(data) for _, _, data in images)
+        print("{} images, {} bytes raw, {} bytes encoded".format(len(images), raw, len(content)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark of screen rebuild cost of each state's enter().
+
+Run on the device from the repository root, after installation:
+    mpremote run tools/bench_enter.py
+
+Each state is entered repeatedly from an empty screen, and the time of enter() and the allocated RAM are printed.
+Every state of StateMachine.state_dict is entered, offline: the analysis states get a made-up IBI series, their work
+runs in loop() and is not measured, and network calls are queued as with the asyncio runtime, then dropped.
+States left out are listed at the end with the reason, see _skipped().
+"""
+import gc
+import time
+from src.utils import load_settings
+from src.state_machine import StateMachine
+
+REPEAT = 20
+IBI_LIST = [800, 810, 790, 805, 795, 800, 820, 780, 800, 810, 790, 800]
+
+
+def _skipped(sm):
+    """{state_code: reason} of the states not entered"""
+    return {sm.STATE_RECORD: "enter() creates a recording file"}
+
+
+def _cases(sm):
+    """(name, module, [(state_code, args), ...]), states in a case are entered in order, the last one is measured"""
+    return [
+        ("MainMenu", sm.MODULE_MENU, [(sm.STATE_MENU, None)]),
+        ("MeasureWait HR", sm.MODULE_HR, [(sm.STATE_MEASURE_WAIT, None)]),
+        ("MeasureWait HRV", sm.MODULE_HRV, [(sm.STATE_MEASURE_WAIT, None)]),
+        ("Measure HR", sm.MODULE_HR, [(sm.STATE_MEASURE_WAIT, None), (sm.STATE_MEASURE, None)]),
+        ("Measure HRV", sm.MODULE_HRV, [(sm.STATE_MEASURE_WAIT, None), (sm.STATE_MEASURE, [30])]),
+        ("ResultCheck fail", sm.MODULE_HRV, [(sm.STATE_MEASURE_RESULT_CHECK, [[800, 810]])]),
+        ("HRVAnalysis", sm.MODULE_HRV, [(sm.STATE_HRV_ANALYSIS, [IBI_LIST])]),
+        ("KubiosAnalysis", sm.MODULE_KUBIOS, [(sm.STATE_KUBIOS_ANALYSIS, [IBI_LIST])]),
+        ("ShowHistory", sm.MODULE_HISTORY, [(sm.STATE_SHOW_HISTORY, None)]),
+        ("HistoryJump", sm.MODULE_HISTORY, [(sm.STATE_HISTORY_JUMP, None)]),
+        ("ShowResult", sm.MODULE_HISTORY,
+         [(sm.STATE_SHOW_RESULT, [["Date:01.01.24", "Time:10:00:00", "HR:60BPM", "IBI:1000ms",
+                                   "RMSSD:40ms", "SDNN:50ms"]])]),
+        ("Settings", sm.MODULE_SETTINGS, [(sm.STATE_SETTINGS, None)]),
+        ("SettingsAbout", sm.MODULE_SETTINGS, [(sm.STATE_SETTINGS_ABOUT, None)]),
+        ("SettingsDebugInfo", sm.MODULE_SETTINGS, [(sm.STATE_SETTINGS_DEBUG_INFO, None)]),
+        ("SettingsWifi", sm.MODULE_SETTINGS, [(sm.STATE_SETTINGS_WIFI, None)]),
+        ("SettingsMqtt", sm.MODULE_SETTINGS, [(sm.STATE_SETTINGS_MQTT, None)]),
+    ]
+
+
+def _enter(sm, state_code, args):
+    sm.set(state_code, args)
+    sm.run()  # the first run() after set() only calls enter()
+
+
+def bench(state_machine):
+    sm = state_machine
+    sm.io_queue = []  # network calls are queued instead of run, see StateMachine.submit_io()
+    cases = _cases(sm)
+    print("state, enter us (avg), enter us (max), alloc B (avg)")
+    for name, module, steps in cases:
+        sm.set_module(module)
+        total_us = 0
+        max_us = 0
+        total_alloc = 0
+        for _ in range(REPEAT):
+            sm.view.remove_all()
+            for state_code, args in steps[:-1]:
+                _enter(sm, state_code, args)
+            state_code, args = steps[-1]
+            gc.collect()
+            alloc = gc.mem_alloc()
+            start = time.ticks_us()
+            _enter(sm, state_code, args)
+            elapsed = time.ticks_diff(time.ticks_us(), start)
+            total_alloc += gc.mem_alloc() - alloc
+            total_us += elapsed
+            max_us = max(max_us, elapsed)
+            sm.heart_sensor.stop()  # Measure starts the sensor
+            sm.io_queue.clear()
+        print("{}, {}, {}, {}".format(name, total_us // REPEAT, max_us, total_alloc // REPEAT))
+    sm.view.remove_all()
+    sm.io_queue = None
+    entered = set(state_code for _, _, steps in cases for state_code, _ in steps)
+    skipped = _skipped(sm)
+    for state_code in sorted(sm.state_dict):
+        if state_code in skipped:
+            print("skipped {}: {}".format(sm.state_dict[state_code][1], skipped[state_code]))
+        elif state_code not in entered:
+            print("skipped {}: no case".format(sm.state_dict[state_code][1]))
+
+
+if __name__ == "__main__":
+    load_settings("config.json")
+    bench(StateMachine())
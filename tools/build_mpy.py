@@ -0,0 +1,111 @@
+"""
+Build a bytecode deployment: every module in package.json compiled by mpy-cross to .mpy, so the device doesn't
+compile source on every boot, and doesn't need the compiler's working memory at import time.
+
+    pip install mpy-cross==<version of the MicroPython firmware>
+    python3 tools/build_mpy.py          # writes build/mpy/, with its own package.json
+    ./install.sh mpy                    # builds and installs it
+
+The files are the ones listed in package.json, so a new module only needs to be added there.
+main.py and src/loader.py stay source: main.py is what MicroPython runs, and src/loader.py checks the bytecode.
+Resources (.hwa, .hws, config.json) and libraries that are already .mpy are copied as they are.
+
+Version check: src/build_id.mpy holds a hash of all sources, src/bytecode.txt holds the same hash and the .mpy
+version, see src/loader.py. build_id.mpy is installed first and bytecode.txt last.
+After mip, install.sh removes the .py files of the modules installed as .mpy, MicroPython would import them first,
+and a source install removes the .mpy files and bytecode.txt of an earlier bytecode install, see remove_twins().
+
+To compare boot time and free RAM of source and bytecode deployments, copy the boot report after each one:
+    mpremote cp :boot_profile.txt boot_source.txt    # after ./install.sh and a restart
+    mpremote cp :boot_profile.txt boot_mpy.txt       # after ./install.sh mpy and a restart
+    python3 tools/compare_boot.py boot_source.txt boot_mpy.txt
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUILD_DIR = os.path.join(REPO_ROOT, "build", "mpy")
+URL_ROOT = "http://localhost:8000/"
+KEEP_SOURCE = ("main.py", "src/loader.py")
+BUILD_ID_MODULE = "src/build_id.mpy"
+STAMP_FILE = "src/bytecode.txt"
+
+
+def find_mpy_cross():
+    """Return the command of mpy-cross, the executable on PATH or the pip package."""
+    if shutil.which("mpy-cross"):
+        return ["mpy-cross"]
+    try:
+        import mpy_cross  # noqa: F401
+    except ImportError:
+        raise SystemExit("mpy-cross not found, install it with: pip install mpy-cross")
+    return [sys.executable, "-m", "mpy_cross"]
+
+
+def compile_file(mpy_cross, src, dst, source_name):
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    # -s: the name in tracebacks, the path on the device rather than of the build machine
+    subprocess.run(mpy_cross + ["-s", source_name, "-o", dst, src], check=True)
+
+
+def mpy_version(path):
+    """Version byte of the .mpy header: b"M", version, flags..."""
+    with open(path, "rb") as file:
+        header = file.read(2)
+    if header[:1] != b"M":
+        raise ValueError("not an .mpy file: " + path)
+    return header[1]
+
+
+def build():
+    with open(os.path.join(REPO_ROOT, "package.json")) as file:
+        package = json.load(file)
+    mpy_cross = find_mpy_cross()
+    shutil.rmtree(BUILD_DIR, ignore_errors=True)
+
+    files = []  # device paths, same as the paths in the build directory
+    sources = hashlib.sha1()
+    source_size = 0
+    mpy_size = 0
+    for dest, url in package["urls"]:
+        src = os.path.join(REPO_ROOT, url[len(URL_ROOT):])
+        with open(src, "rb") as file:
+            sources.update(dest.encode() + file.read())
+        if dest.endswith(".py") and dest not in KEEP_SOURCE:
+            dest = dest[:-3] + ".mpy"
+            compile_file(mpy_cross, src, os.path.join(BUILD_DIR, dest), dest[:-4] + ".py")
+            source_size += os.path.getsize(src)
+            mpy_size += os.path.getsize(os.path.join(BUILD_DIR, dest))
+        else:
+            os.makedirs(os.path.dirname(os.path.join(BUILD_DIR, dest)), exist_ok=True)
+            shutil.copyfile(src, os.path.join(BUILD_DIR, dest))
+        files.append(dest)
+
+    build_id = sources.hexdigest()[:12]
+    with tempfile.TemporaryDirectory() as tmp:
+        build_id_src = os.path.join(tmp, "build_id.py")
+        with open(build_id_src, "w") as file:
+            file.write("BUILD_ID = \"{}\"\n".format(build_id))
+        compile_file(mpy_cross, build_id_src, os.path.join(BUILD_DIR, BUILD_ID_MODULE), "src/build_id.py")
+    version = mpy_version(os.path.join(BUILD_DIR, BUILD_ID_MODULE))
+    with open(os.path.join(BUILD_DIR, STAMP_FILE), "w") as file:
+        file.write("{},{}\n".format(build_id, version))
+
+    # mip installs in list order: build id first, stamp last, see src/loader.py
+    order = [BUILD_ID_MODULE] + files + [STAMP_FILE]
+    url_root = URL_ROOT + "build/mpy/"
+    package["urls"] = [[dest, url_root + dest] for dest in order]
+    with open(os.path.join(BUILD_DIR, "package.json"), "w") as file:
+        json.dump(package, file, indent=2)
+
+    print("build {}, mpy v{}: {} B source -> {} B bytecode, in {}".format(
+        build_id, version, source_size, mpy_size, os.path.relpath(BUILD_DIR, REPO_ROOT)))
+
+
+if __name__ == "__main__":
+    build()
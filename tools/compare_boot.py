@@ -0,0 +1,39 @@
+"""
+Compare two boot reports (boot_profile.txt written by src/boot.py), e.g. of a source and a bytecode deployment:
+
+    python3 tools/compare_boot.py boot_source.txt boot_mpy.txt
+
+Prints the time and the free RAM after each phase side by side, with the difference (second - first).
+"""
+import sys
+
+
+def load(path):
+    profile = {}
+    order = []
+    with open(path) as file:
+        for line in file:
+            name, us, free = line.strip().split(",")
+            profile[name] = (int(us), int(free))
+            order.append(name)
+    return order, profile
+
+
+def main(argv):
+    if len(argv) != 2:
+        print(__doc__)
+        return 2
+    order_a, a = load(argv[0])
+    order_b, b = load(argv[1])
+    names = order_a + [name for name in order_b if name not in a]
+    print("{:<22}{:>9}{:>9}{:>9}   {:>9}{:>9}{:>9}".format("phase", "ms A", "ms B", "diff", "KB A", "KB B", "diff"))
+    for name in names:
+        us_a, free_a = a.get(name, (0, 0))
+        us_b, free_b = b.get(name, (0, 0))
+        print("{:<22}{:>9.1f}{:>9.1f}{:>+9.1f}   {:>9.1f}{:>9.1f}{:>+9.1f}".format(
+            name, us_a / 1000, us_b / 1000, (us_b - us_a) / 1000, free_a / 1024, free_b / 1024, (free_b - free_a) / 1024))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""
+Encoder/decoder of sprite sheets (.hws): frames of the same size in one file, read one by one on the device.
+
+    python3 tools/sprite_sheet.py decode src/res/icons.hws icons/   # one PBM per frame
+    python3 tools/sprite_sheet.py encode icons/ src/res/icons.hws   # PBMs in name order, all the same size
+
+Format: header b"HWPS", version u8 (1), width u8, height u8, frame count u8,
+then the MONO_VLSB bytes of each frame, uncompressed so a frame is one seek() and readinto() away.
+"""
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from host.image import write_pbm, read_pbm, from_rows
+
+MAGIC = b"HWPS"
+VERSION = 1
+
+
+def encode(width, height, frames):
+    size = width * ((height + 7) // 8)
+    if any(len(frame) != size for frame in frames):
+        raise ValueError("all frames must be {}x{}".format(width, height))
+    return MAGIC + struct.pack("<BBBB", VERSION, width, height, len(frames)) + b"".join(bytes(f) for f in frames)
+
+
+def decode(content):
+    """Returns (width, height, frames)."""
+    if content[:4] != MAGIC or content[4] != VERSION:
+        raise ValueError("not a sprite sheet of version {}".format(VERSION))
+    width, height, count = content[5], content[6], content[7]
+    size = width * ((height + 7) // 8)
+    frames = [content[8 + i * size:8 + (i + 1) * size] for i in range(count)]
+    return width, height, frames
+
+
+def main(argv):
+    if len(argv) != 3 or argv[0] not in ("encode", "decode"):
+        print(__doc__)
+        return 2
+    command, src, dst = argv
+    if command == "decode":
+        with open(src, "rb") as file:
+            width, height, frames = decode(file.read())
+        os.makedirs(dst, exist_ok=True)
+        for i, frame in enumerate(frames):
+            write_pbm(os.path.join(dst, "{:03d}.pbm".format(i)), frame, width, height)
+        print("{} frames of {}x{} written to {}".format(len(frames), width, height, dst))
+    else:
+        frames = []
+        size = None
+        for name in sorted(os.listdir(src)):
+            if name.endswith(".pbm"):
+                width, height, rows = read_pbm(os.path.join(src, name))
+                if size not in (None, (width, height)):
+                    raise ValueError(name + " has a different size")
+                size = (width, height)
+                frames.append(from_rows(rows, width, height))
+        with open(dst, "wb") as file:
+            file.write(encode(size[0], size[1], frames))
+        print("{} frames of {}x{} written to {}".format(len(frames), size[0], size[1], dst))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))